@@ -0,0 +1,182 @@
+"""
+Benchmark: E-Mail-Entschleierung (ein Durchlauf vs. ~40 re.sub)
+
+Vergleicht EmailScraper.decode_obfuscated_emails mit der bisherigen
+Implementierung (unten als legacy_decode konserviert):
+- Äquivalenz auf allen Verschleierungs-Varianten (Schreibweisen, Abstände)
+  und auf dem Text aller Fixture-Seiten
+- Laufzeit pro Seite für decode_obfuscated_emails und extract_emails_advanced
+  (langes Dokument: alle Fixture-Seiten aneinandergehängt)
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_deobfuscation.py [--repeat 20]
+"""
+import argparse
+import html
+import itertools
+import logging
+import os
+import re
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from bench_parser import load_pages, FIXTURES_DIR  # noqa: E402
+from email_scraper import EmailScraper  # noqa: E402
+from html_document import parse_html  # noqa: E402
+
+
+# ===== BISHERIGE IMPLEMENTIERUNG (Referenz) =====
+
+def legacy_decode(text):
+    if not text:
+        return text
+    text = html.unescape(text)
+    text = text.replace('%40', '@').replace('%2E', '.')
+    at_replacements = [
+        r'\s*\(at\)\s*', r'\s*\[at\]\s*', r'\s*\{at\}\s*',
+        r'\s*_at_\s*', r'\s*-at-\s*', r'\s+at\s+', r'\s*/at/\s*',
+        r'\s*\(ät\)\s*', r'\s*\[ät\]\s*', r'\s+ät\s+',
+        r'\s*\(AT\)\s*', r'\s*\[AT\]\s*', r'\s*\{AT\}\s*',
+        r'\s*_AT_\s*', r'\s*-AT-\s*', r'\s+AT\s+',
+        r'&#64;', r'&#x40;',
+    ]
+    for pattern in at_replacements:
+        text = re.sub(pattern, '@', text, flags=re.IGNORECASE)
+    dot_replacements = [
+        r'\s*\(punkt\)\s*', r'\s*\[punkt\]\s*', r'\s*\{punkt\}\s*',
+        r'\s*_punkt_\s*', r'\s*-punkt-\s*', r'\s+punkt\s+',
+        r'\s*\(dot\)\s*', r'\s*\[dot\]\s*', r'\s*\{dot\}\s*',
+        r'\s*_dot_\s*', r'\s*-dot-\s*', r'\s+dot\s+', r'\s*/dot/\s*',
+        r'\s*\(\.\)\s*', r'\s*\[\.\]\s*',
+        r'&#46;', r'&#x2E;',
+    ]
+    for pattern in dot_replacements:
+        text = re.sub(pattern, '.', text, flags=re.IGNORECASE)
+    return text
+
+
+# ===== TESTFÄLLE =====
+
+AT_TOKENS = ['(at)', '[at]', '{at}', '_at_', '-at-', 'at', '/at/', '(ät)', '[ät]', 'ät', '@', '&#64;', '&amp;#64;', '%40']
+DOT_TOKENS = ['(punkt)', '[punkt]', '{punkt}', '_punkt_', '-punkt-', 'punkt', '(dot)', '[dot]', '{dot}',
+              '_dot_', '-dot-', 'dot', '/dot/', '(.)', '[.]', '.', '&#46;', '&amp;#x2E;', '%2E']
+SPACINGS = ['', ' ', '  ', '\n', ' \t ']
+
+
+def case_variants(token: str):
+    return {token, token.upper(), token.capitalize()}
+
+
+def generate_cases():
+    """Alle Kombinationen aus @-Variante × Punkt-Variante × Abstand × Schreibweise"""
+    cases = []
+    for at, dot, space in itertools.product(AT_TOKENS, DOT_TOKENS, SPACINGS):
+        for at_case, dot_case in itertools.product(case_variants(at), case_variants(dot)):
+            cases.append(f"Kontakt: info{space}{at_case}{space}firma{space}{dot_case}{space}de Tel. 089")
+    # Wörter, die die Schlüsselwörter enthalten, dürfen nicht ersetzt werden
+    cases += ["Daten at home", "Startpunkt dotierte Kategorie", "Katze (atmet) [dotter]", "a at at b"]
+    return cases
+
+
+# Bekannte Abweichungen: direkt benachbarte Varianten, die sich ein Leerzeichen
+# teilen. Alt hing von der Reihenfolge der re.sub ab, neu gilt links-vor-rechts.
+# Keine davon ergibt eine gültige E-Mail-Adresse.
+KNOWN_DIVERGENCES = ["x punkt at y", "mail at (at) firma punkt punkt de"]
+
+
+def time_per_item(func, items, repeat: int) -> float:
+    """Median-Laufzeit pro Element in ms"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        samples.append((time.perf_counter() - start) / len(items) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=20, help='Wiederholungen pro Messung')
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    scraper = EmailScraper(use_selenium=False)
+    pages = load_pages(FIXTURES_DIR)
+    texts = [parse_html(page).get_text(separator=' ', strip=True) for page in pages.values()]
+
+    # Äquivalenz
+    cases = generate_cases() + texts
+    mismatches = [(case, legacy_decode(case), scraper.decode_obfuscated_emails(case))
+                  for case in cases if legacy_decode(case) != scraper.decode_obfuscated_emails(case)]
+    print(f"Äquivalenz: {len(cases) - len(mismatches)}/{len(cases)} Eingaben identisch")
+    for case, expected, actual in mismatches[:10]:
+        print(f"  ⚠️ {case!r}: alt={expected!r} neu={actual!r}")
+    for case in KNOWN_DIVERGENCES:
+        print(f"  (bekannt) {case!r}: alt={legacy_decode(case)!r} neu={scraper.decode_obfuscated_emails(case)!r}")
+
+    # Laufzeit: einzelne Seiten und ein langes Dokument
+    long_text = ' '.join(texts * 10)
+    long_html = '\n'.join(list(pages.values()) * 10)
+    print(f"\n{'Messung':<38} {'alt ms':>10} {'neu ms':>10} {'Speedup':>8}")
+    for label, old, new, items in [
+        ('decode (Seitentext)', legacy_decode, scraper.decode_obfuscated_emails, texts),
+        (f'decode (langer Text, {len(long_text) // 1024} KB)', legacy_decode,
+         scraper.decode_obfuscated_emails, [long_text]),
+    ]:
+        old_ms, new_ms = time_per_item(old, items, args.repeat), time_per_item(new, items, args.repeat)
+        print(f"{label:<38} {old_ms:>10.3f} {new_ms:>10.3f} {old_ms / new_ms:>7.1f}x")
+
+    extract_repeat = max(1, args.repeat // 5)
+    old_ms = time_per_item(lambda page: legacy_extract(scraper, page), [long_html], extract_repeat)
+    new_ms = time_per_item(scraper.extract_emails_advanced, [long_html], extract_repeat)
+    print(f"{'extract_emails_advanced (lange Seite)':<38} {old_ms:>10.1f} {new_ms:>10.1f} {old_ms / new_ms:>7.1f}x")
+
+    # Gleiche E-Mails pro Fixture-Seite wie mit der alten Entschleierung + allen Text-Knoten?
+    differing = 0
+    for name, page in pages.items():
+        new_emails = set(scraper.extract_emails_advanced(page))
+        old_emails = legacy_extract(scraper, page)
+        if new_emails != old_emails:
+            differing += 1
+            print(f"  ⚠️ {name}: alt={sorted(old_emails)} neu={sorted(new_emails)}")
+    print(f"E-Mails identisch: {len(pages) - differing}/{len(pages)} Seiten")
+    return 1 if mismatches or differing else 0
+
+
+def legacy_extract(scraper: EmailScraper, page: str) -> set:
+    """
+    extract_emails_advanced mit alter Entschleierung und Schritt 5 über ALLE Text-Knoten
+
+    Die Zeitmessung enthält einen zusätzlichen Parse (~1/4 der Laufzeit) - der
+    Speedup ist daher etwas zu hoch angesetzt.
+    """
+    original = scraper.decode_obfuscated_emails
+    scraper.decode_obfuscated_emails = legacy_decode
+    try:
+        emails = set(scraper.extract_emails_advanced(page))
+        soup = parse_html(page, scraper.html_parser)
+        for script in soup(["script", "style"]):
+            script.decompose()
+        for node in soup.find_all(string=lambda t: isinstance(t, str)):
+            decoded = legacy_decode(str(node))
+            for pattern in scraper.email_patterns:
+                for match in pattern.findall(decoded):
+                    email = match[0] if isinstance(match, tuple) else match
+                    if scraper.validate_email(email):
+                        email = email.lower().strip()
+                        if not any(spam in email for spam in scraper.spam_keywords):
+                            emails.add(email)
+        return emails
+    finally:
+        scraper.decode_obfuscated_emails = original
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Benchmark: API-Namensextraktion einzeln vs. gebündelt (LLMBatcher)
+
+Mehrere Threads rufen ImpressumScraperUltimate._api_extract_name für die
+Texte der Fixture-Seiten auf - wie die Worker von scrape_multiple, wenn
+Regex/JSON-LD nichts finden (16 Aufrufer ≈ Seiten in der Pipeline bei 8
+Workern). Gemessen gegen den Fake-LLM-Server (Latenz und Limit paralleler
+Requests wie bei einer echten API, die "Antwort" liefert die Regex-Stufe
+des Scrapers):
+- Gesamtdauer und Anzahl API-Requests, ohne und mit Batching
+- gleiche Namen in beiden Modi (Abweichungen möglich: der Batch-Prompt
+  enthält pro Seite nur den Impressum-Bereich)
+- mit --garble: unlesbare Batch-Antworten/Einträge → Einzel-Fallback
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_llm_batching.py [--texts 64] [--threads 16] [--latency 1.0] [--api-concurrency 4] [--garble 0.2]
+"""
+import argparse
+import itertools
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from bench_names import regex_name  # noqa: E402
+from bench_parser import load_pages, make_scraper, FIXTURES_DIR  # noqa: E402
+from fake_llm_server import FakeLLMServer  # noqa: E402
+
+SECTION_PATTERN = re.compile(r'TEXT(?: \d+)?:\n---\n(.*?)\n---', re.S)
+
+
+class FakeNameModel:
+    """Beantwortet Einzel- und Batch-Prompts der Namensextraktion mit der Regex-Stufe"""
+
+    def __init__(self, scraper, garble: float = 0.0, seed: int = 1):
+        self.scraper = scraper
+        self.garble = garble
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _roll(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.garble
+
+    def name(self, text: str):
+        found = regex_name(self.scraper, text)
+        return f"{found[0]} {found[1]}" if found else None
+
+    def __call__(self, messages, max_tokens) -> str:
+        prompt = messages[-1]['content']
+        sections = SECTION_PATTERN.findall(prompt)
+        if 'JSON-Liste' not in prompt:
+            return self.name(sections[0]) or 'NICHT_GEFUNDEN'
+
+        if self._roll():
+            return 'Entschuldigung, hier die Namen: Max Mustermann, ...'
+        answers = [self.name(section) for section in sections]
+        answers = [42 if self._roll() else answer for answer in answers]
+        return '```json\n' + str(answers).replace("'", '"').replace('None', 'null') + '\n```'
+
+
+def run(scraper, texts, threads: int, batch_size: int, server: FakeLLMServer):
+    """Extrahiert alle Texte mit threads Threads, liefert (Namen, Dauer, Requests, Stats)"""
+    scraper.api_batch_size = batch_size
+    requests_before = server.requests
+    start = time.perf_counter()
+    with scraper.api_batching():
+        batcher = scraper._name_batcher
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            names = list(executor.map(lambda text: scraper._api_extract_name(text)[:2], texts))
+    elapsed = time.perf_counter() - start
+    return names, elapsed, server.requests - requests_before, batcher.stats if batcher else None
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--texts', type=int, default=64, help='Anzahl Texte (Fixture-Seiten wiederholt)')
+    arg_parser.add_argument('--threads', type=int, default=16, help='Parallele Aufrufer')
+    arg_parser.add_argument('--batch-size', type=int, default=8, help='api_batch_size im Batch-Modus')
+    arg_parser.add_argument('--batch-wait', type=float, default=0.5, help='api_batch_wait (Sekunden)')
+    arg_parser.add_argument('--latency', type=float, default=1.0, help='Grundlatenz pro API-Request (Sekunden)')
+    arg_parser.add_argument('--api-concurrency', type=int, default=4,
+                            help='Max. parallele Requests beim Fake-Anbieter (0 = unbegrenzt)')
+    arg_parser.add_argument('--garble', type=float, default=0.0,
+                            help='Anteil unlesbarer Batch-Antworten/Einträge (Fallback-Test)')
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    scraper = make_scraper('html.parser')
+    pages = load_pages(FIXTURES_DIR)
+    page_texts = [scraper.extract_clean_text(scraper.document(page)) for page in pages.values()]
+    texts = list(itertools.islice(itertools.cycle(page_texts), args.texts))
+
+    with FakeLLMServer(FakeNameModel(scraper, args.garble), latency=args.latency,
+                       concurrency=args.api_concurrency) as server:
+        scraper.api_enabled = True
+        scraper.api_key = 'bench'
+        scraper.api_base_url = server.base_url
+        scraper.api_model = 'fake'
+        scraper.api_batch_wait = args.batch_wait
+
+        print(f"{len(texts)} Texte, {args.threads} Threads, Latenz {args.latency}s pro Request, "
+              f"max. {args.api_concurrency or '∞'} parallel\n")
+        print(f"{'Modus':<22} {'Dauer s':>9} {'Requests':>9} {'Prompt KB':>10}")
+        single_names, single_s, single_requests, _ = run(scraper, texts, args.threads, 1, server)
+        chars_before = server.prompt_chars
+        print(f"{'einzeln':<22} {single_s:>9.2f} {single_requests:>9} {chars_before / 1024:>10.0f}")
+        batch_names, batch_s, batch_requests, stats = run(scraper, texts, args.threads, args.batch_size, server)
+        print(f"{f'Batches à {args.batch_size}':<22} {batch_s:>9.2f} {batch_requests:>9} "
+              f"{(server.prompt_chars - chars_before) / 1024:>10.0f}")
+
+    print(f"\nSpeedup: {single_s / batch_s:.1f}x, Requests: {single_requests / max(1, batch_requests):.1f}x weniger")
+    print(f"Batches: {stats.batches} (Ø {stats.avg_batch_size:.1f} Texte), einzeln: {stats.single_calls}, "
+          f"Einzel-Fallbacks: {stats.fallbacks}")
+
+    differing = [(text[:60], a, b) for text, a, b in zip(texts, single_names, batch_names) if a != b]
+    print(f"Namen identisch: {len(texts) - len(differing)}/{len(texts)} (Rest: Treffer außerhalb des Impressum-Bereichs)")
+    for text, a, b in differing[:10]:
+        print(f"  ⚠️ {text!r}: einzeln={a} batch={b}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
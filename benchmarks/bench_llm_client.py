@@ -0,0 +1,116 @@
+"""
+Benchmark: LLM-Requests mit neuer Verbindung pro Aufruf vs. gemeinsamer LLMClient
+
+Misst den Overhead pro Chat-Completion-Request gegen den Fake-LLM-Server
+über HTTPS (selbstsigniertes Zertifikat, ohne Server-Latenz):
+- bisher: requests.post pro Aufruf (TCP + TLS-Handshake jedes Mal)
+- neu: LLMClient mit Keep-Alive-Pool (Handshake nur beim ersten Request)
+jeweils sequentiell und mit mehreren Threads.
+
+Benötigt das openssl-Kommandozeilenwerkzeug (sonst: --http).
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_llm_client.py [--requests 200] [--threads 8] [--http]
+"""
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from llm_client import LLMClient  # noqa: E402
+from fake_llm_server import FakeLLMServer  # noqa: E402
+
+PAYLOAD = {
+    'model': 'fake',
+    'messages': [{'role': 'system', 'content': 'Antworte kurz.'},
+                 {'role': 'user', 'content': 'Schreibe ein Kompliment für die Bäckerei Müller.'}],
+    'max_tokens': 50,
+    'temperature': 0.7,
+}
+
+
+def make_certificate(directory: str):
+    """Selbstsigniertes Zertifikat für 127.0.0.1 (cert, key)"""
+    cert, key = os.path.join(directory, 'cert.pem'), os.path.join(directory, 'key.pem')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                    '-keyout', key, '-out', cert, '-subj', '/CN=127.0.0.1',
+                    '-addext', 'subjectAltName=IP:127.0.0.1'],
+                   check=True, capture_output=True)
+    return cert, key
+
+
+def legacy_call(base_url: str):
+    """Bisheriger Aufruf: requests.post ohne Session"""
+    response = requests.post(f"{base_url}/chat/completions",
+                             headers={'Authorization': 'Bearer bench', 'Content-Type': 'application/json'},
+                             json=PAYLOAD, timeout=45)
+    response.raise_for_status()
+    return response.json()
+
+
+def measure(call, count: int, threads: int):
+    """Liefert (Median ms pro Request, Requests/s)"""
+    samples = []
+
+    def timed(_):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    if threads <= 1:
+        for idx in range(count):
+            timed(idx)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(timed, range(count)))
+    return statistics.median(samples), count / (time.perf_counter() - start)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--requests', type=int, default=200, help='Requests pro Messung')
+    arg_parser.add_argument('--threads', type=int, default=8, help='Threads im parallelen Lauf')
+    arg_parser.add_argument('--http', action='store_true', help='Ohne TLS messen')
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory(prefix='leadtool-bench-') as tmp:
+        cert = key = None
+        if not args.http:
+            cert, key = make_certificate(tmp)
+            # requests.post und die Session des LLMClient vertrauen dem Zertifikat
+            os.environ['REQUESTS_CA_BUNDLE'] = cert
+
+        with FakeLLMServer(lambda messages, max_tokens: 'Tolle Brötchen!', latency=0.0, token_latency=0.0,
+                           tls_cert=cert, tls_key=key) as server:
+            client = LLMClient(max_connections=args.threads)
+            base_url = server.base_url
+            pooled = lambda: client.chat_completion(base_url, 'bench', PAYLOAD)  # noqa: E731
+            legacy = lambda: legacy_call(base_url)  # noqa: E731
+
+            print(f"{args.requests} Requests an {base_url} (Backend: {client.backend})\n")
+            print(f"{'Messung':<28} {'bisher ms':>10} {'Pool ms':>10} {'bisher/s':>9} {'Pool/s':>9} {'Speedup':>8}")
+            for label, threads in [('sequentiell', 1), (f'{args.threads} Threads', args.threads)]:
+                old_ms, old_rate = measure(legacy, args.requests, threads)
+                new_ms, new_rate = measure(pooled, args.requests, threads)
+                print(f"{label:<28} {old_ms:>10.2f} {new_ms:>10.2f} {old_rate:>9.0f} {new_rate:>9.0f} "
+                      f"{new_rate / old_rate:>7.1f}x")
+            client.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
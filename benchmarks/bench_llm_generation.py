@@ -0,0 +1,151 @@
+"""
+Benchmark: ComplimentGenerator.generate_for_companies sequentiell vs. parallel
+
+Generiert Texte für synthetische Companies gegen den Fake-LLM-Server und
+berichtet pro Modus:
+- Dauer, Companies/s und erreichte Requests pro Minute
+- Wartezeit durch das RPM/TPM-Budget (--rpm / --tpm)
+- Zuordnung: jede Company hat ihren eigenen Text, progress_callback lief
+  für jede Company genau einmal
+- mit --duplicates: LLM-Response-Cache - Duplikate in einem Lauf und ein
+  zweiter Lauf mit unveränderten Prompts (API-Requests, Cache-Treffer)
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_llm_generation.py [--companies 64] [--concurrency 8] [--latency 1.0] [--rpm 300] [--duplicates 0.25]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from compliment_generator import ComplimentGenerator  # noqa: E402
+from llm_rate_limiter import LLMRateLimiter  # noqa: E402
+from fake_llm_server import FakeLLMServer  # noqa: E402
+
+PROMPT = ("Schreibe ein kurzes Kompliment für {name} in {city}: {rating} Sterne, "
+          "Keywords: {review_keywords}. Anrede: {anrede_mit_name}")
+
+
+class BenchCompany:
+    """Minimales Company-Objekt mit den Feldern, die _build_placeholders liest"""
+
+    def __init__(self, idx: int, duplicate_of: int = None):
+        # Duplikate übernehmen alle Felder ihres Originals (gleicher Prompt)
+        idx = idx if duplicate_of is None else duplicate_of
+        self.name = f"Firma {idx:04d} GmbH"
+        self.website = f"https://firma{idx:04d}.de"
+        self.first_name = "Max"
+        self.last_name = f"Muster{idx}"
+        self.rating = 4.0 + (idx % 10) / 10
+        self.review_count = 10 + idx
+        self.review_keywords = "freundlich, schnell, kompetent"
+        self.main_category = "Handwerk"
+        self.city = "München"
+        self.compliment = None
+        self.attributes = {}
+
+
+def answer(messages, max_tokens) -> str:
+    """Antwort enthält den Firmennamen - so lässt sich die Zuordnung prüfen"""
+    prompt = messages[-1]['content']
+    name = prompt.split('Kompliment für ', 1)[1].split(' in ', 1)[0]
+    return f"Liebe {name}, Ihre Bewertungen sprechen für sich - weiter so!"
+
+
+def run(generator, companies, concurrency: int):
+    """Liefert (Dauer, Stats, Progress-Aufrufe)"""
+    calls = []
+    start = time.perf_counter()
+    stats = generator.generate_for_companies(
+        companies, PROMPT, progress_callback=lambda current, total, name: calls.append(name),
+        max_concurrency=concurrency,
+    )
+    return time.perf_counter() - start, stats, calls
+
+
+def run_cache(server, tmp: str, args) -> bool:
+    """Zwei Läufe mit Response-Cache: kalt (mit Duplikaten) und Wiederholung"""
+    generator = ComplimentGenerator(api_config_file=os.path.join(tmp, 'no_api_config.json'),
+                                    cache_path=os.path.join(tmp, 'llm_cache.db'))
+    generator.api_enabled = True
+    generator.api_key = 'bench'
+    generator.api_base_url = server.base_url
+
+    unique = max(1, round(args.companies * (1 - args.duplicates)))
+    print(f"\nLLM-Response-Cache: {args.companies} Companies, davon {args.companies - unique} Duplikate")
+    print(f"{'Lauf':<16} {'Dauer s':>9} {'API-Requests':>13} {'aus Cache':>10}")
+    ok = True
+    for label in ['kalt', 'Wiederholung']:
+        companies = [BenchCompany(idx, idx % unique) for idx in range(args.companies)]
+        requests_before = server.requests
+        elapsed, stats, calls = run(generator, companies, args.concurrency)
+        requests = server.requests - requests_before
+        print(f"{label:<16} {elapsed:>9.2f} {requests:>13} {stats['cached']:>10}")
+        expected_requests = unique if label == 'kalt' else 0
+        if stats['success'] != len(companies) or requests != expected_requests:
+            ok = False
+            print(f"  ⚠️ erwartet {expected_requests} API-Requests: {stats}")
+    cache = generator.response_cache
+    print(f"Cache: Trefferquote {cache.hit_rate:.0%}, {cache.stats['tokens_saved']} Tokens gespart")
+    return ok
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--companies', type=int, default=64, help='Anzahl Companies')
+    arg_parser.add_argument('--concurrency', type=int, default=8, help='Parallele Requests im Parallel-Modus')
+    arg_parser.add_argument('--latency', type=float, default=1.0, help='Grundlatenz pro API-Request (Sekunden)')
+    arg_parser.add_argument('--rpm', type=float, default=None, help='Requests-pro-Minute-Budget')
+    arg_parser.add_argument('--tpm', type=float, default=None, help='Tokens-pro-Minute-Budget')
+    arg_parser.add_argument('--duplicates', type=float, default=None,
+                            help='Cache-Lauf: Anteil doppelter Companies (z.B. 0.25)')
+    arg_parser.add_argument('--skip-sequential', action='store_true', help='Sequentiellen Lauf auslassen')
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory(prefix='leadtool-bench-') as tmp, \
+            FakeLLMServer(answer, latency=args.latency) as server:
+        generator = ComplimentGenerator(api_config_file=os.path.join(tmp, 'no_api_config.json'), cache_path=None)
+        generator.api_enabled = True
+        generator.api_key = 'bench'
+        generator.api_base_url = server.base_url
+
+        print(f"{args.companies} Companies, Latenz {args.latency}s pro Request, "
+              f"Budget: {args.rpm or '∞'} RPM / {args.tpm or '∞'} TPM\n")
+        print(f"{'Modus':<16} {'Dauer s':>9} {'Companies/s':>12} {'Req/min':>9} {'Budget-Wartezeit s':>19}")
+
+        ok = True
+        modes = [('parallel', args.concurrency)] if args.skip_sequential else [('sequentiell', 1),
+                                                                              ('parallel', args.concurrency)]
+        durations = {}
+        for label, concurrency in modes:
+            generator.rate_limiter = LLMRateLimiter(rpm=args.rpm, tpm=args.tpm)
+            companies = [BenchCompany(idx) for idx in range(args.companies)]
+            elapsed, stats, calls = run(generator, companies, concurrency)
+            durations[label] = elapsed
+            print(f"{f'{label} ({concurrency})':<16} {elapsed:>9.2f} {len(companies) / elapsed:>12.1f} "
+                  f"{len(companies) / elapsed * 60:>9.0f} {generator.rate_limiter.stats()['wait_total']:>19.1f}")
+
+            mismatched = [c.name for c in companies if not c.compliment or c.name not in c.compliment]
+            if mismatched or stats['success'] != len(companies) or sorted(calls) != sorted(c.name for c in companies):
+                ok = False
+                print(f"  ⚠️ Zuordnung/Progress fehlerhaft: {stats}, falsch zugeordnet: {mismatched[:5]}")
+
+        if args.duplicates is not None:
+            ok = run_cache(server, tmp, args) and ok
+
+    if len(durations) == 2:
+        print(f"\nSpeedup: {durations['sequentiell'] / durations['parallel']:.1f}x")
+    print(f"Zuordnung + Progress: {'OK' if ok else 'FEHLER'}")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Benchmark: Bulk-Generierung gegen einen drosselnden Anbieter (429/503)
+
+Der Fake-LLM-Server lehnt ab reject_over gleichzeitigen Requests mit 429 +
+Retry-After ab und antwortet zufällig mit 503 (--error-rate). Zwei
+ComplimentGenerator aus derselben api_config.json teilen sich einen Limiter.
+Gemessen wird generate_for_companies mit mehr Parallelität als erlaubt:
+- ohne Wiederholungen (max_retries=0): Fehler in den Stats
+- mit Wiederholungen + Drosselung: alle Companies erfolgreich, Anzahl 429,
+  Concurrency-Limit des Limiters am Ende, Spitze gleichzeitiger Requests
+- wie oben, aber 429 ohne Retry-After (nur Backoff mit Jitter)
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_llm_retry.py [--companies 64] [--concurrency 16] [--reject-over 4] [--error-rate 0.05]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from compliment_generator import ComplimentGenerator  # noqa: E402
+from llm_client import RetryPolicy  # noqa: E402
+from bench_llm_generation import BenchCompany, answer, run  # noqa: E402
+from fake_llm_server import FakeLLMServer  # noqa: E402
+
+
+def write_config(path: str, base_url: str):
+    """api_config.json mit einem aktiven Anbieter (dem Fake-Server)"""
+    config = {
+        'active_api': 'fake',
+        'apis': {'fake': {'name': 'Fake', 'base_url': base_url, 'default_model': 'fake',
+                          'api_key': 'bench', 'enabled': True}},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--companies', type=int, default=64, help='Anzahl Companies')
+    arg_parser.add_argument('--concurrency', type=int, default=16, help='max_concurrency der Generierung')
+    arg_parser.add_argument('--latency', type=float, default=0.3, help='Grundlatenz pro API-Request (Sekunden)')
+    arg_parser.add_argument('--reject-over', type=int, default=4, help='429 ab so vielen gleichzeitigen Requests')
+    arg_parser.add_argument('--retry-after', type=float, default=0.5, help='Retry-After der 429-Antworten')
+    arg_parser.add_argument('--error-rate', type=float, default=0.05, help='Anteil zufälliger 503')
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    ok = True
+    with tempfile.TemporaryDirectory(prefix='leadtool-bench-') as tmp:
+        print(f"{args.companies} Companies, {args.concurrency} parallel, Anbieter erlaubt {args.reject_over} "
+              f"gleichzeitig, {args.error_rate:.0%} 503\n")
+        print(f"{'Modus':<26} {'Dauer s':>8} {'Erfolg':>7} {'Fehler':>7} {'429':>5} {'503':>5} "
+              f"{'Limit':>6} {'Spitze':>7}")
+
+        modes = [('ohne Retry', 0, args.retry_after),
+                 ('Retry + Drosselung', 6, args.retry_after),
+                 ('Retry ohne Retry-After', 6, None)]
+        for idx, (label, max_retries, retry_after) in enumerate(modes):
+            with FakeLLMServer(answer, latency=args.latency, reject_over=args.reject_over,
+                               retry_after=retry_after, error_rate=args.error_rate) as server:
+                config_path = os.path.join(tmp, f'api_config_{idx}.json')
+                write_config(config_path, server.base_url)
+                generator = ComplimentGenerator(api_config_file=config_path, cache_path=None)
+                other = ComplimentGenerator(api_config_file=config_path, cache_path=None)
+                if generator.rate_limiter is not other.rate_limiter:
+                    ok = False
+                    print("  ⚠️ Generatoren teilen sich keinen Limiter")
+
+                generator.retry_policy = RetryPolicy(max_retries=max_retries, base_delay=0.2)
+                companies = [BenchCompany(idx) for idx in range(args.companies)]
+                elapsed, stats, _ = run(generator, companies, args.concurrency)
+                limiter = generator.rate_limiter.stats()
+                print(f"{label:<26} {elapsed:>8.2f} {stats['success']:>7} {stats['errors']:>7} "
+                      f"{server.rejected:>5} {server.failed:>5} {str(limiter['concurrency_limit'] or '-'):>6} "
+                      f"{server.peak_active:>7}")
+
+                mismatched = [c.name for c in companies if c.compliment and c.name not in c.compliment]
+                if mismatched or (max_retries and stats['errors']):
+                    ok = False
+                    print(f"  ⚠️ {stats}, falsch zugeordnet: {mismatched[:5]}")
+
+    print(f"\nAlle Companies mit Retry erfolgreich: {'OK' if ok else 'FEHLER'}")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
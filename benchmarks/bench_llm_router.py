@@ -0,0 +1,129 @@
+"""
+Benchmark: Bulk-Generierung über einen Anbieter vs. Routing über mehrere
+
+Vier Anbieter in einer api_config.json, jeweils ein Fake-LLM-Server:
+- slow: active_api, antwortet langsamer als das Latenz-SLO
+- fast: schnell und zuverlässig
+- flaky: schnell, aber --error-rate 503-Antworten
+- down: Port ohne Server (Verbindung abgelehnt)
+
+Gemessen wird generate_for_companies
+- nur mit active_api (bisheriges Verhalten)
+- mit "routing": {"enabled": true}: Dauer, Fehler, Verteilung der Requests,
+  Circuit Breaker für down, SLO-Verletzungen von slow
+und ob die Messwerte in llm_router.db landen und beim nächsten Start als
+Ausgangswerte übernommen werden (api_config.json bleibt unverändert).
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_llm_router.py [--companies 48] [--concurrency 8] [--slo 1.0] [--error-rate 0.3]
+"""
+import argparse
+import json
+import logging
+import os
+import socket
+import sys
+import tempfile
+from contextlib import ExitStack
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from compliment_generator import ComplimentGenerator  # noqa: E402
+from llm_router import LLMRouterStore  # noqa: E402
+from bench_llm_generation import BenchCompany, answer, run  # noqa: E402
+from fake_llm_server import FakeLLMServer  # noqa: E402
+
+
+def closed_port_url() -> str:
+    """URL auf einen freien Port, an dem niemand lauscht"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/v1"
+
+
+def write_config(path: str, base_urls: dict, slo: float, routing: bool):
+    apis = {
+        name: {'name': name, 'base_url': base_url, 'default_model': f'{name}-model', 'api_key': 'bench',
+               'enabled': True, 'max_retries': 2, 'cost_per_1k_tokens': cost}
+        for (name, base_url), cost in zip(base_urls.items(), [0.5, 0.2, 0.1, 0.1])
+    }
+    config = {'active_api': 'slow', 'apis': apis,
+              'routing': {'enabled': routing, 'latency_slo': slo, 'failure_threshold': 3, 'cooldown': 60}}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--companies', type=int, default=48, help='Anzahl Companies')
+    arg_parser.add_argument('--concurrency', type=int, default=8, help='Parallele Requests')
+    arg_parser.add_argument('--slo', type=float, default=1.0, help='Latenz-SLO (Sekunden)')
+    arg_parser.add_argument('--error-rate', type=float, default=0.3, help='Anteil 503 bei flaky')
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    ok = True
+    with tempfile.TemporaryDirectory(prefix='leadtool-bench-') as tmp, ExitStack() as stack:
+        servers = {
+            'slow': stack.enter_context(FakeLLMServer(answer, latency=args.slo * 1.5)),
+            'fast': stack.enter_context(FakeLLMServer(answer, latency=0.2)),
+            'flaky': stack.enter_context(FakeLLMServer(answer, latency=0.2, error_rate=args.error_rate)),
+        }
+        base_urls = {name: server.base_url for name, server in servers.items()}
+        base_urls['down'] = closed_port_url()
+        config_path = os.path.join(tmp, 'api_config.json')
+        state_path = os.path.join(tmp, 'llm_router.db')
+
+        print(f"{args.companies} Companies, {args.concurrency} parallel, SLO {args.slo}s\n")
+        print(f"{'Modus':<20} {'Dauer s':>8} {'Erfolg':>7} {'Fehler':>7}   Requests pro Anbieter")
+        for label, routing in [('nur active_api', False), ('Routing', True)]:
+            write_config(config_path, base_urls, args.slo, routing)
+            with open(config_path, 'rb') as f:
+                config_before = f.read()
+            before = {name: server.requests for name, server in servers.items()}
+            generator = ComplimentGenerator(api_config_file=config_path, cache_path=None,
+                                            router_state_path=state_path)
+            companies = [BenchCompany(idx) for idx in range(args.companies)]
+            elapsed, stats, _ = run(generator, companies, args.concurrency)
+            spread = ', '.join(f"{name}={server.requests - before[name]}" for name, server in servers.items())
+            print(f"{label:<20} {elapsed:>8.2f} {stats['success']:>7} {stats['errors']:>7}   {spread}")
+
+            mismatched = [c.name for c in companies if c.compliment and c.name not in c.compliment]
+            if mismatched or stats['errors']:
+                ok = False
+                print(f"  ⚠️ {stats}, falsch zugeordnet: {mismatched[:5]}")
+
+        router_stats = generator.router.stats()
+        print(f"\n{'Anbieter':<8} {'Requests':>9} {'Fehler':>7} {'SLO':>5} {'Latenz ms':>10} {'Fehlerquote':>12} "
+              f"{'Kosten':>8} {'gesund':>7}")
+        for name, entry in router_stats.items():
+            print(f"{name:<8} {entry['requests']:>9} {entry['errors']:>7} {entry['slo_breaches']:>5} "
+                  f"{str(entry['latency_ms']):>10} {entry['error_rate']:>12.2f} {entry['cost']:>8.4f} "
+                  f"{'ja' if entry['healthy'] else 'nein':>7}")
+        if router_stats['down']['healthy'] or router_stats['fast']['requests'] < router_stats['slow']['requests']:
+            ok = False
+            print("  ⚠️ down nicht gesperrt oder slow bevorzugt")
+
+        # Messwerte in llm_router.db und Übernahme beim nächsten Start
+        with open(config_path, 'rb') as f:
+            if f.read() != config_before:
+                ok = False
+                print("  ⚠️ api_config.json wurde verändert")
+        measured = LLMRouterStore(state_path, table='provider_stats', max_entries=1000).load()
+        print(f"\nllm_router.db fast: {json.dumps(measured.get('fast'))}")
+        reloaded = {p.name: p for p in ComplimentGenerator(api_config_file=config_path, cache_path=None,
+                                                           router_state_path=state_path).router.providers}
+        if set(measured) != set(servers) | {'down'} or reloaded['fast'].health.latency is None:
+            ok = False
+            print(f"  ⚠️ Messwerte fehlen: {measured}")
+
+    print(f"\nRouting ohne Fehler, Messwerte gespeichert: {'OK' if ok else 'FEHLER'}")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+Benchmark: Namens-Extraktion (ein Anker-Scan vs. findall pro Pattern)
+
+Vergleicht die Regex-Stufe von ImpressumScraperUltimate.extract_name mit der
+bisherigen Implementierung (unten als legacy_* konserviert):
+- Äquivalenz: gleiche Kandidaten in gleicher Reihenfolge und gleiches
+  Ergebnis (Name + Priorität) auf allen Fixture-Seiten und synthetischen Texten
+- Laufzeit pro Seite (nur Text → Name, ohne Parsen), auch für einen langen Text
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_names.py [--repeat 20]
+"""
+import argparse
+import itertools
+import logging
+import os
+import re
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from bench_parser import load_pages, make_scraper, FIXTURES_DIR  # noqa: E402
+from html_document import LXML_AVAILABLE  # noqa: E402
+
+
+# ===== BISHERIGE IMPLEMENTIERUNG (Referenz) =====
+
+LEGACY_TITLES = ['dr.', 'dr', 'prof.', 'prof', 'dipl.', 'dipl', 'ing.', 'ing',
+                 'mag.', 'mag', 'rer.', 'rer', 'nat.', 'nat', 'med.', 'med',
+                 'herr', 'frau', 'mr.', 'mr', 'mrs.', 'mrs', 'ms.', 'ms']
+
+
+def legacy_candidates(scraper, text):
+    for pattern in scraper.name_patterns:
+        for match in pattern.regex.findall(text):
+            yield pattern.priority, match if isinstance(match, str) else match[0]
+
+
+def legacy_split(full_name):
+    if not full_name:
+        return None, None
+    full_name = re.sub(r'\s+', ' ', full_name.strip())
+    parts = [part for part in full_name.split() if part.lower().rstrip('.,') not in LEGACY_TITLES]
+    if len(parts) >= 2:
+        return parts[0], ' '.join(parts[1:])
+    if len(parts) == 1:
+        return parts[0], None
+    return None, None
+
+
+def legacy_validate(scraper, first, last):
+    for word in [first.lower(), last.lower()]:
+        for black in scraper.NAME_BLACKLIST:
+            if black in word:
+                return False
+    return (2 <= len(first) <= 30 and 2 <= len(last) <= 40
+            and first[0].isupper() and last[0].isupper()
+            and not first.isdigit() and not last.isdigit()
+            and '@' not in first and '@' not in last)
+
+
+def legacy_regex_name(scraper, text):
+    for priority, name_str in legacy_candidates(scraper, text):
+        first, last = legacy_split(name_str)
+        if first and last and legacy_validate(scraper, first, last):
+            return first, last, priority
+    return None
+
+
+def regex_name(scraper, text):
+    """Regex-Stufe von extract_name"""
+    for priority, name_str in scraper._name_candidates(text):
+        first, last = scraper._split_name(name_str)
+        if first and last and scraper._validate_name(first, last):
+            return first, last, priority
+    return None
+
+
+# ===== TESTFÄLLE =====
+
+KEYWORDS = ['Geschäftsführer:', 'Geschäftsführerin', 'Geschäftsführung:', 'GF:', 'Inhaber:', 'Inhaberin',
+            'Einzelunternehmer:', 'Vertreten durch:', 'gesetzlich vertreten:', 'Vertretungsberechtigter:',
+            'CEO:', 'Chief Executive:', 'Managing Director:', 'Vorstandsvorsitzender:',
+            'Verantwortlich für:', 'V.i.S.d.P.:', 'Inhaltlich verantwortlich:', 'Dr.', 'Prof.', 'Dipl.-Ing.',
+            ', Geschäftsführer', ', CEO', 'Geschäftsführer\n']
+NAMES = ['Max Mustermann', 'Anna-Lena Schmidt', 'Dr. Peter Meier', 'Herr Klaus Weber', 'Muster GmbH',
+         'Berlin Mitte', 'Thomas Müller-Lüdenscheidt', 'Sabine Sonnenschein']
+
+
+def synthetic_texts():
+    """Schlüsselwort × Name × Stellung (davor/dahinter), einzeln und gemischt"""
+    texts = []
+    for keyword, name in itertools.product(KEYWORDS, NAMES):
+        texts.append(f"Impressum {keyword} {name} Telefon 089 123")
+        texts.append(f"{name} {keyword} und Kontakt")
+    texts.append(' '.join(f"{k} {n}" for k, n in zip(KEYWORDS, itertools.cycle(NAMES))))
+    texts.append("Inhaber: Muster GmbH\nGeschäftsführer Max Mustermann, CEO Anna Schmidt")
+    texts.append("GESCHÄFTSFÜHRER: Max Mustermann, INHABER Anna Schmidt")
+    # lower() ändert die Länge (İ → i̇): Rückfall auf den IGNORECASE-Scan
+    texts.append("Büro İstanbul - Geschäftsführer: Max Mustermann")
+    return texts
+
+
+def time_per_item(func, items, repeat: int) -> float:
+    """Median-Laufzeit pro Element in ms"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        samples.append((time.perf_counter() - start) / len(items) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=20, help='Wiederholungen pro Messung')
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    scraper = make_scraper('lxml' if LXML_AVAILABLE else 'html.parser')
+    pages = load_pages(FIXTURES_DIR)
+    page_texts = [scraper.extract_clean_text(scraper.document(page)) for page in pages.values()]
+
+    # Äquivalenz
+    cases = page_texts + synthetic_texts()
+    candidate_diffs = [case for case in cases
+                       if list(legacy_candidates(scraper, case)) != list(scraper._name_candidates(case))]
+    result_diffs = [(case, legacy_regex_name(scraper, case), regex_name(scraper, case)) for case in cases
+                    if legacy_regex_name(scraper, case) != regex_name(scraper, case)]
+    print(f"Kandidaten identisch: {len(cases) - len(candidate_diffs)}/{len(cases)} Texte")
+    print(f"Ergebnis identisch:   {len(cases) - len(result_diffs)}/{len(cases)} Texte")
+    for case, expected, actual in result_diffs[:10]:
+        print(f"  ⚠️ {case[:60]!r}: alt={expected} neu={actual}")
+
+    # Laufzeit
+    long_text = '\n'.join(page_texts * 10)
+    print(f"\n{'Messung':<38} {'alt ms':>10} {'neu ms':>10} {'Speedup':>8}")
+    for label, items in [
+        ('Name pro Seite', page_texts),
+        (f'Name (langer Text, {len(long_text) // 1024} KB)', [long_text]),
+        ('alle Kandidaten pro Seite', page_texts),
+    ]:
+        if label.startswith('alle'):
+            old = lambda text: list(legacy_candidates(scraper, text))  # noqa: E731
+            new = lambda text: list(scraper._name_candidates(text))  # noqa: E731
+        else:
+            old = lambda text: legacy_regex_name(scraper, text)  # noqa: E731
+            new = lambda text: regex_name(scraper, text)  # noqa: E731
+        old_ms, new_ms = time_per_item(old, items, args.repeat), time_per_item(new, items, args.repeat)
+        print(f"{label:<38} {old_ms:>10.3f} {new_ms:>10.3f} {old_ms / new_ms:>7.1f}x")
+
+    return 1 if candidate_diffs or result_diffs else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Benchmark: HTML-Parser-Backends (html.parser vs. lxml)
+
+Misst pro Seite der Fixture-Sammlung:
+- reines Parsen (BeautifulSoup-Baum)
+- Parsen + alle Sichten des HtmlDocument (Text, Links, JSON-LD, ...)
+und prüft, ob beide Backends dieselben Kontaktdaten liefern.
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_parser.py [--repeat 20]
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from html_document import HtmlDocument, parse_html, LXML_AVAILABLE  # noqa: E402
+from impressum_scraper_ultimate import ImpressumScraperUltimate, ContactResult  # noqa: E402
+
+FIXTURES_DIR = os.path.join(ROOT, 'benchmarks', 'fixtures')
+
+
+def load_pages(directory: str) -> dict:
+    """Liest alle .html-Dateien (rekursiv) ein: {relativer Pfad: html}"""
+    pages = {}
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in sorted(filenames):
+            if filename.endswith(('.html', '.htm')):
+                path = os.path.join(dirpath, filename)
+                with open(path, encoding='utf-8', errors='replace') as f:
+                    pages[os.path.relpath(path, directory)] = f.read()
+    return dict(sorted(pages.items()))
+
+
+def time_per_page(func, pages: dict, repeat: int) -> float:
+    """Median-Laufzeit pro Seite in ms"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in pages.values():
+            func(html)
+        samples.append((time.perf_counter() - start) / len(pages) * 1000)
+    return statistics.median(samples)
+
+
+def all_views(html: str, parser: str):
+    doc = HtmlDocument(html, parser=parser)
+    return doc.clean_text, doc.visible_text, doc.footer_links, doc.mailto_addresses, doc.json_ld, doc.microdata
+
+
+def make_scraper(parser: str) -> ImpressumScraperUltimate:
+    """Scraper ohne Netzwerk/Chrome/API - nur für die Extraktion"""
+    return ImpressumScraperUltimate.extraction_only(parser)
+
+
+def extract(scraper: ImpressumScraperUltimate, html: str) -> dict:
+    result = scraper.extract_contact_data(html, ContactResult())
+    return {'name': result.full_name, 'email': result.email, 'phone': result.phone}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=20, help='Wiederholungen pro Messung')
+    arg_parser.add_argument('--fixtures', default=FIXTURES_DIR, help='Verzeichnis mit HTML-Fixtures')
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    pages = load_pages(args.fixtures)
+    if not pages:
+        print(f"Keine HTML-Fixtures in {args.fixtures}")
+        return 1
+
+    parsers = ['html.parser'] + (['lxml'] if LXML_AVAILABLE else [])
+    total_kb = sum(len(html) for html in pages.values()) / 1024
+    print(f"{len(pages)} Seiten ({total_kb:.0f} KB), {args.repeat} Wiederholungen\n")
+
+    print(f"{'Parser':<12} {'Parse ms/Seite':>15} {'Parse+Sichten ms/Seite':>23}")
+    timings = {}
+    for parser in parsers:
+        parse_ms = time_per_page(lambda html: parse_html(html, parser), pages, args.repeat)
+        views_ms = time_per_page(lambda html: all_views(html, parser), pages, args.repeat)
+        timings[parser] = (parse_ms, views_ms)
+        print(f"{parser:<12} {parse_ms:>15.2f} {views_ms:>23.2f}")
+
+    if 'lxml' in timings:
+        base, fast = timings['html.parser'], timings['lxml']
+        print(f"\nSpeedup lxml: Parse {base[0] / fast[0]:.1f}x, Parse+Sichten {base[1] / fast[1]:.1f}x")
+
+        # Gleiche Ergebnisse?
+        slow_scraper, fast_scraper = make_scraper('html.parser'), make_scraper('lxml')
+        mismatches = 0
+        for name, html in pages.items():
+            expected, actual = extract(slow_scraper, html), extract(fast_scraper, html)
+            if expected != actual:
+                mismatches += 1
+                print(f"  ⚠️ Abweichung {name}: html.parser={expected} lxml={actual}")
+        print(f"Extraktion identisch: {len(pages) - mismatches}/{len(pages)} Seiten")
+    else:
+        print("\nlxml nicht installiert - nur html.parser gemessen")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""
+Benchmark: Scraping-Pipeline offline gegen die Fixture-Sammlung
+
+Startet den Replay-Server, scraped alle Fixture-Websites mit
+ImpressumScraperUltimate.scrape_multiple und EmailScraper.scrape_email und
+berichtet:
+- Durchsatz (Leads/s, HTTP-Requests/s)
+- Latenz-Perzentile pro Pipeline-Stufe (p50/p90/p99)
+- Extraktions-Genauigkeit gegen benchmarks/fixtures/expected.json
+
+Kein Netzwerk, kein Chrome, keine API - Ergebnisse sind reproduzierbar und
+eignen sich als Regressions-Check für Performance-Änderungen.
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_pipeline.py [--rounds 5] [--workers 8] [--latency 0.02] [--processes 4]
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(ROOT))
+sys.path.insert(0, ROOT)
+
+from replay_server import ReplayServer  # noqa: E402
+from impressum_scraper_ultimate import ImpressumScraperUltimate  # noqa: E402
+from email_scraper import EmailScraper  # noqa: E402
+from host_scheduler import get_host_scheduler  # noqa: E402
+
+EXPECTED_FILE = os.path.join(ROOT, 'fixtures', 'expected.json')
+
+# Pipeline-Stufen, deren Laufzeit gemessen wird (Methoden-Namen)
+IMPRESSUM_STAGES = ['scrape', 'find_impressum_url', 'fetch_document',
+                    'extract_name', 'extract_emails', 'extract_phones']
+EMAIL_STAGES = ['scrape_email', 'extract_emails_from_html', 'find_contact_pages']
+
+
+class StageTimer:
+    """Sammelt Laufzeiten pro Stufe (thread-sicher)"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def instrument(self, obj, method_names, prefix: str):
+        """Ersetzt Methoden von obj durch zeitmessende Wrapper"""
+        for name in method_names:
+            method = getattr(obj, name)
+            setattr(obj, name, self._wrap(method, f"{prefix}.{name}"))
+
+    def _wrap(self, method, label: str):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self.samples[label].append(elapsed)
+        return timed
+
+    def report(self):
+        print(f"\n{'Stufe':<42} {'n':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9}")
+        for label, values in self.samples.items():
+            print(f"{label:<42} {len(values):>6} {percentile(values, 50):>9.2f} "
+                  f"{percentile(values, 90):>9.2f} {percentile(values, 99):>9.2f}")
+
+
+def percentile(values, p: float) -> float:
+    """Perzentil (nearest rank)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def normalize_phone(phone):
+    """+49 (0) 89 ... / 089 ... → +4989..."""
+    if not phone:
+        return None
+    digits = re.sub(r'[^\d+]', '', phone)
+    digits = re.sub(r'^(\+49|0049)0', '+49', digits)
+    digits = re.sub(r'^0049', '+49', digits)
+    if digits.startswith('0'):
+        digits = '+49' + digits[1:]
+    return digits
+
+
+class Accuracy:
+    """Zählt korrekte Felder gegen expected.json"""
+
+    def __init__(self):
+        self.correct = defaultdict(int)
+        self.total = defaultdict(int)
+        self.errors = []
+
+    def check(self, host: str, field: str, expected, actual, normalize=lambda v: v):
+        self.total[field] += 1
+        if normalize(expected) == normalize(actual):
+            self.correct[field] += 1
+        else:
+            self.errors.append((host, field, expected, actual))
+
+    def report(self, verbose: bool):
+        print(f"\n{'Feld':<16} {'korrekt':>10}")
+        for field, total in self.total.items():
+            print(f"{field:<16} {self.correct[field]:>4}/{total:<4} ({self.correct[field] / total:.0%})")
+        overall = sum(self.correct.values()) / max(1, sum(self.total.values()))
+        print(f"{'gesamt':<16} {overall:>10.0%}")
+
+        if verbose and self.errors:
+            print("\nAbweichungen (erwartet → gefunden):")
+            for host, field, expected, actual in sorted(set(self.errors), key=str):
+                print(f"  {host:<28} {field:<14} {expected!r} → {actual!r}")
+
+
+def lower(value):
+    return value.lower() if isinstance(value, str) else value
+
+
+def run_impressum(server, expected, args, timer, accuracy, cache_dir):
+    scraper = ImpressumScraperUltimate(
+        api_config_file=os.path.join(cache_dir, 'no_api_config.json'),
+        max_workers=args.workers,
+        cache_path=os.path.join(cache_dir, 'impressum_cache.db'),
+        http_cache_path=os.path.join(cache_dir, 'http_cache.db'),
+        health_path=os.path.join(cache_dir, 'domain_health.db'),
+        use_selenium=False,
+    )
+    scraper.extraction_processes = args.processes
+    server.mount(scraper.session)
+    timer.instrument(scraper, IMPRESSUM_STAGES, 'impressum')
+
+    hosts = list(expected)
+    leads = hosts * args.rounds
+
+    if args.processes:
+        # Prozess-Start nicht mitmessen
+        scraper.warm_up_extraction_pool()
+
+    requests_before = server.requests
+    start = time.perf_counter()
+    results = scraper.scrape_multiple(leads)
+    elapsed = time.perf_counter() - start
+    scraper.shutdown_extraction_pool()
+
+    for host, result in zip(hosts, results):
+        exp = expected[host]
+        accuracy.check(host, 'impressum_url', exp['impressum_url'], result.impressum_url)
+        accuracy.check(host, 'first_name', exp['first_name'], result.first_name)
+        accuracy.check(host, 'last_name', exp['last_name'], result.last_name)
+        accuracy.check(host, 'email', exp['email'], result.email, lower)
+        accuracy.check(host, 'phone', exp['phone'], result.phone, normalize_phone)
+
+    requests = server.requests - requests_before
+    print(f"Impressum-Scraper: {len(leads)} Leads in {elapsed:.2f}s → "
+          f"{len(leads) / elapsed:.1f} Leads/s, {requests / elapsed:.0f} Requests/s "
+          f"(Workers: {args.workers}, Extraktions-Prozesse: {args.processes}, HTTP-Cache Trefferquote: {scraper.session.cache_hit_rate:.0%}, "
+          f"Seiten-Cache Trefferquote: {scraper.fetcher.hit_rate:.0%})")
+
+
+def run_email(server, expected, args, timer, accuracy, cache_dir):
+    # Gleiche Cache-Pfade wie der Impressum-Scraper (wie in der App): gemeinsame
+    # Session und HTTP-Cache; Seiten-Cache hat jeder Lauf bzw. scrape_email für sich
+    scraper = EmailScraper(http_cache_path=os.path.join(cache_dir, 'http_cache.db'),
+                           health_path=os.path.join(cache_dir, 'domain_health.db'), use_selenium=False)
+    server.mount(scraper.session)
+    timer.instrument(scraper, EMAIL_STAGES, 'email')
+
+    hosts = list(expected)
+    requests_before = server.requests
+    start = time.perf_counter()
+    results = {}
+    for _ in range(args.rounds):
+        for host in hosts:
+            results[host] = scraper.scrape_email(host)
+    elapsed = time.perf_counter() - start
+
+    for host in hosts:
+        found = (results[host] or {}).get('email')
+        accuracy.check(host, 'contact_email', expected[host]['contact_email'], found, lower)
+
+    count = len(hosts) * args.rounds
+    requests = server.requests - requests_before
+    print(f"E-Mail-Scraper:    {count} Leads in {elapsed:.2f}s → "
+          f"{count / elapsed:.1f} Leads/s, {requests / elapsed:.0f} Requests/s "
+          f"(sequentiell, Seiten-Cache gesamt: {scraper.fetcher.hit_rate:.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=5, help='Durchläufe über alle Fixture-Websites')
+    parser.add_argument('--workers', type=int, default=8, help='Parallele Worker im Impressum-Scraper')
+    parser.add_argument('--processes', type=int, default=0,
+                        help='Extraktion im Prozess-Pool (0 = in den Worker-Threads)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Künstliche Server-Latenz pro Request (Sekunden)')
+    parser.add_argument('--host-interval', type=float, default=None,
+                        help='Mindestabstand pro Host (Sekunden, Standard: wie im Scraper)')
+    parser.add_argument('--host-concurrency', type=int, default=None,
+                        help='Max. gleichzeitige Requests pro Host (Standard: wie im Scraper)')
+    parser.add_argument('--skip-email', action='store_true', help='EmailScraper nicht messen')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Abweichungen einzeln ausgeben')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    with open(EXPECTED_FILE, encoding='utf-8') as f:
+        expected = json.load(f)
+
+    # Jede Runde trifft dieselben Hosts erneut - die Höflichkeits-Regeln
+    # bremsen hier stärker als bei einer echten Lead-Liste mit vielen Domains
+    scheduler = get_host_scheduler()
+    if args.host_interval is not None:
+        scheduler.min_interval = args.host_interval
+    if args.host_concurrency is not None:
+        scheduler.max_concurrency = max(1, args.host_concurrency)
+
+    timer = StageTimer()
+    accuracy = Accuracy()
+
+    # Frische Caches pro Lauf (kein Einfluss früherer Läufe)
+    with tempfile.TemporaryDirectory(prefix='leadtool-bench-') as cache_dir, \
+            ReplayServer(latency=args.latency) as server:
+        print(f"Replay-Server {server.address}, {len(expected)} Websites, {args.rounds} Runden\n")
+
+        run_impressum(server, expected, args, timer, accuracy, cache_dir)
+        if not args.skip_email:
+            run_email(server, expected, args, timer, accuracy, cache_dir)
+
+    print(f"Wartezeit durch Host-Limits: {scheduler.total_wait():.2f}s "
+          f"(Abstand {scheduler.min_interval}s, max. {scheduler.max_concurrency} parallel pro Host)")
+
+    timer.report()
+    accuracy.report(args.verbose)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Fake-LLM-Server - OpenAI-kompatibler /chat/completions-Endpunkt für Benchmarks
+
+Beantwortet Chat-Completion-Requests lokal mit einer Antwort-Funktion statt
+eines Modells und simuliert die Latenz einer echten API (fester Anteil pro
+Request + Anteil pro erzeugtem Token) und optional ein Limit gleichzeitiger
+Requests wie bei einem API-Anbieter (weitere Requests warten). Optional
+lehnt er wie ein drosselnder Anbieter ab: 429 mit Retry-After oberhalb von
+reject_over gleichzeitigen Requests, zufällige 503 mit error_rate. So lassen
+sich Batching, Parallelität, Caching und Retries der API-Aufrufe ohne
+Netzwerk und API-Key messen.
+
+Verwendung:
+    def answer(messages, max_tokens):
+        return "Max Mustermann"
+
+    with FakeLLMServer(answer, latency=1.0) as server:
+        scraper.api_base_url = server.base_url
+        ...
+"""
+import json
+import random
+import ssl
+import threading
+import time
+from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler
+from typing import Callable, Dict, List, Optional
+
+from replay_server import _QuietHTTPServer
+
+# Antwort-Funktion: (messages, max_tokens) → Antworttext
+AnswerFunc = Callable[[List[Dict[str, str]], int], str]
+
+
+class _ChatHandler(BaseHTTPRequestHandler):
+    """Beantwortet POST /v1/chat/completions"""
+
+    protocol_version = 'HTTP/1.1'
+    # Header und Body sind zwei Writes: ohne TCP_NODELAY wartet der Body auf
+    # das (verzögerte) ACK des Clients - ~40ms pro Request auf Keep-Alive-Verbindungen
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass  # Kein Request-Log auf stderr
+
+    def do_POST(self):
+        server: 'FakeLLMServer' = self.server.fake_llm
+        length = int(self.headers.get('Content-Length') or 0)
+        request = json.loads(self.rfile.read(length) or b'{}')
+
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self._send(404, {'error': {'message': 'not found'}})
+            return
+
+        rejection = server.admit()
+        if rejection is not None:
+            status, headers = rejection
+            self._send(status, {'error': {'message': 'rate limited' if status == 429 else 'overloaded'}}, headers)
+            return
+
+        try:
+            messages = request.get('messages', [])
+            max_tokens = int(request.get('max_tokens') or 256)
+            content = server.answer(messages, max_tokens)
+            prompt_chars = sum(len(message.get('content', '')) for message in messages)
+            server.record(prompt_chars)
+
+            # Latenz: Grundlatenz + Generierung (~4 Zeichen pro Token), max. concurrency gleichzeitig
+            with server.slots:
+                time.sleep(server.latency + server.token_latency * len(content) / 4)
+        finally:
+            server.release()
+
+        self._send(200, {
+            'id': 'fake',
+            'object': 'chat.completion',
+            'model': request.get('model', 'fake'),
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content},
+                         'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': prompt_chars // 4, 'completion_tokens': len(content) // 4,
+                      'total_tokens': prompt_chars // 4 + len(content) // 4},
+        })
+
+    def _send(self, status: int, payload: dict, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeLLMServer:
+    """Lokaler Chat-Completion-Server (läuft im Hintergrund-Thread)"""
+
+    def __init__(self, answer: AnswerFunc, latency: float = 1.0, token_latency: float = 0.02,
+                 concurrency: int = 0, host: str = '127.0.0.1', port: int = 0,
+                 tls_cert: Optional[str] = None, tls_key: Optional[str] = None,
+                 reject_over: int = 0, retry_after: Optional[float] = 1.0,
+                 error_rate: float = 0.0, seed: int = 1):
+        """
+        Args:
+            answer: Erzeugt den Antworttext aus messages und max_tokens
+            latency: Grundlatenz pro Request in Sekunden
+            token_latency: Zusätzliche Sekunden pro erzeugtem Token
+            concurrency: Max. gleichzeitig bearbeitete Requests (0 = unbegrenzt)
+            host: Bind-Adresse
+            port: Port (0 = beliebiger freier Port)
+            tls_cert: Optional - Zertifikat (PEM) für HTTPS
+            tls_key: Optional - privater Schlüssel zu tls_cert
+            reject_over: 429 ab so vielen gleichzeitigen Requests (0 = nie)
+            retry_after: Retry-After-Header der 429-Antworten (None = ohne Header)
+            error_rate: Anteil zufälliger 503-Antworten
+            seed: Zufallsstartwert für error_rate
+        """
+        self.answer = answer
+        self.latency = latency
+        self.token_latency = token_latency
+        self.slots = threading.BoundedSemaphore(concurrency) if concurrency > 0 else nullcontext()
+        self.reject_over = reject_over
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self.requests = 0
+        self.prompt_chars = 0
+        self.rejected = 0
+        self.failed = 0
+        self.active = 0
+        self.peak_active = 0
+        self._lock = threading.Lock()
+
+        self._httpd = _QuietHTTPServer((host, port), _ChatHandler)
+        self._httpd.fake_llm = self
+        self.scheme = 'http'
+        if tls_cert:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(tls_cert, tls_key)
+            self._httpd.socket = context.wrap_socket(self._httpd.socket, server_side=True)
+            self.scheme = 'https'
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"{self.scheme}://{host}:{port}/v1"
+
+    def admit(self):
+        """Nimmt einen Request an (None) oder lehnt ihn ab: (Status, Header)"""
+        with self._lock:
+            if self.reject_over and self.active >= self.reject_over:
+                self.rejected += 1
+                headers = {'Retry-After': f'{self.retry_after:g}'} if self.retry_after is not None else {}
+                return 429, headers
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.failed += 1
+                return 503, {}
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+            return None
+
+    def release(self):
+        with self._lock:
+            self.active -= 1
+
+    def record(self, prompt_chars: int):
+        with self._lock:
+            self.requests += 1
+            self.prompt_chars += prompt_chars
+
+    # ===== LEBENSZYKLUS =====
+
+    def start(self) -> 'FakeLLMServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='fake-llm-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,232 @@
+"""
+Replay-Server - Spielt aufgezeichnete Websites lokal ab
+
+Jede Website liegt unter benchmarks/fixtures/sites/<host>/. Der Server wählt
+die Website anhand des Host-Headers und löst Pfade so auf:
+    /                 → <host>/index.html
+    /impressum/       → <host>/impressum/index.html
+    /impressum        → <host>/impressum.html oder <host>/impressum/index.html
+    /sitemap.xml      → <host>/sitemap.xml
+Alles andere (und unbekannte Hosts) → 404.
+
+Antworten tragen ein ETag; If-None-Match wird mit 304 beantwortet, damit
+auch der Response-Cache der Scraper realistisch arbeitet. Optional wird
+eine künstliche Latenz pro Request simuliert.
+
+Verwendung:
+    with ReplayServer() as server:
+        server.mount(scraper.session)   # Requests an beliebige Hosts → Replay-Server
+        scraper.scrape("mueller-dachdeckerei.de")
+
+Oder eigenständig:
+    python benchmarks/replay_server.py --port 8765
+"""
+import argparse
+import hashlib
+import mimetypes
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, unquote
+
+from requests.adapters import HTTPAdapter
+
+SITES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'sites')
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """Beantwortet GET/HEAD aus dem Fixture-Verzeichnis"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass  # Kein Request-Log auf stderr
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def _serve(self, send_body: bool):
+        server: 'ReplayServer' = self.server.replay
+        server.count_request()
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        host = (self.headers.get('Host') or '').split(':')[0].lower()
+        if host.startswith('www.'):
+            host = host[4:]
+
+        path = server.resolve(host, urlsplit(self.path).path)
+        if path is None:
+            self._send(404, b'<html><body>Not Found</body></html>', 'text/html; charset=utf-8', send_body)
+            return
+
+        with open(path, 'rb') as f:
+            body = f.read()
+
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+        if self.headers.get('If-None-Match') == etag:
+            self._send(304, b'', None, send_body, etag=etag)
+            return
+
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type.endswith('xml'):
+            content_type += '; charset=utf-8'
+        self._send(200, body, content_type, send_body, etag=etag)
+
+    def _send(self, status: int, body: bytes, content_type: Optional[str], send_body: bool, etag: str = None):
+        self.send_response(status)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body and body:
+            self.wfile.write(body)
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer mit großem Accept-Backlog, ohne Tracebacks bei Client-Abbrüchen"""
+
+    daemon_threads = True
+    # Standard (5) führt bei vielen parallelen Verbindungen zu SYN-Retransmits (~1s)
+    request_queue_size = 256
+
+    def handle_error(self, request, client_address):
+        # Abgebrochene Prüf-Requests (Client schließt Verbindung) sind erwartet
+        if not isinstance(sys.exc_info()[1], (ConnectionError, TimeoutError)):
+            super().handle_error(request, client_address)
+
+
+class ReplayServer:
+    """Lokaler HTTP-Server für die Fixture-Websites (läuft im Hintergrund-Thread)"""
+
+    def __init__(self, sites_dir: str = SITES_DIR, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0):
+        """
+        Args:
+            sites_dir: Verzeichnis mit einem Unterordner pro Host
+            host: Bind-Adresse
+            port: Port (0 = beliebiger freier Port)
+            latency: Künstliche Latenz pro Request in Sekunden
+        """
+        self.sites_dir = sites_dir
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        self._httpd = _QuietHTTPServer((host, port), _ReplayHandler)
+        self._httpd.replay = self
+        self._thread = None
+
+    @property
+    def address(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def hosts(self):
+        """Alle Hosts der Fixture-Sammlung"""
+        return sorted(name for name in os.listdir(self.sites_dir)
+                      if os.path.isdir(os.path.join(self.sites_dir, name)))
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def resolve(self, host: str, url_path: str) -> Optional[str]:
+        """Bildet Host + URL-Pfad auf eine Fixture-Datei ab (None = 404)"""
+        site_dir = os.path.realpath(os.path.join(self.sites_dir, host))
+        if not host or not os.path.isdir(site_dir):
+            return None
+
+        rel = unquote(url_path).lstrip('/')
+        candidates = [os.path.join(rel, 'index.html')] if not rel or rel.endswith('/') else [
+            rel, rel + '.html', os.path.join(rel, 'index.html')
+        ]
+
+        for candidate in candidates:
+            path = os.path.realpath(os.path.join(site_dir, candidate))
+            # Kein Ausbruch aus dem Site-Verzeichnis
+            if path.startswith(site_dir + os.sep) and os.path.isfile(path):
+                return path
+        return None
+
+    # ===== LEBENSZYKLUS =====
+
+    def start(self) -> 'ReplayServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='replay-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # ===== CLIENT-ANBINDUNG =====
+
+    def mount(self, session):
+        """Leitet alle HTTP(S)-Requests einer requests-Session auf den Replay-Server um"""
+        adapter = ReplayAdapter(self.address)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    requests-Adapter: schreibt jede URL auf den Replay-Server um
+
+    Der ursprüngliche Host bleibt im Host-Header erhalten, sodass der Server
+    die richtige Website auswählt. Die Response trägt weiterhin die
+    Original-URL (für urljoin & Co. in den Scrapern).
+    """
+
+    def __init__(self, address: str, **kwargs):
+        self.address = address
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        original_url = request.url
+        parts = urlsplit(original_url)
+        request.url = urlunsplit(('http', self.address, parts.path or '/', parts.query, ''))
+        request.headers['Host'] = parts.hostname or ''
+
+        response = super().send(request, **kwargs)
+
+        response.url = original_url
+        request.url = original_url
+        return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay-Server für die Fixture-Websites')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help='Künstliche Latenz pro Request (Sekunden)')
+    args = parser.parse_args()
+
+    server = ReplayServer(port=args.port, latency=args.latency)
+    print(f"Replay-Server auf http://{server.address} - Hosts: {', '.join(server.hosts)}")
+    print("Beispiel: curl -H 'Host: mueller-dachdeckerei.de' http://%s/impressum/" % server.address)
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
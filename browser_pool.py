@@ -0,0 +1,382 @@
+"""
+Browser Pool - Wiederverwendbare Headless-Chrome-Instanzen für Selenium-Fallbacks
+
+Statt für jede URL einen neuen Chrome-Prozess zu starten, hält der Pool
+warme Instanzen bereit, die von ImpressumScraperUltimate und EmailScraper
+gemeinsam genutzt werden.
+
+Features:
+- Begrenzte Anzahl Browser = globales Limit für gleichzeitige Renderings
+- Warme Instanzen werden wiederverwendet (kein Prozess-Start pro Seite)
+- Zurücksetzen nach jeder Seite (Cookies, Storage, about:blank)
+- Recycling nach N Seiten oder nach Absturz
+- Render-Modus mit Bereitschafts-Signalen statt fester Wartezeiten
+- Bilder, Medien, Fonts und bekannte Tracker werden blockiert
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional, Sequence
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import WebDriverException, TimeoutException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Ressourcen, die für Kontaktdaten irrelevant sind (Chrome DevTools URL-Patterns)
+BLOCKED_URL_PATTERNS = [
+    # Bilder
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp",
+    # Fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # Medien
+    "*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav", "*.m4a", "*.mov",
+    # Tracker / Werbung
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*connect.facebook.net*", "*hotjar.com*",
+    "*clarity.ms*", "*bat.bing.com*", "*snap.licdn.com*", "*analytics.tiktok.com*",
+    "*matomo.js*", "*piwik.js*", "*etracker.com*", "*cookiebot.com*",
+]
+
+# JS-Zustand der Seite für die Bereitschafts-Prüfung - Text-Prüfungen laufen
+# im Browser, zurück kommen nur Flags (nicht der ganze Seitentext pro Poll)
+# arguments[0]: Keywords (klein geschrieben), arguments[1]: Mindest-Textlänge
+_READY_STATE_SCRIPT = """
+const body = document.body;
+const text = body ? (body.innerText || '') : '';
+const hasContent = text.length >= arguments[1];
+const lower = hasContent && arguments[0].length ? text.toLowerCase() : '';
+return {
+    readyState: document.readyState,
+    hasContent: hasContent,
+    keyword: lower ? arguments[0].findIndex(keyword => lower.includes(keyword)) : -1,
+    mailto: !!document.querySelector('a[href^="mailto:" i]'),
+    resources: performance.getEntriesByType('resource').length
+};
+"""
+
+
+class BrowserPoolClosedError(WebDriverException):
+    """Pool wurde geschlossen - es werden keine Instanzen mehr ausgeliehen"""
+
+
+class _PageReady:
+    """
+    Bedingung für WebDriverWait: Seite ist bereit, wenn DOM-Inhalt vorhanden ist
+    UND (ein Keyword auftaucht ODER das Netzwerk ruht)
+
+    Mit wait_for_mailto genügt auch ein mailto-Link - nur für Aufrufer, die
+    E-Mail-Adressen suchen; wer auf bestimmten Inhalt wartet (Impressum),
+    schaltet das ab.
+    """
+
+    def __init__(self, keywords: Sequence[str], wait_for_mailto: bool,
+                 min_text_length: int, idle_time: float):
+        self.keywords = [k.lower() for k in keywords]
+        self.wait_for_mailto = wait_for_mailto
+        self.min_text_length = min_text_length
+        self.idle_time = idle_time
+        self.signal = None
+        self._resources = -1
+        self._idle_since = None
+
+    def __call__(self, driver) -> bool:
+        state = driver.execute_script(_READY_STATE_SCRIPT, self.keywords, self.min_text_length)
+
+        if state['readyState'] == 'loading' or not state['hasContent']:
+            return False
+
+        if self.wait_for_mailto and state['mailto']:
+            self.signal = 'mailto'
+            return True
+
+        if state['keyword'] >= 0:
+            self.signal = f"keyword '{self.keywords[state['keyword']]}'"
+            return True
+
+        # Netzwerk-Ruhe: keine neuen Ressourcen für idle_time Sekunden
+        now = time.monotonic()
+        if state['resources'] != self._resources:
+            self._resources = state['resources']
+            self._idle_since = now
+            return False
+
+        if state['readyState'] == 'complete' and now - self._idle_since >= self.idle_time:
+            self.signal = 'network idle'
+            return True
+
+        return False
+
+
+class BrowserPool:
+    """
+    Pool von Headless-Chrome-Instanzen
+
+    Verwendung:
+        pool = get_browser_pool(chrome_driver_path)
+        with pool.driver() as driver:
+            driver.get(url)
+            html = driver.page_source
+    """
+
+    def __init__(self, chrome_driver_path: str, max_browsers: int = 2,
+                 max_pages_per_browser: int = 50, page_load_timeout: int = 25,
+                 user_agent: str = DEFAULT_USER_AGENT, block_resources: bool = True):
+        """
+        Args:
+            chrome_driver_path: Pfad zum ChromeDriver
+            max_browsers: Max. gleichzeitige Chrome-Instanzen (= gleichzeitige Renderings)
+            max_pages_per_browser: Instanz wird nach so vielen Seiten neu gestartet
+            page_load_timeout: Seitenlade-Timeout in Sekunden
+            user_agent: User-Agent der Browser
+            block_resources: Bilder, Medien, Fonts und Tracker blockieren
+        """
+        self.chrome_driver_path = chrome_driver_path
+        self.max_browsers = max(1, max_browsers)
+        self.max_pages_per_browser = max(1, max_pages_per_browser)
+        self.page_load_timeout = page_load_timeout
+        self.user_agent = user_agent
+        self.block_resources = block_resources
+
+        # Globales Limit für gleichzeitige Renderings
+        self._slots = threading.BoundedSemaphore(self.max_browsers)
+        # Warme (freie) Instanzen
+        self._idle = queue.LifoQueue()
+        self._pages = {}  # id(driver) -> Anzahl gerenderter Seiten
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # ===== LEBENSZYKLUS =====
+
+    def _build_options(self) -> Options:
+        """Chrome-Optionen für Headless-Betrieb"""
+        options = Options()
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-infobars")
+        options.add_argument(f"user-agent={self.user_agent}")
+
+        # driver.get() kehrt nach DOMContentLoaded zurück - den Rest erledigt render()
+        options.page_load_strategy = 'eager'
+
+        if self.block_resources:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.media_stream": 2,
+            })
+        return options
+
+    def _block_resources(self, driver):
+        """Blockiert irrelevante Ressourcen über das DevTools-Protokoll"""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.debug(f"Ressourcen-Blockierung nicht verfügbar: {e}")
+
+    def _start_driver(self):
+        """Startet eine neue Chrome-Instanz"""
+        service = Service(self.chrome_driver_path)
+        driver = webdriver.Chrome(service=service, options=self._build_options())
+        driver.set_page_load_timeout(self.page_load_timeout)
+        if self.block_resources:
+            self._block_resources(driver)
+        with self._lock:
+            self._pages[id(driver)] = 0
+        logger.info("🌐 Neue Chrome-Instanz gestartet")
+        return driver
+
+    def _quit_driver(self, driver):
+        """Beendet eine Chrome-Instanz"""
+        with self._lock:
+            self._pages.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass  # Driver bereits geschlossen
+
+    def _reset_driver(self, driver) -> bool:
+        """
+        Setzt den Browser-Zustand für die nächste Seite zurück
+
+        Cookies werden über DevTools für alle Domains gelöscht
+        (delete_all_cookies erfasst nur die Domain der aktuellen Seite),
+        Storage der zuletzt geladenen Origin ebenso.
+
+        Returns:
+            False wenn der Browser nicht mehr reagiert
+        """
+        try:
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                origin = driver.execute_script("return window.location.origin")
+                if origin and origin != 'null':
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                           {"origin": origin, "storageTypes": "all"})
+            except WebDriverException as e:
+                logger.debug(f"Zurücksetzen über DevTools nicht verfügbar: {e}")
+                driver.delete_all_cookies()
+                driver.execute_script(
+                    "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+                )
+            driver.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    def warm_up(self, count: Optional[int] = None):
+        """Startet vorab Instanzen, damit der erste Fallback nicht auf Chrome warten muss"""
+        for _ in range(min(count or self.max_browsers, self.max_browsers) - self._idle.qsize()):
+            if self._closed:
+                break
+            try:
+                self._park(self._start_driver())
+            except WebDriverException as e:
+                logger.warning(f"Chrome-Warmstart fehlgeschlagen: {e}")
+                break
+
+    def close(self):
+        """
+        Beendet alle freien Instanzen und nimmt keine Ausleihen mehr an
+
+        Belegte Instanzen werden bei Rückgabe beendet.
+        """
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit_driver(driver)
+
+    # ===== AUSLEIHEN =====
+
+    @contextmanager
+    def driver(self):
+        """
+        Leiht eine Chrome-Instanz aus (blockiert bis ein Slot frei ist)
+
+        Bei einem WebDriverException während der Nutzung (außer Timeouts) wird
+        die Instanz verworfen und beim nächsten Ausleihen neu gestartet.
+
+        Raises:
+            BrowserPoolClosedError: Pool wurde bereits geschlossen
+        """
+        self._slots.acquire()
+        if self._closed:
+            self._slots.release()
+            raise BrowserPoolClosedError("Browser-Pool ist geschlossen")
+
+        driver = None
+        healthy = True
+        try:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self._start_driver()
+
+            yield driver
+
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            healthy = False
+            raise
+        finally:
+            try:
+                if driver is not None:
+                    self._release(driver, healthy)
+            finally:
+                self._slots.release()
+
+    # ===== RENDERN =====
+
+    def render(self, url: str, keywords: Sequence[str] = (), wait_for_mailto: bool = True,
+               timeout: float = 10, page_load_timeout: Optional[int] = None,
+               min_text_length: int = 200, idle_time: float = 0.5) -> str:
+        """
+        Lädt eine Seite und wartet auf Bereitschafts-Signale statt fester Sleeps
+
+        Fertig sobald DOM-Inhalt (min_text_length Zeichen) vorhanden ist und
+        eines der Signale eintritt: Keyword im Text, mailto-Link (nur mit
+        wait_for_mailto) oder Netzwerk-Ruhe (idle_time ohne neue Ressourcen).
+        Spätestens nach timeout Sekunden wird der aktuelle Stand zurückgegeben.
+
+        Returns:
+            page_source (Exceptions von Selenium werden weitergereicht)
+        """
+        with self.driver() as driver:
+            driver.set_page_load_timeout(page_load_timeout or self.page_load_timeout)
+            start = time.monotonic()
+            driver.get(url)
+
+            # Scroll um lazy-loaded Content zu triggern
+            driver.execute_script("window.scrollTo(0, document.body ? document.body.scrollHeight / 2 : 0);")
+
+            ready = _PageReady(keywords, wait_for_mailto, min_text_length, idle_time)
+            try:
+                WebDriverWait(driver, timeout, poll_frequency=0.2).until(ready)
+                logger.debug(f"Seite bereit nach {time.monotonic() - start:.2f}s ({ready.signal}): {url}")
+            except TimeoutException:
+                logger.debug(f"Max. Wartezeit ({timeout}s) erreicht: {url}")
+
+            return driver.page_source
+
+    def _release(self, driver, healthy: bool):
+        """Gibt eine Instanz zurück in den Pool oder recycelt sie"""
+        with self._lock:
+            pages = self._pages.get(id(driver), 0) + 1
+            self._pages[id(driver)] = pages
+
+        if not healthy or self._closed or pages >= self.max_pages_per_browser:
+            reason = "Absturz" if not healthy else "Seitenlimit" if pages >= self.max_pages_per_browser else "Pool geschlossen"
+            logger.debug(f"♻️ Chrome-Instanz wird recycelt ({reason})")
+            self._quit_driver(driver)
+            return
+
+        if self._reset_driver(driver):
+            self._park(driver)
+        else:
+            self._quit_driver(driver)
+
+    def _park(self, driver):
+        """Legt eine freie Instanz ab - oder beendet sie, falls der Pool inzwischen geschlossen ist"""
+        with self._lock:
+            if not self._closed:
+                self._idle.put(driver)
+                return
+        self._quit_driver(driver)
+
+
+# ===== GEMEINSAMER POOL =====
+
+_shared_pool: Optional[BrowserPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_browser_pool(chrome_driver_path: str, max_browsers: int = 2) -> BrowserPool:
+    """
+    Gibt den prozessweit gemeinsamen Browser-Pool zurück
+
+    Beide Scraper teilen sich diesen Pool, damit das Limit für gleichzeitige
+    Renderings global gilt (Speicher-Spitzen bei überlappenden Threads).
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = BrowserPool(chrome_driver_path, max_browsers=max_browsers)
+            atexit.register(_shared_pool.close)
+        return _shared_pool
@@ -7,17 +7,27 @@ Features:
 - Direkte KI-Kommunikation ohne JSON-Zwang
 - Intelligente Anrede-Erkennung
 - Debug-Modus für Troubleshooting
-- Batch-Verarbeitung mit Progress-Callback
+- Batch-Verarbeitung mit Progress-Callback (parallel, RPM/TPM-Budgets)
+- Wiederholung bei 429/5xx mit Backoff, gedrosselte Parallelität
+- Optional: Routing/Failover über mehrere Anbieter (api_config.json "routing")
 """
 import json
 import requests
 import os
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from dataclasses import dataclass, field
 
+from llm_client import get_llm_client, LLMHTTPError, RetryPolicy
+from llm_rate_limiter import LLMRateLimiter, get_llm_rate_limiter
+from llm_router import LLMRouter, LLMProvider
+from scrape_cache import LLMResponseCache
+
 # Logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -40,6 +50,7 @@ class GenerationResult:
     has_team: bool = False
     tokens_used: int = 0
     model_used: str = ""
+    cached: bool = False           # Antwort aus dem LLM-Response-Cache (keine Tokens verbraucht)
     placeholders_replaced: List[str] = field(default_factory=list)
     placeholders_missing: List[str] = field(default_factory=list)
     
@@ -52,6 +63,7 @@ class GenerationResult:
             'has_team': self.has_team,
             'tokens_used': self.tokens_used,
             'model_used': self.model_used,
+            'cached': self.cached,
             'placeholders_replaced': self.placeholders_replaced,
             'placeholders_missing': self.placeholders_missing
         }
@@ -132,25 +144,64 @@ class ComplimentGenerator:
         'staff', 'employees', 'wir sind', 'unser team', 'unsere mitarbeiter'
     ]
 
-    def __init__(self, api_config_file: str = "api_config.json", debug: bool = False):
+    def __init__(self, api_config_file: str = "api_config.json", debug: bool = False,
+                 cache_path: Optional[str] = "llm_cache.db", router_state_path: Optional[str] = "llm_router.db"):
         """
         Initialisiert den Generator
         
         Args:
             api_config_file: Pfad zur API-Konfiguration
             debug: Wenn True, werden Debug-Informationen geloggt
+            cache_path: SQLite-Datei für den LLM-Response-Cache (None = kein Cache)
+            router_state_path: SQLite-Datei für die Routing-Messwerte (None = nicht speichern)
         """
         self.debug = debug
+        self.api_config_file = api_config_file
+        self.router_state_path = router_state_path
         self.api_config = {}
         self.api_enabled = False
         self.api_key = ""
         self.api_base_url = ""
         self.api_model = "deepseek-chat"
         
+        # Parallele API-Requests in generate_for_companies (1 = sequentiell)
+        self.max_concurrency = 8
+        # RPM/TPM-Budgets des Anbieters (api_config.json: "rpm", "tpm")
+        self.rate_limiter = LLMRateLimiter()
+        # Wiederholungen bei 429/5xx/Timeout (api_config.json: "max_retries")
+        self.retry_policy = RetryPolicy()
+        # Mehrere Anbieter mit Failover (nur wenn in api_config.json aktiviert)
+        self.router: Optional[LLMRouter] = None
+        
+        # Response-Cache: gleiche Prompts (nach Platzhalter-Ersetzung) kosten nichts
+        self.response_cache = self._load_response_cache(cache_path)
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+        
         self._load_api_config(api_config_file)
     
+    def _load_response_cache(self, cache_path: Optional[str]) -> Optional[LLMResponseCache]:
+        """Öffnet den LLM-Response-Cache (None bei Fehler oder cache_path=None)"""
+        if not cache_path:
+            return None
+        try:
+            return LLMResponseCache(cache_path)
+        except Exception as e:
+            logger.warning(f"LLM-Cache nicht verfügbar ({cache_path}): {e}")
+            return None
+    
     def _load_api_config(self, config_file: str):
-        """Lädt API-Konfiguration aus Datei und Umgebungsvariablen"""
+        """
+        Lädt API-Konfiguration aus Datei und Umgebungsvariablen
+        
+        Optionale Felder pro API: "rpm" / "tpm" (Budgets pro Minute),
+        "max_concurrency" (parallele Requests bei Batch-Generierung),
+        "max_retries" (Wiederholungen bei vorübergehenden Fehlern),
+        "weight" / "latency_slo" / "cost_per_1k_tokens" (für das Routing)
+        
+        Mit "routing": {"enabled": true} verteilt der Router Requests auf
+        alle aktivierten Anbieter mit API-Key (siehe llm_router.py).
+        """
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
                 self.api_config = json.load(f)
@@ -169,6 +220,24 @@ class ComplimentGenerator:
             if not self.api_key:
                 self.api_key = api_settings.get('api_key', '')
             
+            self.max_concurrency = max(1, int(api_settings.get('max_concurrency', self.max_concurrency)))
+            # Ein Limiter pro Anbieter für alle Instanzen (Budget gilt pro Account)
+            self.rate_limiter = get_llm_rate_limiter(self.api_base_url or active_api,
+                                                     rpm=api_settings.get('rpm'), tpm=api_settings.get('tpm'))
+            self.retry_policy = RetryPolicy(max_retries=max(0, int(api_settings.get('max_retries', 4))))
+            
+            self.router = LLMRouter.from_config(self.api_config, self.router_state_path)
+            if self.router is not None:
+                names = [provider.name for provider in self.router.providers]
+                logger.info(f"🔀 Routing über {len(names)} Anbieter: {', '.join(names)}")
+                if not (self.api_enabled and self.api_key):
+                    # active_api nicht nutzbar: erster Anbieter des Routers als Standard
+                    primary = self.router.providers[0]
+                    self.api_enabled = True
+                    self.api_key = primary.api_key
+                    self.api_base_url = primary.base_url
+                    self.api_model = primary.model
+            
             if self.api_enabled and self.api_key:
                 logger.info(f"✅ API konfiguriert: {active_api} ({self.api_model})")
             else:
@@ -408,9 +477,86 @@ class ComplimentGenerator:
         return processed_text, replaced, missing
     
     def _call_api(self, system_prompt: str, user_prompt: str, 
-                  temperature: float = 0.7, max_tokens: int = 500) -> Dict[str, Any]:
+                  temperature: float = 0.7, max_tokens: int = 500,
+                  use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Ruft die KI-API auf (mit Response-Cache)
+        
+        Byte-gleiche Requests werden aus dem Cache beantwortet; laufen sie
+        gleichzeitig (Duplikate in einer Batch), geht nur einer an die API.
+        Mit Routing liegt eine Antwort unter Anbieter/Modell, das sie
+        tatsächlich erzeugt hat; gesucht wird in der Reihenfolge des Routers.
+        
+        Args:
+            use_cache: False = Cache nicht lesen (neue Variante erzwingen);
+                       die neue Antwort ersetzt den Cache-Eintrag
+        
+        Returns:
+            Dict mit 'text', 'success', 'error', 'tokens_used', 'model' (+ 'cached' bei Treffer)
         """
-        Ruft die KI-API auf
+        cache = self.response_cache
+        if cache is None or not self.api_enabled or not self.api_key:
+            return self._request_api(system_prompt, user_prompt, temperature, max_tokens)
+        
+        def make_key(model: Optional[str]) -> str:
+            return cache.make_key(model, system_prompt, user_prompt, temperature, max_tokens)
+        
+        candidates = None
+        if self.router is not None:
+            candidates = self.router.candidates()
+            keys = [make_key(f"{provider.name}/{provider.model}") for provider in candidates]
+            key = make_key(None)   # nur für gleichzeitige Duplikate
+        else:
+            key = make_key(self.api_model)
+            keys = [key]
+        
+        owner = False
+        try:
+            if use_cache:
+                # Gleicher Request schon unterwegs: auf dessen Antwort warten
+                with self._inflight_lock:
+                    waiting = self._inflight.get(key)
+                    if waiting is None:
+                        self._inflight[key] = threading.Event()
+                        owner = True
+                if waiting is not None:
+                    waiting.wait(timeout=60)
+                
+                cached = cache.get_first(keys)
+                if cached is not None:
+                    if self.debug:
+                        logger.debug(f"💾 LLM-Cache Treffer ({cached[1]} Tokens gespart)")
+                    return {
+                        'text': cached[0],
+                        'success': True,
+                        'error': None,
+                        'tokens_used': 0,
+                        'cached': True,
+                        'model': cached[2] or self.api_model
+                    }
+            
+            api_result = self._request_api(system_prompt, user_prompt, temperature, max_tokens, candidates)
+            if api_result['success'] and api_result['text']:
+                served_key = make_key(f"{api_result['provider']}/{api_result['model']}") \
+                    if candidates is not None else key
+                cache.store(served_key, api_result['text'], api_result['tokens_used'], api_result['model'])
+            return api_result
+        finally:
+            if owner:
+                with self._inflight_lock:
+                    self._inflight.pop(key).set()
+    
+    def _request_api(self, system_prompt: str, user_prompt: str,
+                     temperature: float = 0.7, max_tokens: int = 500,
+                     candidates: Optional[List[LLMProvider]] = None) -> Dict[str, Any]:
+        """
+        Sendet einen Request an die KI-API (ohne Cache)
+        
+        candidates: Optional - Anbieter-Reihenfolge beim Routing (Standard: router.candidates())
+        
+        Vorübergehende Fehler (429, 5xx, Timeout) werden nach retry_policy
+        wiederholt; bei 429 pausiert der gemeinsame rate_limiter alle
+        Requests an den Anbieter und senkt die Parallelität.
         
         Returns:
             Dict mit 'text', 'success', 'error', 'tokens_used'
@@ -423,13 +569,60 @@ class ComplimentGenerator:
                 'tokens_used': 0
             }
         
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json'
-        }
+        if self.debug:
+            logger.debug(f"API Request - Model: {self.api_model}")
+            logger.debug(f"System Prompt: {system_prompt[:200]}...")
+            logger.debug(f"User Prompt: {user_prompt[:200]}...")
+        
+        if self.router is not None:
+            return self._request_routed(system_prompt, user_prompt, temperature, max_tokens, candidates)
         
+        provider = LLMProvider(name='active', base_url=self.api_base_url, model=self.api_model,
+                               api_key=self.api_key, rate_limiter=self.rate_limiter)
+        return self._request_with_retries(provider, system_prompt, user_prompt, temperature, max_tokens,
+                                          self.retry_policy, timeout=45)
+    
+    def _request_routed(self, system_prompt: str, user_prompt: str, temperature: float, max_tokens: int,
+                        candidates: Optional[List[LLMProvider]] = None) -> Dict[str, Any]:
+        """
+        Request über den Router: Anbieter der Reihe nach bis zum Erfolg
+        
+        Solange ein weiterer Anbieter bereitsteht, wird nicht wiederholt
+        und nicht länger als das Latenz-SLO gewartet - der nächste
+        Anbieter ist schneller als Backoff. Der letzte Anbieter bekommt
+        die volle retry_policy und 45s Timeout. api_result['provider'] nennt
+        den Anbieter, der geantwortet hat.
+        """
+        candidates = candidates or self.router.candidates()
+        for position, provider in enumerate(candidates):
+            fallback = position < len(candidates) - 1
+            policy = RetryPolicy(max_retries=0) if fallback else self.retry_policy
+            timeout = min(45, provider.latency_slo) if fallback else 45
+            
+            start = time.monotonic()
+            api_result = self._request_with_retries(provider, system_prompt, user_prompt,
+                                                    temperature, max_tokens, policy, timeout)
+            elapsed = time.monotonic() - start
+            
+            if api_result['success']:
+                api_result['provider'] = provider.name
+                if self.router.record_success(provider, elapsed, api_result['tokens_used']):
+                    logger.info(f"🐌 {provider.name}: {elapsed:.1f}s über Latenz-SLO ({provider.latency_slo:.0f}s)")
+                return api_result
+            
+            self.router.record_failure(provider, elapsed, api_result['error'],
+                                       throttled=api_result.get('throttled', False))
+            if fallback:
+                logger.warning(f"🔀 {provider.name} fehlgeschlagen ({api_result['error']}) - "
+                               f"weiter mit {candidates[position + 1].name}")
+        return api_result
+    
+    def _request_with_retries(self, provider: LLMProvider, system_prompt: str, user_prompt: str,
+                              temperature: float, max_tokens: int, policy: RetryPolicy,
+                              timeout: float) -> Dict[str, Any]:
+        """Request an einen Anbieter mit Wiederholungen nach policy"""
         data = {
-            'model': self.api_model,
+            'model': provider.model,
             'messages': [
                 {'role': 'system', 'content': system_prompt},
                 {'role': 'user', 'content': user_prompt}
@@ -438,60 +631,73 @@ class ComplimentGenerator:
             'max_tokens': max_tokens
         }
         
-        if self.debug:
-            logger.debug(f"API Request - Model: {self.api_model}")
-            logger.debug(f"System Prompt: {system_prompt[:200]}...")
-            logger.debug(f"User Prompt: {user_prompt[:200]}...")
-        
+        attempt = 0
+        while True:
+            try:
+                return self._send_request(provider, data, system_prompt, user_prompt, max_tokens, timeout)
+            except requests.exceptions.RequestException as e:
+                delay = policy.delay(attempt, e)
+                throttled = isinstance(e, LLMHTTPError) and e.status_code == 429
+                if throttled:
+                    # Gilt für alle Requests an den Anbieter: die Pause wartet acquire ab
+                    provider.rate_limiter.throttled(delay)
+                
+                if attempt >= policy.max_retries or not policy.is_retryable(e):
+                    suffix = f' (nach {attempt + 1} Versuchen)' if attempt else ''
+                    if isinstance(e, requests.exceptions.Timeout):
+                        error = f'API-Timeout ({timeout:.0f}s){suffix}'
+                    else:
+                        error = f'API-Fehler{suffix}: {str(e)}'
+                    return {
+                        'text': '',
+                        'success': False,
+                        'error': error,
+                        'tokens_used': 0,
+                        'throttled': throttled
+                    }
+                
+                attempt += 1
+                if not throttled:
+                    logger.warning(f"🔁 API-Fehler ({e}) - Versuch {attempt + 1} in {delay:.1f}s")
+                    time.sleep(delay)
+            except (KeyError, IndexError, json.JSONDecodeError) as e:
+                return {
+                    'text': '',
+                    'success': False,
+                    'error': f'Response-Parsing fehlgeschlagen: {str(e)}',
+                    'tokens_used': 0
+                }
+    
+    def _send_request(self, provider: LLMProvider, data: Dict[str, Any], system_prompt: str,
+                      user_prompt: str, max_tokens: int, timeout: float) -> Dict[str, Any]:
+        """Ein Versuch innerhalb des RPM/TPM-Budgets (Fehler als Exception)"""
+        # RPM/TPM-Budget und Drosselung (wartet ggf., bis der Request erlaubt ist)
+        reservation = provider.rate_limiter.acquire(len(system_prompt) + len(user_prompt), max_tokens)
+        tokens = 0
         try:
-            response = requests.post(
-                f"{self.api_base_url}/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=45
-            )
-            response.raise_for_status()
-            
-            result = response.json()
+            # Gemeinsamer Client: Keep-Alive-Verbindungen statt neuem TLS-Handshake pro Request
+            result = get_llm_client().chat_completion(provider.base_url, provider.api_key, data, timeout=timeout)
             
             text = result['choices'][0]['message']['content'].strip()
             tokens = result.get('usage', {}).get('total_tokens', 0)
-            
-            if self.debug:
-                logger.debug(f"API Response: {text[:200]}...")
-                logger.debug(f"Tokens used: {tokens}")
-            
-            return {
-                'text': text,
-                'success': True,
-                'error': None,
-                'tokens_used': tokens
-            }
-            
-        except requests.exceptions.Timeout:
-            return {
-                'text': '',
-                'success': False,
-                'error': 'API-Timeout (45s)',
-                'tokens_used': 0
-            }
-        except requests.exceptions.RequestException as e:
-            return {
-                'text': '',
-                'success': False,
-                'error': f'API-Fehler: {str(e)}',
-                'tokens_used': 0
-            }
-        except (KeyError, IndexError, json.JSONDecodeError) as e:
-            return {
-                'text': '',
-                'success': False,
-                'error': f'Response-Parsing fehlgeschlagen: {str(e)}',
-                'tokens_used': 0
-            }
+        finally:
+            provider.rate_limiter.record(reservation, tokens)
+        
+        if self.debug:
+            logger.debug(f"API Response ({provider.name}): {text[:200]}...")
+            logger.debug(f"Tokens used: {tokens}")
+        
+        return {
+            'text': text,
+            'success': True,
+            'error': None,
+            'tokens_used': tokens,
+            'model': provider.model
+        }
     
     def generate(self, company, prompt: str, system_prompt: str = None,
-                 temperature: float = 0.7, max_tokens: int = 500) -> GenerationResult:
+                 temperature: float = 0.7, max_tokens: int = 500,
+                 use_cache: bool = True) -> GenerationResult:
         """
         Generiert Text für eine Company basierend auf Custom Prompt
         
@@ -501,9 +707,33 @@ class ComplimentGenerator:
             system_prompt: Optional - System-Prompt für die KI
             temperature: Kreativität (0.0-1.0)
             max_tokens: Max. Länge der Antwort
+            use_cache: False = neue Antwort erzwingen (z.B. "Neu generieren")
         
         Returns:
-            GenerationResult mit generiertem Text
+            GenerationResult mit generiertem Text (result.cached = aus dem Cache)
+        """
+        result, placeholders, processed_system, processed_prompt = self._prepare_generation(
+            company, prompt, system_prompt
+        )
+        
+        # API aufrufen
+        api_result = self._call_api(
+            processed_system, 
+            processed_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            use_cache=use_cache
+        )
+        
+        return self._complete_generation(result, placeholders, api_result)
+    
+    def _prepare_generation(self, company, prompt: str,
+                            system_prompt: str = None) -> Tuple[GenerationResult, Dict[str, str], str, str]:
+        """
+        Baut Platzhalter und Prompts für eine Company (ohne API-Aufruf)
+        
+        Returns:
+            Tuple: (result, placeholders, processed_system, processed_prompt)
         """
         result = GenerationResult()
         result.model_used = self.api_model
@@ -537,18 +767,17 @@ class ComplimentGenerator:
         if critical_missing:
             logger.warning(f"⚠️ Wichtige Platzhalter fehlen: {critical_missing}")
         
-        # API aufrufen
-        api_result = self._call_api(
-            processed_system, 
-            processed_prompt,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
-        
+        return result, placeholders, processed_system, processed_prompt
+    
+    def _complete_generation(self, result: GenerationResult, placeholders: Dict[str, str],
+                             api_result: Dict[str, Any]) -> GenerationResult:
+        """Übernimmt die API-Antwort und bewertet die Datenqualität"""
         result.text = api_result['text']
         result.success = api_result['success']
         result.error = api_result['error']
         result.tokens_used = api_result['tokens_used']
+        result.cached = api_result.get('cached', False)
+        result.model_used = api_result.get('model', result.model_used)
         
         # Team-Erkennung aus Review-Keywords
         review_keywords = placeholders.get('{review_keywords}', '')
@@ -568,14 +797,16 @@ class ComplimentGenerator:
             confidence += 5
         result.confidence_score = min(confidence, 100)
         
-        if result.success:
+        if result.cached:
+            logger.info("✅ Text aus Cache (0 Tokens)")
+        elif result.success:
             logger.info(f"✅ Text generiert ({result.tokens_used} Tokens)")
         else:
             logger.error(f"❌ Generierung fehlgeschlagen: {result.error}")
         
         return result
     
-    def generate_compliment(self, company, prompt_id: str = None) -> Dict[str, Any]:
+    def generate_compliment(self, company, prompt_id: str = None, use_cache: bool = True) -> Dict[str, Any]:
         """
         Legacy-Methode für Rückwärts-Kompatibilität
         
@@ -598,7 +829,7 @@ Das Kompliment soll:
 
 Schreibe NUR das Kompliment, keine Einleitung oder Erklärung."""
 
-        result = self.generate(company, default_prompt)
+        result = self.generate(company, default_prompt, use_cache=use_cache)
         
         return {
             'compliment': result.text,
@@ -610,7 +841,9 @@ Schreibe NUR das Kompliment, keine Einleitung oder Erklärung."""
     def generate_for_companies(self, companies: List, prompt: str, 
                                system_prompt: str = None,
                                progress_callback: Callable = None,
-                               save_to_field: str = 'compliment') -> Dict[str, int]:
+                               save_to_field: str = 'compliment',
+                               max_concurrency: Optional[int] = None,
+                               use_cache: bool = True) -> Dict[str, int]:
         """
         Generiert Texte für mehrere Companies
         
@@ -620,47 +853,140 @@ Schreibe NUR das Kompliment, keine Einleitung oder Erklärung."""
             system_prompt: Optional - System-Prompt
             progress_callback: Optional - Funktion(current, total, company_name)
             save_to_field: Feld in dem das Ergebnis gespeichert wird
+            max_concurrency: Optional - parallele API-Requests (Standard: self.max_concurrency)
+            use_cache: False = Cache nicht lesen, alle Texte neu generieren
+        
+        Parallel laufen nur die API-Requests (innerhalb der RPM/TPM-Budgets
+        des rate_limiter). Platzhalter, Speichern und progress_callback
+        bleiben im aufrufenden Thread - Company-Objekte (z.B. SQLAlchemy)
+        werden nie aus Worker-Threads angefasst.
         
         Returns:
-            Dict: {'success': int, 'errors': int, 'total': int}
+            Dict: {'success': int, 'errors': int, 'total': int, 'cached': int}
         """
-        stats = {'success': 0, 'errors': 0, 'total': len(companies)}
+        stats = {'success': 0, 'errors': 0, 'total': len(companies), 'cached': 0}
+        concurrency = min(max_concurrency or self.max_concurrency, len(companies))
         
-        for idx, company in enumerate(companies):
-            try:
-                if progress_callback:
-                    name = getattr(company, 'name', None) or getattr(company, 'website', 'Unbekannt')
-                    progress_callback(idx + 1, len(companies), name)
-                
-                result = self.generate(company, prompt, system_prompt)
-                
-                if result.success:
-                    # Speichere Ergebnis
-                    if hasattr(company, save_to_field):
-                        setattr(company, save_to_field, result.text)
-                    elif hasattr(company, 'attributes'):
-                        if company.attributes is None:
-                            company.attributes = {}
-                        company.attributes[save_to_field] = result.text
-                    
-                    # Zusätzliche Felder wenn vorhanden
-                    if hasattr(company, 'confidence_score'):
-                        company.confidence_score = result.confidence_score
-                    if hasattr(company, 'has_team'):
-                        company.has_team = result.has_team
+        if concurrency > 1:
+            self._generate_concurrent(companies, prompt, system_prompt, progress_callback,
+                                      save_to_field, concurrency, stats, use_cache)
+        else:
+            for idx, company in enumerate(companies):
+                try:
+                    if progress_callback:
+                        progress_callback(idx + 1, len(companies), self._company_label(company))
                     
-                    stats['success'] += 1
-                else:
-                    logger.error(f"Fehler bei {getattr(company, 'name', '?')}: {result.error}")
+                    result = self.generate(company, prompt, system_prompt, use_cache=use_cache)
+                    self._store_result(company, result, save_to_field, stats)
+                        
+                except Exception as e:
+                    logger.error(f"Exception bei Company: {e}")
                     stats['errors'] += 1
-                    
-            except Exception as e:
-                logger.error(f"Exception bei Company: {e}")
-                stats['errors'] += 1
         
-        logger.info(f"📊 Generierung abgeschlossen: {stats['success']}/{stats['total']} erfolgreich")
+        logger.info(f"📊 Generierung abgeschlossen: {stats['success']}/{stats['total']} erfolgreich"
+                    f" ({stats['cached']} aus Cache)")
+        
+        if self.router is not None:
+            # Gemessene Latenz/Fehlerquote/Kosten für die Auswahl in späteren Läufen (llm_router.db)
+            self.router.save()
         return stats
     
+    def _generate_concurrent(self, companies: List, prompt: str, system_prompt: Optional[str],
+                             progress_callback: Optional[Callable], save_to_field: str,
+                             concurrency: int, stats: Dict[str, int], use_cache: bool = True):
+        """
+        generate_for_companies mit parallelen API-Requests
+        
+        Max. concurrency Requests gleichzeitig unterwegs; neue Prompts werden
+        erst vorbereitet, wenn ein Platz frei wird. progress_callback meldet
+        fertige Companies (in Reihenfolge der Fertigstellung).
+        """
+        total = len(companies)
+        queue = iter(companies)
+        completed = 0
+        
+        logger.info(f"⚡ Parallele Generierung: {total} Companies, max. {concurrency} Requests gleichzeitig")
+        
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='llm') as executor:
+            in_flight = {}   # Future → (company, result, placeholders)
+            
+            def report(company):
+                nonlocal completed
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total, self._company_label(company))
+            
+            def submit_next() -> bool:
+                company = next(queue, None)
+                if company is None:
+                    return False
+                try:
+                    result, placeholders, processed_system, processed_prompt = self._prepare_generation(
+                        company, prompt, system_prompt
+                    )
+                except Exception as e:
+                    logger.error(f"Exception bei Company: {e}")
+                    stats['errors'] += 1
+                    report(company)
+                    return True
+                future = executor.submit(self._call_api, processed_system, processed_prompt, use_cache=use_cache)
+                in_flight[future] = (company, result, placeholders)
+                return True
+            
+            while len(in_flight) < concurrency and submit_next():
+                pass
+            
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    company, result, placeholders = in_flight.pop(future)
+                    try:
+                        result = self._complete_generation(result, placeholders, future.result())
+                        self._store_result(company, result, save_to_field, stats)
+                    except Exception as e:
+                        logger.error(f"Exception bei Company: {e}")
+                        stats['errors'] += 1
+                    report(company)
+                    
+                    while len(in_flight) < concurrency and submit_next():
+                        pass
+        
+        limiter_stats = self.rate_limiter.stats()
+        if limiter_stats['wait_total']:
+            logger.info(f"⏳ Wartezeit durch RPM/TPM-Budget: {limiter_stats['wait_total']:.1f}s")
+        if limiter_stats['throttled']:
+            logger.info(f"🐢 {limiter_stats['throttled']}x gedrosselt (429), "
+                        f"zuletzt max. {limiter_stats['concurrency_limit']} Requests gleichzeitig")
+    
+    @staticmethod
+    def _company_label(company) -> str:
+        return getattr(company, 'name', None) or getattr(company, 'website', 'Unbekannt')
+    
+    def _store_result(self, company, result: GenerationResult, save_to_field: str, stats: Dict[str, int]):
+        """Speichert ein Ergebnis an der Company und zählt Erfolg/Fehler"""
+        if result.success:
+            # Speichere Ergebnis
+            if hasattr(company, save_to_field):
+                setattr(company, save_to_field, result.text)
+            elif hasattr(company, 'attributes'):
+                if company.attributes is None:
+                    company.attributes = {}
+                company.attributes[save_to_field] = result.text
+            
+            # Zusätzliche Felder wenn vorhanden
+            if hasattr(company, 'confidence_score'):
+                company.confidence_score = result.confidence_score
+            if hasattr(company, 'has_team'):
+                company.has_team = result.has_team
+            
+            stats['success'] += 1
+            if result.cached:
+                stats['cached'] += 1
+        else:
+            logger.error(f"Fehler bei {getattr(company, 'name', '?')}: {result.error}")
+            stats['errors'] += 1
+    
     def preview_placeholders(self, company) -> Dict[str, str]:
         """
         Zeigt alle verfügbaren Platzhalter und ihre Werte für eine Company
@@ -725,19 +1051,22 @@ class AIColumnProcessor(ComplimentGenerator):
         """Alias für _build_placeholders"""
         return self._build_placeholders(company)
     
-    def process_prompt(self, prompt: str, company, system_prompt: str = None) -> Optional[str]:
+    def process_prompt(self, prompt: str, company, system_prompt: str = None,
+                       use_cache: bool = True) -> Optional[str]:
         """
         Führt einen Prompt für eine Company aus
         
         Returns:
             str: Ergebnis-Text oder None bei Fehler
         """
-        result = self.generate(company, prompt, system_prompt)
+        result = self.generate(company, prompt, system_prompt, use_cache=use_cache)
         return result.text if result.success else None
     
     def process_column_for_companies(self, companies: List, column_name: str, 
                                      prompt: str, system_prompt: str = None,
-                                     progress_callback: Callable = None) -> Dict[str, int]:
+                                     progress_callback: Callable = None,
+                                     max_concurrency: Optional[int] = None,
+                                     use_cache: bool = True) -> Dict[str, int]:
         """
         Führt Prompt für alle Companies aus und speichert in custom column
         """
@@ -746,7 +1075,9 @@ class AIColumnProcessor(ComplimentGenerator):
             prompt=prompt,
             system_prompt=system_prompt,
             progress_callback=progress_callback,
-            save_to_field=column_name
+            save_to_field=column_name,
+            max_concurrency=max_concurrency,
+            use_cache=use_cache
         )
 
 
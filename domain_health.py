@@ -0,0 +1,284 @@
+"""
+Domain Health - Circuit Breaker und adaptive Timeouts pro Domain
+
+Tote oder hängende Websites (häufig in Google-Maps-Exporten) kosten ohne
+Schutz jedes Mal die vollen Timeouts. Der Tracker merkt sich pro Domain
+Verbindungsfehler und Latenzen:
+
+Features:
+- Fail-fast: nach DNS-Fehler bzw. wiederholten Verbindungsfehlern (Connect,
+  nicht Lese-Timeouts) gilt die Domain als tot, weitere Requests scheitern
+  sofort (DomainDeadError). Gleichzeitige Requests (z.B. die parallelen
+  Pfad-Proben eines Leads) zählen dabei als ein Versuch.
+- Adaptive Timeouts aus den beobachteten Latenz-Perzentilen
+- Persistenz (SQLite): tote Domains werden auch in späteren Läufen für
+  dead_ttl übersprungen
+"""
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+
+from scrape_cache import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+Timeout = Union[float, Tuple[float, float], None]
+
+
+class DomainDeadError(requests.exceptions.ConnectionError):
+    """Request wurde nicht gesendet: Domain ist als tot markiert"""
+
+
+@dataclass
+class DomainState:
+    """Laufzeit-Zustand einer Domain"""
+    failures: int = 0
+    dead_until: float = 0.0        # time.time()
+    last_failure: float = 0.0      # time.monotonic() des letzten verbuchten Fehlers
+    latencies: deque = field(default_factory=lambda: deque(maxlen=20))
+
+
+class DomainHealthStore(SQLiteStore):
+    """Persistente Liste toter Domains"""
+
+    def _create_table(self, conn: sqlite3.Connection):
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.table} (
+                key TEXT PRIMARY KEY,
+                reason TEXT,
+                failures INTEGER NOT NULL,
+                expires_at REAL,
+                updated_at REAL NOT NULL
+            )
+        """)
+
+    def dead_until(self, domain: str) -> float:
+        """Ende der Sperre (time.time()) oder 0.0"""
+        row = self._connect().execute(
+            f"SELECT expires_at FROM {self.table} WHERE key = ?", (domain,)
+        ).fetchone()
+        return row[0] if row and row[0] and row[0] > time.time() else 0.0
+
+    def mark_dead(self, domain: str, until: float, reason: str, failures: int):
+        self._connect().execute(
+            f"INSERT OR REPLACE INTO {self.table} (key, reason, failures, expires_at, updated_at) "
+            f"VALUES (?, ?, ?, ?, ?)",
+            (domain, reason, failures, until, time.time())
+        )
+        self._after_write()
+
+
+class DomainHealth:
+    """
+    Gesundheits-Tracker für Domains
+
+    Verwendung (macht ScraperSession automatisch):
+        if health.is_dead(url): ...                      # fail fast
+        timeout = health.timeout_for(url, (5, 15))       # adaptiver Timeout
+        health.record_success(url, elapsed) / health.record_failure(url, exc, started)
+    """
+
+    def __init__(self, db_path: str = "domain_health.db", failure_threshold: int = 2,
+                 dead_ttl: float = 3 * 24 * 3600, connect_timeout: float = 5.0,
+                 min_timeout: float = 4.0, latency_factor: float = 4.0,
+                 min_samples: int = 20, max_entries: int = 50000):
+        """
+        Args:
+            db_path: SQLite-Datei für tote Domains (None = nur im Speicher)
+            failure_threshold: Verbindungsfehler in Folge bis "tot" (DNS-Fehler: sofort)
+            dead_ttl: Wie lange eine tote Domain übersprungen wird (Sekunden)
+            connect_timeout: Obergrenze für den Verbindungsaufbau (Sekunden)
+            min_timeout: Untergrenze für adaptive Lese-Timeouts (Sekunden)
+            latency_factor: Lese-Timeout = p95-Latenz × Faktor
+            min_samples: Messwerte, ab denen Timeouts angepasst werden
+            max_entries: Max. gespeicherte tote Domains
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.dead_ttl = dead_ttl
+        self.connect_timeout = connect_timeout
+        self.min_timeout = min_timeout
+        self.latency_factor = latency_factor
+        self.min_samples = min_samples
+
+        self.store = DomainHealthStore(db_path, table='dead_domains', max_entries=max_entries) if db_path else None
+
+        self._domains: Dict[str, DomainState] = {}
+        self._latencies = deque(maxlen=500)   # alle Domains
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def domain_key(url: str) -> str:
+        """Domain einer URL (klein, ohne www. und Port)"""
+        host = (urlparse(url).hostname or url).lower()
+        return host[4:] if host.startswith('www.') else host
+
+    def _state(self, domain: str) -> DomainState:
+        """Zustand einer Domain (beim ersten Zugriff aus SQLite geladen)"""
+        with self._lock:
+            state = self._domains.get(domain)
+            if state is not None:
+                return state
+
+        state = DomainState()
+        if self.store is not None:
+            try:
+                state.dead_until = self.store.dead_until(domain)
+            except sqlite3.Error as e:
+                logger.debug(f"Domain-Health lesen fehlgeschlagen: {e}")
+
+        with self._lock:
+            return self._domains.setdefault(domain, state)
+
+    # ===== CIRCUIT BREAKER =====
+
+    def is_dead(self, url: str) -> bool:
+        """True wenn Requests an die Domain übersprungen werden sollen"""
+        return self._state(self.domain_key(url)).dead_until > time.time()
+
+    def record_success(self, url: str, elapsed: float):
+        """Antwort erhalten (egal welcher Status) - Domain lebt"""
+        state = self._state(self.domain_key(url))
+        with self._lock:
+            state.failures = 0
+            state.latencies.append(elapsed)
+            self._latencies.append(elapsed)
+
+    def record_failure(self, url: str, error: Exception, started: Optional[float] = None) -> bool:
+        """
+        Verbindungsfehler verbuchen
+
+        Args:
+            started: time.monotonic() beim Senden des Requests. Requests, die
+                vor dem letzten verbuchten Fehler gestartet wurden, liefen
+                gleichzeitig mit ihm und zählen nicht als weiterer Fehler in Folge.
+
+        Returns:
+            True wenn die Domain dadurch als tot markiert wurde
+        """
+        domain = self.domain_key(url)
+        state = self._state(domain)
+        dns_failure = self.is_dns_failure(error)
+
+        with self._lock:
+            if started is None or started >= state.last_failure:
+                state.failures += 1
+                state.last_failure = time.monotonic()
+            failures = state.failures
+            if state.dead_until > time.time():
+                return False
+            if not dns_failure and failures < self.failure_threshold:
+                return False
+            state.dead_until = time.time() + self.dead_ttl
+
+        reason = 'dns' if dns_failure else type(error).__name__
+        logger.warning(f"💀 Domain {domain} als tot markiert ({reason}, {failures} Fehler) - "
+                       f"übersprungen für {self.dead_ttl / 3600:.0f}h")
+
+        if self.store is not None:
+            try:
+                self.store.mark_dead(domain, state.dead_until, reason, failures)
+            except sqlite3.Error as e:
+                logger.debug(f"Domain-Health speichern fehlgeschlagen: {e}")
+        return True
+
+    def revive(self, url: str):
+        """Hebt die Sperre einer Domain auf"""
+        domain = self.domain_key(url)
+        with self._lock:
+            self._domains.pop(domain, None)
+        if self.store is not None:
+            self.store.delete(domain)
+
+    @staticmethod
+    def is_dns_failure(error: Exception) -> bool:
+        """Erkennt Namensauflösungs-Fehler (Domain existiert nicht)"""
+        text = str(error)
+        return any(marker in text for marker in (
+            'NameResolutionError', 'Name or service not known', 'nodename nor servname',
+            'getaddrinfo failed', 'No address associated with hostname', 'Temporary failure in name resolution',
+        ))
+
+    @staticmethod
+    def is_connection_failure(error: Exception) -> bool:
+        """
+        Fehler, die auf eine tote Domain hindeuten: DNS, Verbindungsaufbau
+
+        Lese-Timeouts (ReadTimeout) zählen nicht - die Domain antwortet,
+        nur langsam. HTTP-Status zählt ebenfalls nicht.
+        """
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.ConnectTimeout))
+
+    # ===== ADAPTIVE TIMEOUTS =====
+
+    def latency_percentile(self, p: float, url: Optional[str] = None) -> Optional[float]:
+        """Latenz-Perzentil (Sekunden) der Domain bzw. aller Domains; None = zu wenig Daten"""
+        with self._lock:
+            samples = list(self._latencies)
+            if url is not None:
+                state = self._domains.get(self.domain_key(url))
+                if state is not None and len(state.latencies) >= 5:
+                    samples = list(state.latencies)
+                elif len(samples) < self.min_samples:
+                    return None
+            elif len(samples) < self.min_samples:
+                return None
+
+        samples.sort()
+        return samples[min(len(samples) - 1, int(len(samples) * p / 100))]
+
+    def timeout_for(self, url: str, timeout: Timeout) -> Timeout:
+        """
+        Passt einen requests-Timeout an die beobachteten Latenzen an
+
+        Der Aufrufer-Timeout bleibt die Obergrenze: Verbindungsaufbau max.
+        connect_timeout, Lesen max. p95 × latency_factor (min. min_timeout).
+        """
+        if timeout is None:
+            return None
+
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        connect = min(connect, self.connect_timeout)
+
+        p95 = self.latency_percentile(95, url)
+        if p95 is not None:
+            read = min(read, max(self.min_timeout, p95 * self.latency_factor))
+
+        return (connect, read)
+
+    # ===== STATISTIK =====
+
+    def stats(self) -> Dict:
+        """Übersicht: bekannte/tote Domains und Latenz-Perzentile"""
+        now = time.time()
+        with self._lock:
+            dead = sum(1 for state in self._domains.values() if state.dead_until > now)
+            known = len(self._domains)
+        return {
+            'domains': known,
+            'dead': dead,
+            'p50': self.latency_percentile(50),
+            'p95': self.latency_percentile(95),
+        }
+
+
+# ===== GEMEINSAMER TRACKER =====
+
+_shared_health: Dict[str, DomainHealth] = {}
+_shared_health_lock = threading.Lock()
+
+
+def get_domain_health(db_path: str = "domain_health.db") -> DomainHealth:
+    """Gibt den prozessweit gemeinsamen Tracker für db_path zurück"""
+    with _shared_health_lock:
+        health = _shared_health.get(db_path)
+        if health is None:
+            health = DomainHealth(db_path)
+            _shared_health[db_path] = health
+        return health
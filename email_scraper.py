@@ -3,17 +3,17 @@ Email Scraper - Extrahiert E-Mail-Adressen von Websites
 VERBESSERTE VERSION mit hoher Erfolgsquote + Verschleierungs-Erkennung
 """
 import requests
-from bs4 import BeautifulSoup
 import re
 import logging
 from urllib.parse import urljoin, urlparse, unquote
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import WebDriverException, TimeoutException as SeleniumTimeout
 from webdriver_manager.chrome import ChromeDriverManager
-import time
 import html
+from bs4 import Comment
+
+from page_fetcher import get_page_fetcher, DEFAULT_HEADERS
+from browser_pool import get_browser_pool
+from html_document import HtmlDocument, parse_html, resolve_html_parser
 
 # Versuche dotenv zu laden (optional)
 try:
@@ -32,13 +32,51 @@ except ImportError:
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# ===== E-MAIL-VERSCHLEIERUNG =====
+# Alle Varianten in einem kompilierten Pattern (ein Durchlauf statt ~40 re.sub),
+# nach Anfangszeichen zusammengefasst. Groß-/Kleinschreibung egal ((AT), [Punkt], ...).
+
+# @: (at) [at] {at} _at_ -at- /at/ (ät) [ät], " at " / " ät ", &#64; &#x40;
+_AT_VARIANTS = (
+    r'\s*(?:\((?:at|ät)\)|\[(?:at|ät)\]|\{at\}|_at_|-at-|/at/)\s*'
+    r'|\s+(?:at|ät)\s+'
+    r'|&#64;|&#x40;'
+)
+
+# .: (punkt) [punkt] {punkt} _punkt_ -punkt-, dito "dot" und /dot/, (.) [.],
+#    " punkt " / " dot ", &#46; &#x2E;
+_DOT_VARIANTS = (
+    r'\s*(?:\((?:punkt|dot|\.)\)|\[(?:punkt|dot|\.)\]|\{(?:punkt|dot)\}'
+    r'|_(?:punkt|dot)_|-(?:punkt|dot)-|/dot/)\s*'
+    r'|\s+(?:punkt|dot)\s+'
+    r'|&#46;|&#x2E;'
+)
+
+# Lookahead: Positionen ohne passendes Anfangszeichen werden sofort übersprungen
+OBFUSCATION_PATTERN = re.compile(
+    fr'(?=[\s(\[{{_\-/&])(?:(?P<at>{_AT_VARIANTS})|(?P<dot>{_DOT_VARIANTS}))', re.IGNORECASE
+)
+
+
+def _replace_obfuscation(match):
+    return '@' if match.lastgroup == 'at' else '.'
+
+
 class EmailScraper:
     """Scraped E-Mail-Adressen von Websites mit Selenium für JS-Seiten"""
 
-    def __init__(self, deepseek_api_key=None, use_llm_fallback=False):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+    def __init__(self, deepseek_api_key=None, use_llm_fallback=False, http_cache_path="http_cache.db",
+                 html_parser=None, use_selenium=True, health_path="domain_health.db"):
+        self.headers = dict(DEFAULT_HEADERS)
+
+        # Gemeinsamer Page-Fetcher mit dem Impressum-Scraper: gleiche Session
+        # (Response-Cache, Rate Limiting pro Host, Fail-fast für tote Domains)
+        # und Seiten-Cache - Homepage/Impressum werden pro Lauf nur einmal geladen
+        self.fetcher = get_page_fetcher(http_cache_path, health_path)
+        self.session = self.fetcher.session
+
+        # BeautifulSoup-Backend ('lxml' wenn installiert, sonst 'html.parser')
+        self.html_parser = resolve_html_parser(html_parser)
 
         # E-Mail Regex Pattern - Mehrere Patterns für bessere Erkennung
         self.email_patterns = [
@@ -47,14 +85,15 @@ class EmailScraper:
             re.compile(r'["\']([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})["\']'),
         ]
 
-        # Chrome driver setup
-        try:
-            self.chrome_driver_path = ChromeDriverManager().install()
-            self.use_selenium = True
-        except Exception as e:
-            self.chrome_driver_path = None
-            self.use_selenium = False
-            logging.warning(f"ChromeDriver nicht verfügbar - nur requests: {e}")
+        # Chrome driver setup (use_selenium=False: nur requests, z.B. für Offline-Benchmarks)
+        self.chrome_driver_path = None
+        self.use_selenium = False
+        if use_selenium:
+            try:
+                self.chrome_driver_path = ChromeDriverManager().install()
+                self.use_selenium = True
+            except Exception as e:
+                logging.warning(f"ChromeDriver nicht verfügbar - nur requests: {e}")
 
         # Spam-Keywords erweitert
         self.spam_keywords = [
@@ -93,14 +132,14 @@ class EmailScraper:
         return website
 
     def find_contact_pages(self, base_url, html):
-        """Findet Kontakt/Impressum-Seiten"""
-        soup = BeautifulSoup(html, 'html.parser')
+        """Findet Kontakt/Impressum-Seiten (html: HTML-String oder HtmlDocument)"""
+        doc = HtmlDocument.of(html, url=base_url, parser=self.html_parser)
         contact_urls = []
 
         # Suche nach Links mit Kontakt/Impressum Keywords
         keywords = ['kontakt', 'contact', 'impressum', 'imprint', 'about', 'über']
 
-        for link in soup.find_all('a', href=True):
+        for link in doc.link_tags:
             href = link.get('href', '').lower()
             text = link.get_text('', strip=True).lower()
 
@@ -120,44 +159,15 @@ class EmailScraper:
             return text
 
         # HTML Entities dekodieren (&#64; → @, &#46; → ., etc.)
-        text = html.unescape(text)
+        if '&' in text:
+            text = html.unescape(text)
 
         # URL-Encoding dekodieren (%40 → @, %2E → .)
-        text = text.replace('%40', '@').replace('%2E', '.')
-
-        # @-Ersetzungen (alle Varianten: Klammern, Brackets, Leerzeichen, etc.)
-        at_replacements = [
-            # Deutsch
-            r'\s*\(at\)\s*', r'\s*\[at\]\s*', r'\s*\{at\}\s*',
-            r'\s*_at_\s*', r'\s*-at-\s*', r'\s+at\s+', r'\s*/at/\s*',
-            r'\s*\(ät\)\s*', r'\s*\[ät\]\s*', r'\s+ät\s+',
-            # Englisch
-            r'\s*\(AT\)\s*', r'\s*\[AT\]\s*', r'\s*\{AT\}\s*',
-            r'\s*_AT_\s*', r'\s*-AT-\s*', r'\s+AT\s+',
-            # HTML Entities (bereits dekodiert oben, aber zur Sicherheit)
-            r'&#64;', r'&#x40;',
-        ]
-
-        for pattern in at_replacements:
-            text = re.sub(pattern, '@', text, flags=re.IGNORECASE)
-
-        # Punkt-Ersetzungen für Domain-Endung
-        dot_replacements = [
-            # Deutsch
-            r'\s*\(punkt\)\s*', r'\s*\[punkt\]\s*', r'\s*\{punkt\}\s*',
-            r'\s*_punkt_\s*', r'\s*-punkt-\s*', r'\s+punkt\s+',
-            r'\s*\(dot\)\s*', r'\s*\[dot\]\s*', r'\s*\{dot\}\s*',
-            r'\s*_dot_\s*', r'\s*-dot-\s*', r'\s+dot\s+', r'\s*/dot/\s*',
-            # Nur einzelner Punkt in Klammern/Brackets
-            r'\s*\(\.\)\s*', r'\s*\[\.\]\s*',
-            # HTML Entities
-            r'&#46;', r'&#x2E;',
-        ]
-
-        for pattern in dot_replacements:
-            text = re.sub(pattern, '.', text, flags=re.IGNORECASE)
+        if '%' in text:
+            text = text.replace('%40', '@').replace('%2E', '.')
 
-        return text
+        # Alle @- und Punkt-Varianten in EINEM Durchlauf ersetzen
+        return OBFUSCATION_PATTERN.sub(_replace_obfuscation, text)
 
     def validate_email(self, email):
         """
@@ -277,7 +287,7 @@ E-MAIL-ADRESSEN:"""
         emails = set()
 
         # Entferne Script und Style Tags
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = parse_html(html, self.html_parser)
         for script in soup(["script", "style"]):
             script.decompose()
 
@@ -317,8 +327,8 @@ E-MAIL-ADRESSEN:"""
                     if self.validate_email(decoded_attr):
                         emails.add(decoded_attr.lower())
 
-        # 5. Suche in HTML-Kommentaren
-        for comment in soup.find_all(string=lambda t: isinstance(t, str)):
+        # 5. Suche in HTML-Kommentaren (Text-Knoten sind in Schritt 1-3 bereits abgedeckt)
+        for comment in soup.find_all(string=lambda t: isinstance(t, Comment)):
             decoded_comment = self.decode_obfuscated_emails(str(comment))
             for pattern in self.email_patterns:
                 matches = pattern.findall(decoded_comment)
@@ -354,26 +364,12 @@ E-MAIL-ADRESSEN:"""
         return self.extract_emails_advanced(html)
 
     def get_with_selenium(self, url):
-        """Lädt Seite mit Selenium für JS-Rendering"""
-        driver = None
-        try:
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        """Lädt Seite mit Selenium für JS-Rendering (Browser aus dem gemeinsamen Pool)"""
+        pool = get_browser_pool(self.chrome_driver_path)
 
-            service = Service(self.chrome_driver_path)
-            driver = webdriver.Chrome(service=service, options=options)
-
-            driver.set_page_load_timeout(15)
-            driver.get(url)
-
-            # Warte auf JS-Rendering
-            time.sleep(3)
-
-            return driver.page_source
+        try:
+            # Fertig sobald mailto-Link, @-Zeichen oder Netzwerk-Ruhe erkannt
+            return pool.render(url, keywords=('@',), timeout=8, page_load_timeout=15)
 
         except SeleniumTimeout:
             logging.warning(f"Selenium-Timeout bei {url}")
@@ -384,18 +380,18 @@ E-MAIL-ADRESSEN:"""
         except Exception as e:
             logging.error(f"Selenium-Fehler: {e}")
             return None
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except WebDriverException:
-                    pass  # Driver bereits geschlossen
 
     def scrape_email(self, website):
         """
         Scraped E-Mail von Website - VERBESSERTE VERSION
         Returns: {'email': 'info@example.com', 'source': 'homepage'} oder None
         """
+        # Eigener Seiten-Cache pro Aufruf (bzw. der Lauf des Aufrufers)
+        with self.fetcher.run():
+            return self._scrape_email(website)
+
+    def _scrape_email(self, website):
+        """Siehe scrape_email"""
         try:
             base_url = self.normalize_url(website)
             if not base_url:
@@ -405,10 +401,10 @@ E-MAIL-ADRESSEN:"""
 
             # 1. Homepage mit requests prüfen
             try:
-                response = requests.get(base_url, headers=self.headers, timeout=10, allow_redirects=True)
-                response.raise_for_status()
+                page = self.fetcher.fetch(base_url, timeout=10)
+                page.raise_for_status()
 
-                emails = self.extract_emails_from_html(response.text)
+                emails = self.extract_emails_from_html(page.text)
 
                 if emails:
                     logging.info(f"✅ E-Mail gefunden auf Homepage (requests): {emails[0]}")
@@ -419,14 +415,14 @@ E-MAIL-ADRESSEN:"""
                     }
 
                 # 2. Kontakt-Seiten prüfen
-                contact_pages = self.find_contact_pages(base_url, response.text)
+                contact_pages = self.find_contact_pages(base_url, page.document(self.html_parser))
 
                 for contact_url in contact_pages:
                     try:
-                        response = requests.get(contact_url, headers=self.headers, timeout=10)
-                        response.raise_for_status()
+                        page = self.fetcher.fetch(contact_url, timeout=10)
+                        page.raise_for_status()
 
-                        emails = self.extract_emails_from_html(response.text)
+                        emails = self.extract_emails_from_html(page.text)
 
                         if emails:
                             logging.info(f"✅ E-Mail gefunden auf {contact_url}: {emails[0]}")
@@ -443,8 +439,8 @@ E-MAIL-ADRESSEN:"""
             except requests.exceptions.RequestException as e:
                 logging.warning(f"Requests fehlgeschlagen: {e}")
 
-            # 3. Fallback: Selenium für JS-Seiten
-            if self.use_selenium:
+            # 3. Fallback: Selenium für JS-Seiten (nicht bei toten Domains)
+            if self.use_selenium and not self.session.health.is_dead(base_url):
                 logging.info(f"🔄 Versuche Selenium für {base_url}")
 
                 html = self.get_with_selenium(base_url)
@@ -460,7 +456,7 @@ E-MAIL-ADRESSEN:"""
                         }
 
                     # Selenium: Kontaktseiten
-                    soup = BeautifulSoup(html, 'html.parser')
+                    soup = parse_html(html, self.html_parser)
                     contact_pages = []
                     for link in soup.find_all('a', href=True):
                         href = link.get('href', '').lower()
@@ -27,6 +27,7 @@ from sqlalchemy import or_, and_
 # Modules
 from compliment_generator import ComplimentGenerator, AIColumnProcessor
 from impressum_scraper import ImpressumScraper
+from scrape_jobs import ScrapeJobRunner
 from prompt_manager import PromptManager
 from email_scraper import EmailScraper
 
@@ -3408,45 +3409,26 @@ Schreibe 2-3 Sätze, die sich auf KONKRETE Details aus den Rezensionen beziehen.
             try:
                 names_scraped = 0
                 emails_scraped = 0
-                total = len(companies)
 
                 # Kontaktdaten scrapen (kombiniert - Namen + E-Mails in einem Durchlauf)
+                # Als persistenter Job: ein Absturz verliert keine fertigen Leads
                 if scrape_type == "contact":
                     progress_label.configure(text="📇 Scrape Kontaktdaten...")
-                    impressum_scraper = ImpressumScraper()
+                    runner = ScrapeJobRunner(self.db, self.impressum_scraper.ultimate)
 
-                    for idx, company in enumerate(companies):
-                        needs_name = not company.first_name or not company.last_name
-                        needs_email = not company.email
-
-                        if needs_name or needs_email:
-                            try:
-                                # Kombinierte Methode - scrape Impressum nur EINMAL
-                                result = impressum_scraper.scrape_all_contact_data(company.website)
-
-                                if result.get('found_name') and needs_name:
-                                    company.first_name = result.get('first_name')
-                                    company.last_name = result.get('last_name')
-                                    names_scraped += 1
-
-                                if result.get('found_email') and needs_email:
-                                    company.email = result.get('email')
-                                    emails_scraped += 1
-
-                            except Exception as e:
-                                print(f"Fehler bei {company.website}: {e}")
-
-                        # Update progress
-                        current = idx + 1
-                        progress = current / total
-                        progress_bar.set(progress)
+                    def on_progress(current, total, item, outcome):
+                        progress_bar.set(current / total)
                         counter_label.configure(text=f"Kontakte: {current} / {total}")
                         progress_window.update()
 
-                        if current % 10 == 0:
-                            self.session.commit()
-
-                    self.session.commit()
+                    try:
+                        job = runner.create_job_for_ids([c.id for c in companies])
+                        stats = runner.run(job.id, progress_callback=on_progress)
+                        names_scraped = stats['names_found']
+                        emails_scraped = stats['emails_found']
+                    finally:
+                        runner.close()
+                        self.session.expire_all()
 
                 progress_window.destroy()
 
@@ -4138,8 +4120,14 @@ Schreibe 2-3 Sätze, die sich auf KONKRETE Details aus den Rezensionen beziehen.
             self.session.rollback()
             messagebox.showerror("Fehler", f"Fehler beim Löschen:\n{str(e)}")
 
-    def show_bulk_progress_window(self, title, total, operation_func, companies):
-        """Show progress window for bulk operations"""
+    def show_bulk_progress_window(self, title, total, operation_func, companies, job_func=None):
+        """
+        Show progress window for bulk operations
+
+        job_func: Optional - Funktion(on_progress, is_cancelled), die die Leads
+        selbst abarbeitet (statt operation_func pro Company);
+        on_progress(current, label, result) mit result 'success' / 'error' / 'skipped'
+        """
         progress_window = ctk.CTkToplevel(self)
         progress_window.title(title)
         progress_window.geometry("600x300")
@@ -4277,71 +4265,81 @@ Schreibe 2-3 Sätze, die sich auf KONKRETE Details aus den Rezensionen beziehen.
 
         progress_window.protocol("WM_DELETE_WINDOW", on_progress_window_close)
 
+        def report_start(current, label):
+            """Fortschritt + aktueller Lead (sichere Callbacks)"""
+            progress = current / total if total else 1.0
+            progress_window.after(
+                0,
+                lambda p=progress: safe_widget_update(
+                    progress_bar,
+                    lambda: progress_bar.set(p)
+                )
+            )
+            progress_window.after(
+                0,
+                lambda i=current: safe_widget_update(
+                    progress_info,
+                    lambda: progress_info.configure(text=f"{i} / {total} bearbeitet")
+                )
+            )
+            progress_window.after(
+                0,
+                lambda l=label: safe_widget_update(
+                    status_label,
+                    lambda: status_label.configure(text=f"Bearbeite: {l}")
+                )
+            )
+
+        def report_result(result):
+            """Ergebnis eines Leads ('success' / 'error' / 'skipped') zählen"""
+            if result == 'success':
+                processing_state['success'] += 1
+            elif result == 'error':
+                processing_state['error'] += 1
+            elif result == 'skipped':
+                processing_state['skipped'] += 1
+
+            # Sichere Stats-Updates
+            progress_window.after(
+                0,
+                lambda: safe_widget_update(
+                    success_label,
+                    lambda: success_label.configure(text=f"✅ Erfolg: {processing_state['success']}")
+                )
+            )
+            progress_window.after(
+                0,
+                lambda: safe_widget_update(
+                    error_label,
+                    lambda: error_label.configure(text=f"❌ Fehler: {processing_state['error']}")
+                )
+            )
+            progress_window.after(
+                0,
+                lambda: safe_widget_update(
+                    skipped_label,
+                    lambda: skipped_label.configure(text=f"⏭️ Übersprungen: {processing_state['skipped']}")
+                )
+            )
+
         def process_operation():
             try:
-                for idx, company in enumerate(companies):
-                    if processing_state['cancelled']:
-                        break
-
-                    # Update UI - mit sicheren Callbacks
-                    progress = (idx + 1) / total
-                    progress_window.after(
-                        0,
-                        lambda p=progress: safe_widget_update(
-                            progress_bar,
-                            lambda: progress_bar.set(p)
-                        )
-                    )
-                    progress_window.after(
-                        0,
-                        lambda i=idx+1: safe_widget_update(
-                            progress_info,
-                            lambda: progress_info.configure(text=f"{i} / {total} bearbeitet")
-                        )
-                    )
-                    progress_window.after(
-                        0,
-                        lambda c=company: safe_widget_update(
-                            status_label,
-                            lambda: status_label.configure(
-                                text=f"Bearbeite: {c.name or c.website[:30]+'...'}"
-                            )
-                        )
-                    )
+                if job_func:
+                    # Job verarbeitet die Leads selbst (z.B. fortsetzbarer Scrape-Job)
+                    def on_job_progress(current, label, result):
+                        report_start(current, label)
+                        report_result(result)
 
-                    # Process operation
-                    result = operation_func(company)
+                    job_func(on_job_progress, lambda: processing_state['cancelled'])
+                else:
+                    for idx, company in enumerate(companies):
+                        if processing_state['cancelled']:
+                            break
 
-                    # Update stats
-                    if result == 'success':
-                        processing_state['success'] += 1
-                    elif result == 'error':
-                        processing_state['error'] += 1
-                    elif result == 'skipped':
-                        processing_state['skipped'] += 1
+                        report_start(idx + 1, company.name or company.website[:30] + '...')
 
-                    # Sichere Stats-Updates
-                    progress_window.after(
-                        0,
-                        lambda: safe_widget_update(
-                            success_label,
-                            lambda: success_label.configure(text=f"✅ Erfolg: {processing_state['success']}")
-                        )
-                    )
-                    progress_window.after(
-                        0,
-                        lambda: safe_widget_update(
-                            error_label,
-                            lambda: error_label.configure(text=f"❌ Fehler: {processing_state['error']}")
-                        )
-                    )
-                    progress_window.after(
-                        0,
-                        lambda: safe_widget_update(
-                            skipped_label,
-                            lambda: skipped_label.configure(text=f"⏭️ Übersprungen: {processing_state['skipped']}")
-                        )
-                    )
+                        # Process operation
+                        report_result(operation_func(company))
 
                 # Done
                 processing_state['completed'] = True
@@ -4546,6 +4544,11 @@ Schreibe 2-3 Sätze, die sich auf KONKRETE Details aus den Rezensionen beziehen.
         KOMBINIERTE METHODE: Scraped Namen UND E-Mail in einem Durchgang
         Spart Zeit, weil das Impressum nur einmal geladen wird
         """
+        # Unterbrochenen Job zuerst anbieten
+        resumed = self.resume_contact_scrape_job()
+        if resumed or resumed is None:
+            return
+
         # Get selected companies
         selected_companies = [
             c for c in self.current_results
@@ -4579,52 +4582,90 @@ Schreibe 2-3 Sätze, die sich auf KONKRETE Details aus den Rezensionen beziehen.
         if not result:
             return
 
-        # Create progress window
+        # Persistenter Job: Fortschritt überlebt Absturz/Schließen der GUI
+        runner = ScrapeJobRunner(self.db, self.impressum_scraper.ultimate)
+        try:
+            job = runner.create_job_for_ids([c.id for c in companies_with_website])
+            job_id, open_count = job.id, len(job.items)
+        finally:
+            runner.close()
+
+        if not open_count:
+            messagebox.showinfo("Nichts zu tun", "Alle ausgewählten Leads haben bereits Namen und E-Mail.")
+            return
+
+        self.show_contact_job_progress(job_id, open_count)
+
+    def show_contact_job_progress(self, job_id, open_count, retry_failed=False):
+        """Zeigt das Fortschrittsfenster für einen (fortsetzbaren) Kontaktdaten-Job"""
         self.show_bulk_progress_window(
             title="Kontaktdaten scrapen",
-            total=count,
-            operation_func=self.process_bulk_contact_data,
-            companies=companies_with_website
+            total=open_count,
+            operation_func=None,
+            companies=[],
+            job_func=lambda on_progress, is_cancelled: self.run_contact_scrape_job(
+                job_id, on_progress, is_cancelled, retry_failed
+            )
         )
 
-    def process_bulk_contact_data(self, company):
+    def resume_contact_scrape_job(self):
         """
-        Process single company for combined contact data scraping
-        Extrahiert Namen UND E-Mail aus dem Impressum in einem Durchgang
+        Bietet an, einen unterbrochenen Kontaktdaten-Job fortzusetzen
+
+        Returns:
+            True = fortgesetzt, False = kein Job/verworfen, None = Abbruch
         """
+        runner = ScrapeJobRunner(self.db, self.impressum_scraper.ultimate)
         try:
-            # Prüfe ob bereits vollständig
-            has_name = company.first_name and company.last_name
-            has_email = company.email
-
-            if has_name and has_email:
-                return 'skipped'
-
-            # Nutze die kombinierte Methode aus dem Impressum-Scraper
-            result = self.impressum_scraper.scrape_all_contact_data(company.website)
-
-            found_something = False
-
-            # Namen übernehmen (falls noch nicht vorhanden)
-            if result.get('found_name') and not has_name:
-                company.first_name = result['first_name']
-                company.last_name = result['last_name']
-                found_something = True
-
-            # E-Mail übernehmen (falls noch nicht vorhanden)
-            if result.get('found_email') and not has_email:
-                company.email = result['email']
-                found_something = True
-
-            if found_something:
-                self.session.commit()
-                return 'success'
-            else:
-                return 'error'
-
-        except Exception as e:
-            logging.error(f"Error scraping contact data for {company.website}: {e}")
-            return 'error'
+            jobs = runner.unfinished_jobs(kind='contact')
+            if not jobs:
+                return False
+            job = jobs[0]
+            counts = runner.progress(job.id)
+            open_count = counts['pending'] + counts['in_flight']
+            # Nur Fehlgeschlagene unter max_attempts werden erneut versucht
+            retry_count = runner.retryable_count(job.id)
+
+            answer = messagebox.askyesnocancel(
+                "Unterbrochener Job",
+                f"Kontaktdaten-Job #{job.id} vom {job.created_at:%d.%m.%Y %H:%M} wurde nicht beendet.\n\n"
+                f"✅ Erledigt: {counts['done']}\n"
+                f"❌ Fehlgeschlagen: {counts['failed']}\n"
+                f"⏳ Offen: {open_count}\n\n"
+                f"Ja = fortsetzen (Fehlgeschlagene erneut versuchen)\n"
+                f"Nein = verwerfen und neue Auswahl scrapen"
+            )
+            if answer is None:
+                return None
+            if not answer:
+                runner.discard(job.id)
+                return False
+        finally:
+            runner.close()
+
+        self.show_contact_job_progress(job.id, open_count + retry_count, retry_failed=True)
+        return True
+
+    def run_contact_scrape_job(self, job_id, on_progress, is_cancelled, retry_failed=False):
+        """
+        Führt einen Kontaktdaten-Job aus (im Worker-Thread)
+        Jeder Block wird sofort gespeichert - ein Neustart macht nur offene Leads
+        """
+        outcomes = {'success': 'success', 'empty': 'error', 'failed': 'error'}
+        runner = ScrapeJobRunner(self.db, self.impressum_scraper.ultimate)
+        try:
+            runner.run(
+                job_id,
+                progress_callback=lambda current, total, item, outcome: on_progress(
+                    current, item.website[:40], outcomes[outcome]
+                ),
+                should_stop=is_cancelled,
+                retry_failed=retry_failed
+            )
+        finally:
+            runner.close()
+            # Änderungen kamen über die Runner-Session (Session gehört dem Main-Thread)
+            self.after(0, self.session.expire_all)
 
     # ========================================
     # KI-SPALTEN-FEATURE (Clay.com Style!)
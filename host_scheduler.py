@@ -0,0 +1,257 @@
+"""
+Host Scheduler - Höflichkeits-Regeln pro Domain
+
+Ersetzt die feste Pause nach jedem Lead: Statt alle Leads pauschal zu
+bremsen, wird nur der Abstand zwischen Requests an DENSELBEN Host
+erzwungen. Unterschiedliche Hosts laufen ungebremst parallel.
+
+Features:
+- Mindestabstand zwischen Requests pro Host (Reservierungs-Prinzip)
+- Max. gleichzeitige Requests pro Host
+- 429 / 503 mit Retry-After (Sekunden oder HTTP-Datum) sperren den Host
+- Metriken pro Host: Warteschlange, Wartezeit, Drosselungen
+- Nutzbar aus Threads (slot) und asyncio (async_slot)
+"""
+import asyncio
+import logging
+import threading
+import time
+from contextlib import contextmanager, asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Status-Codes, mit denen ein Server "zu schnell" signalisiert
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+@dataclass
+class HostState:
+    """Zustand und Metriken eines Hosts"""
+    semaphore: threading.BoundedSemaphore
+    next_allowed: float = 0.0      # monotonic: frühester Start des nächsten Requests
+    blocked_until: float = 0.0     # monotonic: Sperre durch Retry-After
+    active: int = 0
+    waiting: int = 0
+    requests: int = 0
+    throttled: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+
+class HostScheduler:
+    """
+    Verteilt Requests höflich auf Hosts
+
+    Verwendung (Threads):
+        with scheduler.slot(url):
+            response = session.get(url)
+        scheduler.record_response(url, response.status_code, response.headers)
+
+    Verwendung (asyncio):
+        async with scheduler.async_slot(url):
+            ...
+    """
+
+    def __init__(self, min_interval: float = 0.1, max_concurrency: int = 4,
+                 default_backoff: float = 5.0, max_backoff: float = 120.0):
+        """
+        Args:
+            min_interval: Mindestabstand zwischen Request-Starts pro Host (Sekunden)
+            max_concurrency: Max. gleichzeitige Requests pro Host
+            default_backoff: Sperre bei 429/503 ohne Retry-After (Sekunden)
+            max_backoff: Obergrenze für Retry-After (Sekunden)
+        """
+        self.min_interval = min_interval
+        self.max_concurrency = max(1, max_concurrency)
+        self.default_backoff = default_backoff
+        self.max_backoff = max_backoff
+
+        self._hosts: Dict[str, HostState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        """Host einer URL (klein, ohne www. und Port)"""
+        host = (urlparse(url).hostname or url).lower()
+        return host[4:] if host.startswith('www.') else host
+
+    def _state(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = HostState(semaphore=threading.BoundedSemaphore(self.max_concurrency))
+            self._hosts[host] = state
+        return state
+
+    # ===== RESERVIERUNG =====
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserviert den nächsten Start-Zeitpunkt für einen Request an den Host
+
+        Returns:
+            Wartezeit in Sekunden bis zum reservierten Start
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(self.host_key(url))
+            start = max(now, state.next_allowed, state.blocked_until)
+            state.next_allowed = start + self.min_interval
+            return start - now
+
+    def _begin(self, host: str, waited: float):
+        with self._lock:
+            state = self._hosts[host]
+            state.waiting -= 1
+            state.active += 1
+            state.requests += 1
+            state.wait_total += waited
+            state.wait_max = max(state.wait_max, waited)
+
+    def _end(self, host: str):
+        with self._lock:
+            self._hosts[host].active -= 1
+
+    def _enqueue(self, host: str) -> HostState:
+        with self._lock:
+            state = self._state(host)
+            state.waiting += 1
+            return state
+
+    @contextmanager
+    def slot(self, url: str):
+        """Blockiert bis ein Request an den Host erlaubt ist (für Threads)"""
+        host = self.host_key(url)
+        state = self._enqueue(host)
+        queued_at = time.monotonic()
+
+        state.semaphore.acquire()
+        try:
+            delay = self.reserve(url)
+            if delay > 0:
+                time.sleep(delay)
+            self._begin(host, time.monotonic() - queued_at)
+            try:
+                yield
+            finally:
+                self._end(host)
+        finally:
+            state.semaphore.release()
+
+    @asynccontextmanager
+    async def async_slot(self, url: str):
+        """
+        Wartet bis ein Request an den Host erlaubt ist (für asyncio)
+
+        Die Parallelität pro Host begrenzt hier der aiohttp-Connector
+        (limit_per_host), der Scheduler sorgt für Abstand und Sperren.
+        """
+        host = self.host_key(url)
+        self._enqueue(host)
+        queued_at = time.monotonic()
+
+        delay = self.reserve(url)
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            with self._lock:
+                self._hosts[host].waiting -= 1
+            raise
+
+        self._begin(host, time.monotonic() - queued_at)
+        try:
+            yield
+        finally:
+            self._end(host)
+
+    # ===== DROSSELUNG =====
+
+    def record_response(self, url: str, status_code: int, headers=None) -> Optional[float]:
+        """
+        Wertet eine Antwort aus: 429/503 sperren den Host
+
+        Returns:
+            Sperrdauer in Sekunden oder None (keine Drosselung)
+        """
+        if status_code not in THROTTLE_STATUS_CODES:
+            return None
+
+        delay = self.parse_retry_after((headers or {}).get('Retry-After'))
+        if delay is None:
+            delay = self.default_backoff
+        delay = min(delay, self.max_backoff)
+
+        host = self.host_key(url)
+        with self._lock:
+            state = self._state(host)
+            state.throttled += 1
+            state.blocked_until = max(state.blocked_until, time.monotonic() + delay)
+
+        logger.info(f"⏳ {host} drosselt (HTTP {status_code}) - Pause {delay:.1f}s")
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After als Sekunden ("120") oder HTTP-Datum"""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    # ===== METRIKEN =====
+
+    def metrics(self) -> Dict[str, Dict]:
+        """Metriken pro Host: Warteschlange, aktive Requests, Wartezeiten, Drosselungen"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: {
+                    'queue_depth': state.waiting,
+                    'active': state.active,
+                    'requests': state.requests,
+                    'throttled': state.throttled,
+                    'wait_total': round(state.wait_total, 3),
+                    'wait_avg': round(state.wait_total / state.requests, 3) if state.requests else 0.0,
+                    'wait_max': round(state.wait_max, 3),
+                    'blocked_for': round(max(0.0, state.blocked_until - now), 3),
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def total_wait(self) -> float:
+        """Summe aller Wartezeiten über alle Hosts (Sekunden)"""
+        with self._lock:
+            return sum(state.wait_total for state in self._hosts.values())
+
+
+# ===== GEMEINSAMER SCHEDULER =====
+
+_shared_scheduler: Optional[HostScheduler] = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_host_scheduler() -> HostScheduler:
+    """
+    Gibt den prozessweit gemeinsamen Scheduler zurück
+
+    Alle Scraper teilen sich die Regeln, damit ein Host auch dann geschont
+    wird, wenn Impressum- und E-Mail-Scraper gleichzeitig darauf zugreifen.
+    """
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = HostScheduler()
+        return _shared_scheduler
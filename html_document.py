@@ -0,0 +1,329 @@
+"""
+HTML Document - Einmal parsen, mehrfach auswerten
+
+Ein HtmlDocument kapselt eine geladene Seite. Der BeautifulSoup-Baum wird
+genau einmal erzeugt; alle Sichten darauf (bereinigter Text, Impressum-
+Bereich, Links, JSON-LD, mailto-Ziele, Footer) werden beim ersten Zugriff berechnet und
+gemerkt. Alle Extraktoren lesen aus demselben Dokument, statt das HTML
+jeweils neu zu parsen.
+
+Der Baum wird dabei nie verändert (kein decompose/extract), damit jede
+Sicht unabhängig von der Reihenfolge der Aufrufe dasselbe Ergebnis liefert.
+
+Parser-Backend:
+- Standard ist 'lxml' (C-basiert). Der Vorsprung vor 'html.parser' ist
+  klein - gemessen 1.0-1.3x auf den Fixtures, ca. 1.2-1.5x bei 1 MB-Seiten
+  (benchmarks/bench_parser.py): die meiste Zeit kostet der Aufbau des
+  BeautifulSoup-Baums, nicht der Parser
+- Fallback auf den reinen Python-Parser 'html.parser', falls lxml fehlt
+- Überschreibbar per Umgebungsvariable LEADTOOL_HTML_PARSER
+  oder pro Scraper (Parameter html_parser)
+"""
+import html as html_module
+import json
+import logging
+import os
+import re
+from functools import cached_property
+from typing import List, Optional, Sequence, Tuple, Union, NamedTuple
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+# lxml optional (C-Parser-Backend)
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    logging.info("lxml nicht installiert - verwende html.parser")
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_HTML_PARSER = 'html.parser'
+SUPPORTED_HTML_PARSERS = ('lxml', 'html5lib', 'html.parser')
+
+
+def resolve_html_parser(name: Optional[str] = None) -> str:
+    """
+    Ermittelt das Parser-Backend für BeautifulSoup
+
+    Reihenfolge: name → LEADTOOL_HTML_PARSER → 'lxml' (falls installiert) → 'html.parser'
+    """
+    name = name or os.environ.get('LEADTOOL_HTML_PARSER')
+
+    if name:
+        if name not in SUPPORTED_HTML_PARSERS:
+            logger.warning(f"Unbekannter HTML-Parser '{name}' - verwende Standard")
+        elif name == 'lxml' and not LXML_AVAILABLE:
+            logger.warning("lxml nicht verfügbar - verwende html.parser")
+            return FALLBACK_HTML_PARSER
+        else:
+            return name
+
+    return 'lxml' if LXML_AVAILABLE else FALLBACK_HTML_PARSER
+
+
+# Prozessweiter Standard
+HTML_PARSER = resolve_html_parser()
+
+
+def parse_html(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parst HTML mit dem konfigurierten Backend"""
+    return BeautifulSoup(html, parser or HTML_PARSER)
+
+
+# Elemente, deren Text nicht zum Seiteninhalt gehört
+CLEAN_TEXT_SKIP_TAGS = frozenset(['script', 'style', 'meta', 'link', 'noscript',
+                                  'header', 'nav', 'aside', 'iframe'])
+VISIBLE_TEXT_SKIP_TAGS = frozenset(['script', 'style', 'noscript'])
+
+# Nur "echter" Text (keine Kommentare, Doctype, Script-Inhalte, ...)
+_TEXT_TYPES = (NavigableString, CData)
+
+_MICRODATA_TYPE = re.compile(r'schema\.org/(Person|Organization)', re.I)
+
+# ===== IMPRESSUM-BEREICH =====
+
+# Anker für den Impressum-Bereich im bereinigten Text, mit Gewicht
+_IMPRESSUM_ANCHORS = re.compile(
+    r'(?P<tmg>angaben\s+gem(?:äß|aess|\.)\s*§\s*5|§\s*5\s*(?:tmg|ddg|ecg)|anbieterkennzeichnung)'
+    r'|(?P<heading>^(?:impressum|imprint|legal notice|site notice)\s*:?\s*$)'
+    r'|(?P<person>geschäftsführ|inhaber|vertreten\s+durch|vertretungsberechtigt|einzelunternehmer)'
+    r'|(?P<register>registergericht|handelsregister|ust-?id|umsatzsteuer-id)',
+    re.I | re.M
+)
+_IMPRESSUM_ANCHOR_WEIGHTS = {'tmg': 3, 'heading': 2, 'person': 2, 'register': 1}
+
+# Überschriften, mit denen der Impressum-Bereich endet
+_IMPRESSUM_STOP = re.compile(
+    r'^(?:datenschutz(?:erklärung)?|haftungsausschluss|haftung für (?:inhalte|links)|disclaimer'
+    r'|privacy policy|cookie-?richtlinie|urheberrecht)\s*:?\s*$',
+    re.I | re.M
+)
+
+IMPRESSUM_WINDOW_BEFORE = 300      # Zeichen vor dem ersten Anker (Firmenname, "Name, Geschäftsführer")
+IMPRESSUM_WINDOW_AFTER = 800       # Zeichen nach dem letzten Anker (Kontakt, Register)
+IMPRESSUM_ANCHOR_GAP = 1500        # Max. Abstand zweier Anker im selben Bereich
+IMPRESSUM_MAX_SPAN = 3000          # Max. Länge vom ersten bis zum letzten Anker eines Bereichs
+
+
+def locate_impressum_window(text: str) -> Optional[Tuple[int, int]]:
+    """
+    Sucht den Impressum-Bereich in einem Text
+
+    Anker ("Angaben gemäß § 5 TMG", Überschrift "Impressum", Geschäftsführer,
+    Inhaber, Registergericht, ...) werden zu Gruppen zusammengefasst; die
+    Gruppe mit dem höchsten Gewicht plus etwas Kontext davor und danach ist
+    das Fenster (bis zur nächsten Überschrift wie "Datenschutzerklärung").
+
+    Returns:
+        (start, end) oder None, wenn kein Anker gefunden wurde
+    """
+    clusters = []   # [start, end, {Anker-Art}]; end = Ende des letzten Ankers einer neuen Art
+    for match in _IMPRESSUM_ANCHORS.finditer(text):
+        cluster = clusters[-1] if clusters else None
+        if (cluster and match.start() - cluster[1] <= IMPRESSUM_ANCHOR_GAP
+                and match.end() - cluster[0] <= IMPRESSUM_MAX_SPAN):
+            # Wiederholte Anker-Arten verlängern den Bereich nicht
+            # (ein Cookie-Text direkt nach dem Impressum bleibt draußen)
+            if match.lastgroup not in cluster[2]:
+                cluster[1] = match.end()
+                cluster[2].add(match.lastgroup)
+        else:
+            clusters.append([match.start(), match.end(), {match.lastgroup}])
+    if not clusters:
+        return None
+
+    # Gewicht je Anker-Art nur einmal: ein Impressum hat verschiedene Anker,
+    # ein Cookie-Text wiederholt höchstens denselben
+    first, last, _ = max(clusters, key=lambda cluster: sum(_IMPRESSUM_ANCHOR_WEIGHTS[kind] for kind in cluster[2]))
+
+    # Auf Zeilengrenzen erweitern
+    start = text.rfind('\n', 0, max(0, first - IMPRESSUM_WINDOW_BEFORE)) + 1
+    end = text.find('\n', min(len(text), last + IMPRESSUM_WINDOW_AFTER))
+    if end == -1:
+        end = len(text)
+
+    stop = _IMPRESSUM_STOP.search(text, last, end)
+    if stop:
+        end = stop.start()
+    return start, end
+
+
+class Link(NamedTuple):
+    """Ein <a href>-Link"""
+    href: str
+    text: str
+
+
+class HtmlDocument:
+    """
+    Einmal geparstes HTML mit gemerkten Sichten
+
+    Verwendung:
+        doc = HtmlDocument(html, url)
+        doc.clean_text, doc.impressum_text, doc.links, doc.json_ld, doc.mailto_addresses
+    """
+
+    def __init__(self, html: str, url: Optional[str] = None,
+                 footer_selectors: Sequence[str] = ('footer',), parser: Optional[str] = None,
+                 truncated: bool = False):
+        """
+        Args:
+            html: HTML-Quelltext
+            url: Optional - URL der Seite
+            footer_selectors: Tag-Namen oder CSS-Selektoren für Footer-Bereiche
+            parser: Optional - BeautifulSoup-Backend (Standard: HTML_PARSER)
+            truncated: HTML wurde beim Laden abgeschnitten (Byte-Obergrenze)
+        """
+        self.html = html or ""
+        self.url = url
+        self.footer_selectors = tuple(footer_selectors)
+        self.parser = parser or HTML_PARSER
+        self.truncated = truncated
+
+    @classmethod
+    def of(cls, html: Union[str, 'HtmlDocument'], **kwargs) -> 'HtmlDocument':
+        """Gibt html zurück, falls bereits ein HtmlDocument, sonst ein neues"""
+        if isinstance(html, cls):
+            return html
+        return cls(html, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.html)
+
+    # ===== BAUM =====
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """Der (einzige) Parse-Baum des Dokuments - nicht verändern!"""
+        return parse_html(self.html, self.parser)
+
+    def _iter_strings(self, skip_tags: frozenset):
+        """Liefert alle nicht-leeren Text-Knoten (gestrippt), ohne Teilbäume in skip_tags"""
+        stack = [iter(self.soup.contents)]
+        while stack:
+            for node in stack[-1]:
+                if isinstance(node, Tag):
+                    if node.name not in skip_tags:
+                        stack.append(iter(node.contents))
+                        break
+                elif type(node) in _TEXT_TYPES:
+                    text = node.strip()
+                    if text:
+                        yield text
+            else:
+                stack.pop()
+
+    # ===== TEXT =====
+
+    @cached_property
+    def clean_text(self) -> str:
+        """Bereinigter Text (ohne Navigation, Scripts etc.), eine Zeile pro Text-Knoten"""
+        lines = []
+        for text in self._iter_strings(CLEAN_TEXT_SKIP_TAGS):
+            for line in text.split('\n'):
+                line = line.strip()
+                if line and len(line) > 1:
+                    lines.append(line)
+        return '\n'.join(lines)
+
+    @cached_property
+    def impressum_text(self) -> Optional[str]:
+        """Impressum-Bereich von clean_text (None = kein Anker gefunden)"""
+        window = locate_impressum_window(self.clean_text)
+        return self.clean_text[window[0]:window[1]] if window else None
+
+    @cached_property
+    def visible_text(self) -> str:
+        """Sichtbarer Text ohne Scripts/Styles (ohne Trennzeichen)"""
+        return ''.join(self._iter_strings(VISIBLE_TEXT_SKIP_TAGS))
+
+    @cached_property
+    def unescaped_html(self) -> str:
+        """HTML mit dekodierten HTML-Entities (für Regex-Suchen)"""
+        return html_module.unescape(self.html)
+
+    # ===== LINKS =====
+
+    @cached_property
+    def link_tags(self) -> List[Tag]:
+        """Alle <a>-Tags mit href"""
+        return self.soup.find_all('a', href=True)
+
+    @cached_property
+    def links(self) -> List[Link]:
+        """Alle Links als (href, text)"""
+        return [self._to_link(tag) for tag in self.link_tags]
+
+    @cached_property
+    def mailto_addresses(self) -> List[str]:
+        """Ziele aller mailto:-Links (kleingeschrieben, ohne Query)"""
+        addresses = []
+        for link in self.links:
+            href = html_module.unescape(link.href).lower()
+            if 'mailto:' in href:
+                addresses.append(href.replace('mailto:', '').split('?')[0].strip())
+        return addresses
+
+    @cached_property
+    def footer_nodes(self) -> List[Tag]:
+        """Footer-Elemente gemäß footer_selectors"""
+        nodes = []
+        for selector in self.footer_selectors:
+            try:
+                if selector.startswith(('#', '.', '[')):
+                    nodes.extend(self.soup.select(selector))
+                else:
+                    nodes.extend(self.soup.find_all(selector))
+            except Exception:
+                continue
+        return nodes
+
+    @cached_property
+    def footer_links(self) -> List[Link]:
+        """
+        Links im Footer
+
+        Gibt es keinen erkennbaren Footer, gelten die letzten 30% aller
+        Links der Seite als Footer (bei mehr als 10 Links).
+        """
+        if not self.footer_nodes:
+            if len(self.links) > 10:
+                return self.links[int(len(self.links) * 0.7):]
+            return []
+
+        links = []
+        for node in self.footer_nodes:
+            links.extend(self._to_link(tag) for tag in node.find_all('a', href=True))
+        return links
+
+    @staticmethod
+    def _to_link(tag: Tag) -> Link:
+        return Link(tag.get('href', ''), tag.get_text(strip=True))
+
+    # ===== STRUKTURIERTE DATEN =====
+
+    @cached_property
+    def json_ld(self) -> List:
+        """Geparste JSON-LD-Blöcke (ungültige Blöcke werden übersprungen)"""
+        blocks = []
+        for script in self.soup.find_all('script', type='application/ld+json'):
+            if not script.string:
+                continue
+            try:
+                blocks.append(json.loads(script.string))
+            except json.JSONDecodeError:
+                continue
+        return blocks
+
+    @cached_property
+    def microdata(self) -> List[Tuple[str, dict]]:
+        """Schema.org-Microdata für Person/Organization als (itemtype, {itemprop: text})"""
+        items = []
+        for element in self.soup.find_all(itemtype=_MICRODATA_TYPE):
+            props = {}
+            for prop in element.find_all(itemprop=True):
+                props[prop.get('itemprop')] = prop.get_text(strip=True)
+            items.append((element.get('itemtype', ''), props))
+        return items
@@ -0,0 +1,210 @@
+"""
+HTTP Session - Gemeinsame requests-Session für alle Scraper
+
+Features:
+- Connection Pooling (Keep-Alive) über eine Session pro Scraper
+- Persistenter Response-Cache mit Revalidierung (ETag / Last-Modified):
+  Wiederholte Scrapes kosten meist nur ein 304 statt des kompletten HTML
+- Trefferquote des Caches abrufbar (cache_stats / cache_hit_rate)
+- Höflichkeit pro Host über HostScheduler (Abstand, Parallelität, 429/503)
+- Fail-fast für tote Domains und adaptive Timeouts über DomainHealth
+"""
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from scrape_cache import ResponseCache, CachedResponse
+from host_scheduler import HostScheduler, THROTTLE_STATUS_CODES
+from domain_health import DomainHealth, DomainDeadError
+
+logger = logging.getLogger(__name__)
+
+
+class ScraperSession(requests.Session):
+    """
+    requests.Session mit optionalem Response-Cache
+
+    GET-Requests werden mit If-None-Match / If-Modified-Since gesendet,
+    wenn die URL im Cache liegt. Antwortet der Server mit 304, wird die
+    gecachte Antwort als normale 200-Response zurückgegeben
+    (response.from_cache = True).
+    """
+
+    def __init__(self, response_cache: Optional[ResponseCache] = None,
+                 headers: Optional[Dict[str, str]] = None, pool_size: int = 10,
+                 scheduler: Optional[HostScheduler] = None, throttle_retries: int = 1,
+                 max_throttle_wait: float = 30.0, health: Optional[DomainHealth] = None):
+        """
+        Args:
+            response_cache: Optional - ResponseCache (None = kein Caching)
+            headers: Optional - Standard-Header für alle Requests
+            pool_size: Verbindungen pro Host im Pool
+            scheduler: Optional - HostScheduler für Höflichkeit pro Host
+            throttle_retries: Wiederholungen nach 429/503
+            max_throttle_wait: Längere Retry-After-Pausen werden nicht abgewartet (Sekunden)
+            health: Optional - DomainHealth (tote Domains überspringen, adaptive Timeouts)
+        """
+        super().__init__()
+
+        if headers:
+            self.headers.update(headers)
+
+        self.pool_size = 0
+        self.ensure_pool_size(pool_size)
+
+        self.response_cache = response_cache
+        self.scheduler = scheduler
+        self.health = health
+        self.throttle_retries = throttle_retries
+        self.max_throttle_wait = max_throttle_wait
+        self.cache_stats = {'hits': 0, 'misses': 0, 'stored': 0}
+        self._stats_lock = threading.Lock()
+
+    def ensure_pool_size(self, pool_size: int):
+        """Vergrößert den Verbindungs-Pool (für Scraper, die sich die Session teilen)"""
+        if pool_size <= self.pool_size:
+            return
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+        self.pool_size = pool_size
+
+    # ===== CACHE-STATISTIK =====
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Anteil der Cache-GETs, die per 304 aus dem Cache bedient wurden (0.0 - 1.0)"""
+        with self._stats_lock:
+            total = self.cache_stats['hits'] + self.cache_stats['misses']
+            return self.cache_stats['hits'] / total if total else 0.0
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.cache_stats[key] += 1
+
+    # ===== REQUESTS =====
+
+    def request(self, method, url, **kwargs):
+        """Wie requests.Session.request, GETs laufen über den Response-Cache"""
+        if self.response_cache is None or method.upper() != 'GET':
+            return self._scheduled_request(method, url, **kwargs)
+
+        cached = self.response_cache.get(url)
+        if cached is not None:
+            headers = dict(kwargs.pop('headers', None) or {})
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+            kwargs['headers'] = headers
+
+        response = self._scheduled_request(method, url, **kwargs)
+
+        if cached is not None and response.status_code == 304:
+            self._count('hits')
+            self.response_cache.touch(url)
+            return self._from_cache(response, cached)
+
+        self._count('misses')
+        response.from_cache = False
+
+        if response.status_code == 200 and not kwargs.get('stream'):
+            self.store_response(url, response)
+
+        return response
+
+    def _scheduled_request(self, method, url, **kwargs) -> requests.Response:
+        """
+        Sendet den Request über den HostScheduler
+
+        Bei 429/503 wird der Host gesperrt (Retry-After) und der Request
+        wiederholt, sofern die Pause max_throttle_wait nicht überschreitet.
+        """
+        if self.scheduler is None:
+            return self._checked_request(method, url, **kwargs)
+
+        attempt = 0
+        while True:
+            with self.scheduler.slot(url):
+                response = self._checked_request(method, url, **kwargs)
+
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                return response
+
+            delay = self.scheduler.record_response(url, response.status_code, response.headers)
+            if attempt >= self.throttle_retries or delay > self.max_throttle_wait:
+                return response
+
+            attempt += 1
+            response.close()
+
+    def _checked_request(self, method, url, **kwargs) -> requests.Response:
+        """
+        Sendet den Request über DomainHealth
+
+        Tote Domains scheitern sofort mit DomainDeadError (eine
+        requests.ConnectionError), der Timeout wird an die beobachteten
+        Latenzen angepasst. Verbindungsfehler (DNS, Connect) werden verbucht.
+        """
+        if self.health is None:
+            return super().request(method, url, **kwargs)
+
+        if self.health.is_dead(url):
+            raise DomainDeadError(f"Domain übersprungen (tot): {url}")
+
+        if 'timeout' in kwargs:
+            kwargs['timeout'] = self.health.timeout_for(url, kwargs['timeout'])
+
+        start = time.monotonic()
+        try:
+            response = super().request(method, url, **kwargs)
+        except Exception as e:
+            if self.health.is_connection_failure(e):
+                self.health.record_failure(url, e, start)
+            raise
+
+        self.health.record_success(url, time.monotonic() - start)
+        return response
+
+    def store_response(self, url: str, response: requests.Response, body: Optional[bytes] = None,
+                       encoding: Optional[str] = None):
+        """
+        Speichert eine (vollständig gelesene) Antwort, falls sie revalidierbar ist
+
+        Bei gestreamten Antworten übergibt der Aufrufer den gelesenen Body
+        und den erkannten Zeichensatz.
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified) or self.response_cache is None:
+            return
+
+        self.response_cache.store(
+            url,
+            response.content if body is None else body,
+            etag=etag,
+            last_modified=last_modified,
+            content_type=response.headers.get('Content-Type'),
+            encoding=encoding or response.encoding,
+        )
+        self._count('stored')
+
+    @staticmethod
+    def _from_cache(response: requests.Response, cached: CachedResponse) -> requests.Response:
+        """Macht aus einer 304-Antwort eine 200-Antwort mit gecachtem Body"""
+        response.content  # 304 hat keinen Body - Verbindung freigeben
+
+        response.status_code = 200
+        response.reason = 'OK (cached)'
+        response._content = cached.body
+        response.encoding = cached.encoding
+        response.headers.pop('Content-Length', None)
+        response.headers.pop('Content-Encoding', None)
+        if cached.content_type:
+            response.headers['Content-Type'] = cached.content_type
+        response.from_cache = True
+        return response
@@ -18,6 +18,11 @@ class ImpressumScraper:
     def __init__(self, api_config_file: str = "api_config.json"):
         self._scraper = ImpressumScraperUltimate(api_config_file)
     
+    @property
+    def ultimate(self) -> ImpressumScraperUltimate:
+        """Der zugrundeliegende Ultimate-Scraper (z.B. für ScrapeJobRunner)"""
+        return self._scraper
+    
     def normalize_url(self, website: str) -> Optional[str]:
         """Normalisiert Website-URL"""
         return self._scraper.normalize_url(website)
@@ -104,13 +109,8 @@ class ImpressumScraper:
         """
         stats = {'names_found': 0, 'emails_found': 0, 'total': len(companies)}
         
-        for idx, company in enumerate(companies):
+        for company, result in self._scrape_companies(companies, progress_callback):
             try:
-                if progress_callback:
-                    progress_callback(idx + 1, len(companies), getattr(company, 'name', None) or company.website)
-                
-                result = self._scraper.scrape(company.website)
-                
                 if result.found_name:
                     company.first_name = result.first_name
                     company.last_name = result.last_name
@@ -139,13 +139,8 @@ class ImpressumScraper:
         """
         success_count = 0
         
-        for idx, company in enumerate(companies):
+        for company, result in self._scrape_companies(companies, progress_callback):
             try:
-                if progress_callback:
-                    progress_callback(idx + 1, len(companies), getattr(company, 'name', None) or company.website)
-                
-                result = self._scraper.scrape(company.website)
-                
                 if result.found_name:
                     company.first_name = result.first_name
                     company.last_name = result.last_name
@@ -156,6 +151,26 @@ class ImpressumScraper:
                 continue
         
         return success_count
+    
+    def _scrape_companies(self, companies, progress_callback=None):
+        """
+        Scraped alle Companies parallel über den Ultimate-Scraper
+        
+        Returns:
+            Liste von (company, ContactResult) in Eingabe-Reihenfolge
+        """
+        labels = {}
+        for company in companies:
+            labels.setdefault(company.website, getattr(company, 'name', None) or company.website)
+        
+        def on_progress(current, total, website):
+            progress_callback(current, total, labels.get(website, website))
+        
+        results = self._scraper.scrape_multiple(
+            [company.website for company in companies],
+            progress_callback=on_progress if progress_callback else None
+        )
+        return list(zip(companies, results))
 
 
 # ===== DIREKTER ZUGRIFF AUF ULTIMATE SCRAPER =====
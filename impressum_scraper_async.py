@@ -0,0 +1,445 @@
+"""
+Impressum Scraper - ASYNC BACKEND
+asyncio/aiohttp-Fetch-Backend für den ImpressumScraperUltimate
+
+Statt pro Lead einen Thread für bis zu ~20 blockierende Requests zu belegen,
+laufen hier tausende Domains auf EINEM Event-Loop. Der Durchsatz skaliert
+dadurch mit der Anzahl offener Sockets statt mit der Anzahl Threads.
+
+Features:
+- async scrape() und scrape_many() mit Ergebnissen in Eingabe-Reihenfolge
+- Verbindungs-Limits gesamt und pro Host (aiohttp TCPConnector)
+- Timeouts pro Request und Gesamt-Timeout pro Lead
+- Abstand/Sperren pro Host über den gemeinsamen HostScheduler
+- Tote Domains scheitern sofort (DomainHealth), adaptive Timeouts
+- Parsing/Extraktion wird vom ImpressumScraperUltimate übernommen
+- Gleiche Download-Grenzen wie der PageFetcher (Byte-Obergrenze,
+  nur HTML/XML, Zeichensatz-Erkennung)
+
+Benötigt: pip install aiohttp
+"""
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, List
+from urllib.parse import urljoin
+
+from impressum_scraper_ultimate import ImpressumScraperUltimate, ContactResult
+from html_document import HtmlDocument
+from page_fetcher import (CHUNK_SIZE, NonHtmlContentError, decode_body, is_text_content_type,
+                          looks_binary, media_type)
+
+# aiohttp optional
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+    # Fehler, die DomainHealth verbucht: DNS/Verbindungsaufbau, keine Lese-Timeouts
+    # (ConnectionTimeoutError erst ab aiohttp 3.10)
+    CONNECT_ERRORS = (aiohttp.ClientConnectorError,) + (
+        (aiohttp.ConnectionTimeoutError,) if hasattr(aiohttp, 'ConnectionTimeoutError') else ()
+    )
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logging.info("aiohttp nicht installiert - Async-Backend nicht verfügbar")
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncImpressumScraper:
+    """
+    Async-Variante des ImpressumScraperUltimate
+
+    Verwendung:
+        scraper = AsyncImpressumScraper()
+        results = asyncio.run(scraper.scrape_many(websites))
+
+    Oder über den synchronen Scraper:
+        ImpressumScraperUltimate().scrape_multiple(websites, backend='async')
+    """
+
+    def __init__(self, scraper: ImpressumScraperUltimate = None,
+                 concurrency: int = 200, limit_per_host: int = 4,
+                 request_timeout: float = 15, lead_timeout: float = 120):
+        """
+        Args:
+            scraper: ImpressumScraperUltimate für Parsing, Cache und API (wird sonst erstellt)
+            concurrency: Max. gleichzeitig bearbeitete Leads (und offene Verbindungen)
+            limit_per_host: Max. gleichzeitige Verbindungen pro Host
+            request_timeout: Gesamt-Timeout pro HTTP-Request in Sekunden
+            lead_timeout: Gesamt-Timeout pro Lead in Sekunden
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp nicht installiert. Installiere mit: pip install aiohttp")
+
+        self.scraper = scraper or ImpressumScraperUltimate()
+        self.concurrency = max(1, concurrency)
+        self.limit_per_host = max(1, limit_per_host)
+        self.request_timeout = request_timeout
+        self.lead_timeout = lead_timeout
+
+        # Rate Limiting pro Host (gleicher Scheduler wie der Sync-Scraper)
+        self.scheduler = self.scraper.scheduler
+
+        self.headers = dict(self.scraper.headers)
+
+        self._session: Optional['aiohttp.ClientSession'] = None
+
+    # ===== SESSION =====
+
+    def _create_session(self) -> 'aiohttp.ClientSession':
+        """Erstellt ClientSession mit Verbindungs-Limits"""
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=300,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+        )
+
+    async def __aenter__(self):
+        self._session = self._create_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Schließt die ClientSession"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @asynccontextmanager
+    async def _open(self, url: str, timeout: tuple):
+        """
+        GET-Request über HostScheduler und DomainHealth
+
+        Tote Domains scheitern sofort, Timeouts werden an die beobachteten
+        Latenzen angepasst, Verbindungsfehler (DNS, Connect) werden verbucht.
+        DomainHealth liest/schreibt dabei ggf. SQLite - das läuft im
+        Thread-Pool, damit der Event-Loop nicht blockiert.
+
+        Args:
+            timeout: (connect, total) in Sekunden
+        """
+        health = self.scraper.health
+        if await asyncio.to_thread(health.is_dead, url):
+            raise aiohttp.ClientError(f"Domain übersprungen (tot): {url}")
+
+        connect, total = health.timeout_for(url, timeout)
+        client_timeout = aiohttp.ClientTimeout(total=total, connect=connect)
+
+        async with self.scheduler.async_slot(url):
+            start = time.monotonic()
+            try:
+                response = await self._session.get(url, timeout=client_timeout, allow_redirects=True)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if isinstance(e, CONNECT_ERRORS):
+                    await asyncio.to_thread(health.record_failure, url, e, start)
+                raise
+            await asyncio.to_thread(health.record_success, url, time.monotonic() - start)
+            self.scheduler.record_response(url, response.status, response.headers)
+
+            async with response:
+                yield response
+
+    async def _get(self, url: str, timeout: float = None) -> tuple:
+        """
+        GET-Request
+
+        Returns:
+            Tuple: (status_code, text, truncated) - text ist leer bei Status >= 400
+        """
+        timeout = timeout or self.request_timeout
+        async with self._open(url, (timeout, timeout)) as response:
+            if response.status >= 400:
+                return response.status, "", False
+            text, truncated = await self._read_text(response)
+            return response.status, text, truncated
+
+    async def _read_text(self, response: 'aiohttp.ClientResponse') -> tuple:
+        """
+        Liest den Body bis zur Byte-Obergrenze des PageFetchers
+
+        Raises:
+            NonHtmlContentError: Content-Type bzw. Inhalt ist kein HTML/XML
+
+        Returns:
+            Tuple: (text, truncated)
+        """
+        content_type = response.headers.get('Content-Type', '')
+        if not is_text_content_type(content_type):
+            raise NonHtmlContentError(f"Kein HTML ({media_type(content_type)}): {response.url}")
+
+        max_bytes = self.scraper.fetcher.max_bytes
+        buffer = bytearray()
+        truncated = False
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            buffer += chunk
+            if len(buffer) > max_bytes:
+                del buffer[max_bytes:]
+                truncated = True
+                break
+
+        body = bytes(buffer)
+        if looks_binary(body):
+            raise NonHtmlContentError(f"Binärer Inhalt: {response.url}")
+        if truncated:
+            logger.warning(f"✂️ Seite nach {max_bytes // 1024} KB abgeschnitten: {response.url}")
+
+        text, _ = decode_body(body, content_type, truncated=truncated)
+        return text, truncated
+
+    # ===== IMPRESSUM URL FINDEN =====
+
+    async def find_impressum_url(self, base_url: str) -> Optional[str]:
+        """
+        Findet die Impressum-URL (gleiche Strategien wie der Sync-Scraper)
+
+        1. Cache prüfen
+        2. Footer-Links / alle Links der Homepage
+        3. Bekannte URL-Patterns testen
+        4. Sitemap durchsuchen
+        5. DeepSeek API als Fallback
+        """
+        scraper = self.scraper
+
+        # Cache Check ("" = zuletzt nicht gefunden) - SQLite im Thread-Pool,
+        # ein wartender WAL-Lock blockiert sonst alle Leads im Event-Loop
+        cache_key = f"impressum:{base_url}"
+        cached = await asyncio.to_thread(scraper.cache.get, cache_key)
+        if cached:
+            logger.info(f"📦 Cache-Treffer: {cached}")
+            return cached
+        if cached == "":
+            logger.info(f"📦 Cache: kein Impressum bei {base_url}")
+            return None
+        if await asyncio.to_thread(scraper.health.is_dead, base_url):
+            logger.info(f"💀 Domain übersprungen (tot): {base_url}")
+            return None
+
+        impressum_url = None
+        try:
+            status, html, _ = await self._get(base_url)
+            if status >= 400:
+                raise aiohttp.ClientError(f"HTTP {status} bei {base_url}")
+
+            # Strategie 1+2: Parsing im Thread-Pool, damit der Event-Loop frei bleibt
+            doc = scraper.document(html, base_url)
+            impressum_url = await asyncio.to_thread(scraper._find_in_homepage, doc, base_url)
+
+            # Strategie 3: Bekannte URL-Patterns testen
+            if not impressum_url:
+                impressum_url = await self._try_common_paths(base_url)
+
+            # Strategie 4: Sitemap durchsuchen (nicht wenn die Domain inzwischen tot ist)
+            if not impressum_url and not await asyncio.to_thread(scraper.health.is_dead, base_url):
+                impressum_url = await self._find_in_sitemap(base_url)
+
+            # Strategie 5: DeepSeek API
+            if not impressum_url and scraper.api_enabled:
+                impressum_url = await asyncio.to_thread(scraper._api_find_impressum, doc, base_url)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Fehler beim Finden der Impressum-URL: {e}")
+
+        # Tote Domains regelt DomainHealth (eigene TTL), kein Negativ-Eintrag
+        if impressum_url or not await asyncio.to_thread(scraper.health.is_dead, base_url):
+            await asyncio.to_thread(scraper._cache_impressum, cache_key, impressum_url or "")
+        return impressum_url
+
+    async def _try_common_paths(self, base_url: str) -> Optional[str]:
+        """
+        Testet häufige Impressum-URLs parallel
+
+        Gewinner ist der erste Treffer in der Reihenfolge von
+        COMMON_IMPRESSUM_PATHS; danach werden die restlichen Tasks abgebrochen.
+        """
+        logger.info("🔍 Teste bekannte URL-Pfade...")
+
+        test_urls = [urljoin(base_url, path) for path in self.scraper.COMMON_IMPRESSUM_PATHS]
+        tasks = [asyncio.create_task(self._probe_impressum_url(url)) for url in test_urls]
+
+        try:
+            for test_url, task in zip(test_urls, tasks):
+                if await task:
+                    logger.info(f"✅ Impressum via bekanntem Pfad: {test_url}")
+                    return test_url
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return None
+
+    async def _probe_impressum_url(self, url: str) -> bool:
+        """Bedingter GET: Body wird nur bei Status 200 gelesen"""
+        try:
+            async with self._open(url, (5, 10)) as response:
+                if response.status != 200:
+                    return False
+                html, _ = await self._read_text(response)
+                return self.scraper._looks_like_impressum(html)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return False
+
+    async def _find_in_sitemap(self, base_url: str) -> Optional[str]:
+        """Durchsucht Sitemap nach Impressum"""
+        logger.info("🗺️ Durchsuche Sitemap...")
+
+        for path in self.scraper.SITEMAP_PATHS:
+            try:
+                status, xml, _ = await self._get(urljoin(base_url, path), timeout=10)
+                if status == 200:
+                    url = await asyncio.to_thread(self.scraper._find_in_sitemap_xml, xml)
+                    if url:
+                        return url
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                continue
+
+        return None
+
+    # ===== HTML LADEN =====
+
+    async def scrape_html(self, url: str, use_selenium: bool = False) -> str:
+        """Lädt HTML von URL mit optionalem Selenium-Fallback"""
+        doc = await self.fetch_document(url, use_selenium)
+        return doc.html if doc else ""
+
+    async def fetch_document(self, url: str, use_selenium: bool = False) -> Optional[HtmlDocument]:
+        """Lädt eine Seite als HtmlDocument (Parse-Baum wird für die Extraktion weiterverwendet)"""
+        scraper = self.scraper
+
+        if not use_selenium:
+            try:
+                status, html, truncated = await self._get(url)
+                if status < 400:
+                    doc = scraper.document(html, url, truncated=truncated)
+                    if await asyncio.to_thread(scraper._is_usable_html, doc):
+                        return doc
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Async Request fehlgeschlagen: {e}")
+
+        # Fallback: Selenium (blockierend → Thread-Pool, nicht bei toten Domains)
+        if scraper.chrome_driver_path and not await asyncio.to_thread(scraper.health.is_dead, url):
+            logger.info("🌐 Verwende Selenium...")
+            html = await asyncio.to_thread(scraper._scrape_with_selenium, url)
+            if html:
+                return scraper.document(html, url)
+
+        return None
+
+    # ===== HAUPTMETHODEN =====
+
+    async def scrape(self, website: str) -> ContactResult:
+        """
+        Scraped alle Kontaktdaten aus dem Impressum einer Website
+
+        Kann einzeln oder innerhalb von `async with AsyncImpressumScraper()` genutzt werden.
+        """
+        if self._session is None:
+            async with self:
+                return await self.scrape(website)
+
+        try:
+            return await asyncio.wait_for(self._scrape(website), timeout=self.lead_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⏱️ Lead-Timeout ({self.lead_timeout}s): {website}")
+            return ContactResult()
+
+    async def _scrape(self, website: str) -> ContactResult:
+        """Ablauf wie ImpressumScraperUltimate.scrape()"""
+        result = ContactResult()
+        scraper = self.scraper
+
+        try:
+            base_url = scraper.normalize_url(website)
+            if not base_url:
+                logger.error(f"❌ Ungültige URL: {website}")
+                return result
+
+            logger.info(f"🔍 Scrape (async): {base_url}")
+
+            # Schritt 1: Finde Impressum-URL
+            impressum_url = await self.find_impressum_url(base_url)
+
+            if not impressum_url:
+                logger.warning(f"⚠️ Kein Impressum gefunden: {base_url}")
+                return result
+
+            result.impressum_url = impressum_url
+
+            # Schritt 2: Lade HTML (einmal geparst für alle Extraktoren)
+            doc = await self.fetch_document(impressum_url)
+
+            if not doc:
+                logger.warning(f"⚠️ Kein HTML geladen: {impressum_url}")
+                return result
+
+            # Schritt 3-5: Extraktion (CPU) im Thread-Pool
+            await asyncio.to_thread(scraper.extract_contact_data, doc, result)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Scraping-Fehler: {e}")
+
+        return result
+
+    async def scrape_many(self, websites: List[str], progress_callback=None) -> List[ContactResult]:
+        """
+        Scraped viele Websites auf einem Event-Loop
+
+        Args:
+            websites: Liste von Website-URLs
+            progress_callback: Optional - Funktion(current, total, website)
+
+        Returns:
+            Liste von ContactResult (gleiche Reihenfolge wie websites)
+        """
+        if self._session is None:
+            async with self:
+                return await self.scrape_many(websites, progress_callback)
+
+        total = len(websites)
+        results: List[Optional[ContactResult]] = [None] * total
+        queue = asyncio.Queue()
+        for item in enumerate(websites):
+            queue.put_nowait(item)
+
+        completed = 0
+
+        async def worker():
+            nonlocal completed
+            while True:
+                try:
+                    idx, website = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                results[idx] = await self.scrape(website)
+
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total, website)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, total))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        return results
@@ -10,22 +10,27 @@ Features:
 - Multi-Page-Scan (Homepage, Kontakt, About, Footer-Links)
 - Robuste Fallbacks auf allen Ebenen
 """
-import requests
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup
 import re
-import time
 import logging
 import json
 import os
+import threading
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 from urllib.parse import urljoin, urlparse, parse_qs, unquote
-from typing import Optional, Tuple, List, Dict, Any
-from dataclasses import dataclass, field
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+from typing import Optional, Tuple, List, Dict, Any, Union, Iterator
+from dataclasses import dataclass, field, asdict
 from selenium.common.exceptions import WebDriverException, TimeoutException as SeleniumTimeout
 from webdriver_manager.chrome import ChromeDriverManager
-import html as html_module
+
+from scrape_cache import ScrapeCache
+from page_fetcher import get_page_fetcher, bind_run, FetchedPage, DEFAULT_HEADERS
+from browser_pool import get_browser_pool
+from html_document import HtmlDocument, resolve_html_parser, locate_impressum_window
+from llm_batching import LLMBatcher, INVALID_ANSWER
+from llm_client import get_llm_client
 
 # Versuche dotenv zu laden (optional)
 try:
@@ -39,6 +44,15 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class NamePattern:
+    """Regex für Namen mit Priorität und Anker-Schlüsselwort für den gemeinsamen Scan"""
+    priority: float
+    regex: re.Pattern
+    anchor: str                    # Regex-Alternativen (klein), z.B. 'geschäftsführ|inhaber'
+    anchor_at_end: bool = False    # Treffer endet mit dem Anker statt damit zu beginnen
+
+
 @dataclass
 class ContactResult:
     """Strukturiertes Ergebnis der Kontaktdaten-Extraktion"""
@@ -54,6 +68,7 @@ class ContactResult:
     found_email: bool = False
     extraction_method: Optional[str] = None  # Wie wurde der Name gefunden
     confidence: float = 0.0  # 0.0 - 1.0
+    html_truncated: bool = False  # Impressum-HTML nach Byte-Obergrenze abgeschnitten
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -68,7 +83,8 @@ class ContactResult:
             'found_name': self.found_name,
             'found_email': self.found_email,
             'extraction_method': self.extraction_method,
-            'confidence': self.confidence
+            'confidence': self.confidence,
+            'html_truncated': self.html_truncated
         }
 
 
@@ -131,6 +147,42 @@ class ImpressumScraperUltimate:
         '.site-info', '#site-info',
     ]
     
+    # Alter JSON-Cache (wird beim ersten Start in den SQLite-Cache übernommen)
+    LEGACY_CACHE_FILE = "impressum_cache_v2.json"
+    
+    # Bekannte Impressum-Pfade (in Prioritäts-Reihenfolge)
+    COMMON_IMPRESSUM_PATHS = [
+        '/impressum',
+        '/impressum/',
+        '/imprint',
+        '/imprint/',
+        '/legal',
+        '/legal/',
+        '/legal-notice',
+        '/legal-notice/',
+        '/rechtliches',
+        '/rechtliches/',
+        '/about/impressum',
+        '/about/legal',
+        '/de/impressum',
+        '/de/imprint',
+        '/ueber-uns/impressum',
+        '/about-us/legal',
+        '/kontakt/impressum',
+        '/contact/legal',
+    ]
+    
+    # Mindestens eines davon muss auf einer Impressum-Seite vorkommen
+    IMPRESSUM_CONTENT_KEYWORDS = ['impressum', 'imprint', 'geschäftsführer', 'inhaber', 'verantwortlich']
+    
+    # Sitemap-Pfade
+    SITEMAP_PATHS = ['/sitemap.xml', '/sitemap_index.xml', '/sitemap', '/sitemap.xml.gz']
+
+    # Selenium: Seite gilt als gerendert, sobald Impressum-Inhalt sichtbar ist
+    # ("impressum" allein steht auch im Footer, bevor der Inhalt geladen ist)
+    SELENIUM_READY_KEYWORDS = ['angaben gemäß', 'geschäftsführer', 'inhaber', 'vertreten durch',
+                               'registergericht', 'handelsregister', 'ust-id']
+    
     # Positions-Keywords für Geschäftsführer (priorisiert)
     POSITION_KEYWORDS = [
         # Höchste Priorität - Geschäftsführung
@@ -183,7 +235,7 @@ class ImpressumScraperUltimate:
     ]
     
     # Häufige deutsche Vornamen (Top 500 - für Validierung)
-    COMMON_FIRST_NAMES = {
+    COMMON_FIRST_NAMES = frozenset({
         # Männlich
         'alexander', 'andreas', 'benjamin', 'christian', 'daniel', 'david',
         'dennis', 'dominik', 'eric', 'erik', 'fabian', 'felix', 'florian',
@@ -208,10 +260,10 @@ class ImpressumScraperUltimate:
         'nina', 'petra', 'sabine', 'sabrina', 'sandra', 'sara', 'sarah',
         'silke', 'simone', 'sophia', 'stefanie', 'stephanie', 'susanne',
         'tanja', 'ulrike', 'ursula', 'vanessa', 'vera', 'yvonne',
-    }
+    })
     
     # Wörter die KEINE Namen sind (Blacklist)
-    NAME_BLACKLIST = {
+    NAME_BLACKLIST = frozenset({
         # Firmenzusätze
         'gmbh', 'gbr', 'ag', 'kg', 'ohg', 'ug', 'mbh', 'co', 'inc', 'ltd',
         'limited', 'corporation', 'corp', 'llc', 'plc', 'se', 'ev', 'eg',
@@ -241,28 +293,70 @@ class ImpressumScraperUltimate:
         # Andere
         'germany', 'deutschland', 'austria', 'österreich', 'schweiz',
         'swiss', 'europe', 'europa',
-    }
+    })
+    
+    # Blacklist als ein Regex: ein Suchlauf statt Teilstring-Test pro Eintrag
+    NAME_BLACKLIST_PATTERN = re.compile('|'.join(
+        re.escape(word) for word in sorted(NAME_BLACKLIST, key=len, reverse=True)
+    ))
+    
+    # Titel/Anreden, die _split_name entfernt (klein, ohne Punkt)
+    NAME_TITLES = frozenset({
+        'dr', 'prof', 'dipl', 'ing', 'mag', 'rer', 'nat', 'med',
+        'herr', 'frau', 'mr', 'mrs', 'ms',
+    })
 
-    def __init__(self, api_config_file: str = "api_config.json"):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        # Session für Connection Pooling
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
-        
-        # Cache
-        self.cache_file = "impressum_cache_v2.json"
-        self.cache = self._load_cache()
-        
-        # ChromeDriver
-        self._init_chrome_driver()
+    def __init__(self, api_config_file: str = "api_config.json", max_workers: int = 8,
+                 cache_path: str = "impressum_cache.db", http_cache_path: str = "http_cache.db",
+                 html_parser: Optional[str] = None, use_selenium: bool = True,
+                 health_path: str = "domain_health.db"):
+        self.headers = dict(DEFAULT_HEADERS)
+        
+        # Parallelität für scrape_multiple (1 = sequentiell)
+        self.max_workers = max(1, max_workers)
+        
+        # Threads für Pfad-Prüfungen in _try_common_paths (ein Pool für alle Worker;
+        # der Verbindungs-Pool hat Platz für Worker + Prüfungen)
+        self.path_probe_workers = max(6, self.max_workers)
+        self._probe_executor: Optional[ThreadPoolExecutor] = None
+        self._probe_executor_lock = threading.Lock()
+        
+        # Fetch-Backend für scrape_multiple: 'threads' oder 'async' (benötigt aiohttp)
+        self.backend = 'threads'
+        
+        # Prozesse für Parsen + Extraktion in scrape_multiple (0 = im Fetch-Thread)
+        self.extraction_processes = 0
+        self._extraction_pool: Optional[ProcessPoolExecutor] = None
+        self._extraction_pool_size = 0
+        self._extraction_pool_lock = threading.Lock()
+        
+        # API-Namensanfragen paralleler Worker bündeln (scrape_multiple, 1 = aus):
+        # Flush bei api_batch_size Texten oder nach api_batch_wait Sekunden
+        self.api_batch_size = 8
+        self.api_batch_wait = 0.5
+        self._name_batcher: Optional[LLMBatcher] = None
+        
+        # BeautifulSoup-Backend ('lxml' wenn installiert, sonst 'html.parser')
+        self.html_parser = resolve_html_parser(html_parser)
+        
+        # Gemeinsamer Page-Fetcher (mit dem E-Mail-Scraper): jede Seite max. einmal pro Lauf
+        # Session mit Connection Pooling (Pool groß genug für alle Worker),
+        # Response-Cache: Re-Scrapes revalidieren per ETag/Last-Modified
+        # Rate Limiting pro Host (statt fester Pause nach jedem Lead)
+        # Tote Domains: fail fast + adaptive Timeouts (persistent über Läufe)
+        self.fetcher = get_page_fetcher(http_cache_path, health_path,
+                                        pool_size=self.max_workers + self.path_probe_workers)
+        self.session = self.fetcher.session
+        self.scheduler = self.session.scheduler
+        self.health = self.session.health
+        
+        # Cache (SQLite, von GUI/Streamlit/CLI gemeinsam nutzbar)
+        self.cache = self._load_cache(cache_path)
+        
+        # ChromeDriver (use_selenium=False: nur requests, z.B. für Offline-Benchmarks)
+        self.chrome_driver_path = None
+        if use_selenium:
+            self._init_chrome_driver()
         
         # API Config
         self._load_api_config(api_config_file)
@@ -270,6 +364,22 @@ class ImpressumScraperUltimate:
         # Kompilierte Regex-Patterns (Performance)
         self._compile_patterns()
 
+    @classmethod
+    def extraction_only(cls, html_parser: Optional[str] = None) -> 'ImpressumScraperUltimate':
+        """
+        Scraper nur für die Extraktion aus vorhandenem HTML
+        
+        Ohne Netzwerk, Cache, Chrome und API - z.B. für Worker-Prozesse
+        und Benchmarks.
+        """
+        scraper = cls.__new__(cls)
+        scraper.api_enabled = False
+        scraper._name_batcher = None
+        scraper.chrome_driver_path = None
+        scraper.html_parser = resolve_html_parser(html_parser)
+        scraper._compile_patterns()
+        return scraper
+
     def _init_chrome_driver(self):
         """Initialisiert ChromeDriver mit Fallback"""
         self.chrome_driver_path = None
@@ -279,23 +389,18 @@ class ImpressumScraperUltimate:
         except Exception as e:
             logger.warning(f"⚠️ ChromeDriver nicht verfügbar: {e}")
 
-    def _load_cache(self) -> Dict:
-        """Lädt Cache aus Datei"""
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Cache laden fehlgeschlagen: {e}")
-        return {}
-
-    def _save_cache(self):
-        """Speichert Cache"""
-        try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Cache speichern fehlgeschlagen: {e}")
+    def _load_cache(self, cache_path: str) -> ScrapeCache:
+        """Öffnet den Cache und übernimmt einmalig den alten JSON-Cache"""
+        cache = ScrapeCache(
+            cache_path,
+            table='impressum',
+            ttl=30 * 24 * 3600,        # Treffer: 30 Tage
+            negative_ttl=24 * 3600,    # Nicht gefunden: 1 Tag
+            max_entries=100000
+        )
+        if not len(cache):
+            cache.import_json(self.LEGACY_CACHE_FILE)
+        return cache
 
     def _load_api_config(self, config_file: str):
         """Lädt API-Konfiguration"""
@@ -334,77 +439,108 @@ class ImpressumScraperUltimate:
         """Kompiliert Regex-Patterns für Performance"""
         
         # Name-Extraktions-Patterns (priorisiert)
-        self.name_patterns = []
+        # Jedes Pattern hat einen Anker: das Schlüsselwort, mit dem ein Treffer
+        # beginnt (anchor_at_end=True: mit dem er endet, z.B. "Name, Geschäftsführer")
+        self.name_patterns: List[NamePattern] = []
         
-        # Pattern-Gruppen mit Priorität
+        # Pattern-Gruppen mit Priorität: (Anker, Pattern[, anchor_at_end])
         pattern_groups = [
             # Gruppe 1: Geschäftsführer mit Doppelpunkt/Leerzeichen
             (1.0, [
-                r'Geschäftsführer(?:in)?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
-                r'Geschäftsführung[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
-                r'GF[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
+                ('geschäftsführ', r'Geschäftsführer(?:in)?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
+                ('geschäftsführ', r'Geschäftsführung[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
+                ('gf', r'GF[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
             ]),
             
             # Gruppe 2: Inhaber
             (0.95, [
-                r'Inhaber(?:in)?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
-                r'Einzelunternehmer(?:in)?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
+                ('inhaber', r'Inhaber(?:in)?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
+                ('einzelunternehmer', r'Einzelunternehmer(?:in)?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
             ]),
             
             # Gruppe 3: Vertreten durch
             (0.9, [
-                r'[Vv]ertreten\s+durch[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
-                r'[Gg]esetzlich\s+vertreten[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
-                r'[Vv]ertretungsberechtigt(?:er)?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
+                ('vertret', r'[Vv]ertreten\s+durch[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
+                ('gesetzlich', r'[Gg]esetzlich\s+vertreten[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
+                ('vertret', r'[Vv]ertretungsberechtigt(?:er)?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
             ]),
             
             # Gruppe 4: CEO/Vorstand (Englisch/Deutsch)
             (0.85, [
-                r'CEO[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
-                r'Chief\s+Executive[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
-                r'Managing\s+Director[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
-                r'Vorstand(?:svorsitzende(?:r)?)?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
+                ('ceo', r'CEO[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
+                ('chief', r'Chief\s+Executive[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
+                ('managing', r'Managing\s+Director[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
+                ('vorstand', r'Vorstand(?:svorsitzende(?:r)?)?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
             ]),
             
             # Gruppe 5: Verantwortlich
             (0.7, [
-                r'[Vv]erantwortlich(?:\s+(?:für|i\.?S\.?d\.?|gem(?:äß|\.)))?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
-                r'V\.?i\.?S\.?d\.?P\.?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
-                r'[Ii]nhaltlich\s+[Vv]erantwortlich[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
+                ('verantwortlich', r'[Vv]erantwortlich(?:\s+(?:für|i\.?S\.?d\.?|gem(?:äß|\.)))?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
+                (r'v\.?i\.?s', r'V\.?i\.?S\.?d\.?P\.?[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
+                ('inhaltlich', r'[Ii]nhaltlich\s+[Vv]erantwortlich[:\s]+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
             ]),
             
             # Gruppe 6: Mit Titel (Dr., Prof., etc.)
             (0.8, [
-                r'(?:Dr\.|Prof\.|Dipl\.-\w+\.?)\s+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)',
+                (r'dr\.|prof\.|dipl\.-', r'(?:Dr\.|Prof\.|Dipl\.-\w+\.?)\s+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß\-]+)+)'),
             ]),
             
             # Gruppe 7: Sonderformate
             (0.6, [
                 # "Name, Geschäftsführer"
-                r'([A-ZÄÖÜ][a-zäöüß]+\s+[A-ZÄÖÜ][a-zäöüß\-]+),?\s*(?:Geschäftsführer|Inhaber|CEO)',
+                ('geschäftsführ|inhaber|ceo', r'([A-ZÄÖÜ][a-zäöüß]+\s+[A-ZÄÖÜ][a-zäöüß\-]+),?\s*(?:Geschäftsführer|Inhaber|CEO)', True),
                 # Nur Großbuchstaben-Wörter nach Schlüsselwort
-                r'Geschäftsführer[:\s]*\n\s*([A-ZÄÖÜ][a-zäöüß]+\s+[A-ZÄÖÜ][a-zäöüß\-]+)',
+                ('geschäftsführ', r'Geschäftsführer[:\s]*\n\s*([A-ZÄÖÜ][a-zäöüß]+\s+[A-ZÄÖÜ][a-zäöüß\-]+)'),
             ]),
         ]
         
         for priority, patterns in pattern_groups:
-            for pattern in patterns:
+            for anchor, pattern, *at_end in patterns:
                 try:
-                    self.name_patterns.append((priority, re.compile(pattern, re.IGNORECASE | re.MULTILINE)))
+                    self.name_patterns.append(NamePattern(
+                        priority, re.compile(pattern, re.IGNORECASE | re.MULTILINE), anchor, bool(at_end and at_end[0])
+                    ))
                 except re.error as e:
                     logger.warning(f"Regex-Fehler: {pattern} - {e}")
         
+        # Ein Scan über alle Anker statt findall pro Pattern.
+        # Anker nach Anfangsbuchstaben gruppiert (Präfix-Baum): an den meisten
+        # Positionen scheitert der Scan schon am ersten Zeichen
+        anchors = list(dict.fromkeys(alt for p in self.name_patterns for alt in p.anchor.split('|')))
+        self._anchor_rules = {
+            f'a{i}': [idx for idx, p in enumerate(self.name_patterns) if anchor in p.anchor.split('|')]
+            for i, anchor in enumerate(anchors)
+        }
+        branches: Dict[str, List[str]] = {}
+        for i, anchor in enumerate(anchors):
+            branches.setdefault(anchor[0], []).append(f'(?P<a{i}>{anchor[1:]})')
+        anchor_pattern = '|'.join(f'{first}(?:{"|".join(rest)})' for first, rest in branches.items())
+        # Ohne IGNORECASE auf dem klein geschriebenen Text (deutlich schneller),
+        # mit IGNORECASE als Rückfall, falls lower() die Textlänge ändert
+        self._name_anchor_scan = re.compile(anchor_pattern)
+        self._name_anchor_scan_ci = re.compile(anchor_pattern, re.IGNORECASE)
+        
         # E-Mail Pattern
         self.email_pattern = re.compile(
             r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
             re.IGNORECASE
         )
         
+        # Obfuskierte E-Mails: name (at) domain (dot) de
+        self.obfuscated_email_pattern = re.compile(
+            r'([a-zA-Z0-9._%+-]+)\s*[\[\(]?\s*(?:at|@|AT)\s*[\]\)]?\s*([a-zA-Z0-9.-]+)\s*[\[\(]?\s*(?:dot|\.)\s*[\]\)]?\s*([a-zA-Z]{2,})',
+            re.IGNORECASE
+        )
+        
         # Telefon Pattern
         self.phone_pattern = re.compile(
             r'(?:\+49|0049|0)\s*[\d\s/\-\(\)]{8,}',
             re.IGNORECASE
         )
+        self.phone_patterns = [
+            re.compile(r'(?:Tel\.?|Telefon|Phone|Fon)[:\s]+([+\d\s\-/\(\)]{8,})', re.IGNORECASE),
+            self.phone_pattern,
+        ]
 
     # ===== URL NORMALISIERUNG =====
     
@@ -446,29 +582,28 @@ class ImpressumScraperUltimate:
         5. Sitemap durchsuchen
         6. DeepSeek API als Fallback
         """
-        # Cache Check
+        # Cache Check ("" = zuletzt nicht gefunden, bis negative_ttl abläuft)
         cache_key = f"impressum:{base_url}"
-        if cache_key in self.cache:
-            cached = self.cache[cache_key]
-            if cached:
-                logger.info(f"📦 Cache-Treffer: {cached}")
-                return cached
+        cached = self.cache.get(cache_key)
+        if cached:
+            logger.info(f"📦 Cache-Treffer: {cached}")
+            return cached
+        if cached == "":
+            logger.info(f"📦 Cache: kein Impressum bei {base_url}")
+            return None
+        
+        if self.health.is_dead(base_url):
+            logger.info(f"💀 Domain übersprungen (tot): {base_url}")
+            return None
         
         try:
-            # Lade Homepage
-            response = self.session.get(base_url, timeout=15)
-            response.raise_for_status()
-            html = response.text
-            soup = BeautifulSoup(html, 'html.parser')
+            # Lade Homepage (gemeinsamer Seiten-Cache mit dem E-Mail-Scraper)
+            page = self.fetcher.fetch(base_url, timeout=15)
+            page.raise_for_status()
+            doc = self.page_document(page)
             
-            # Strategie 1: Footer-Links (höchste Trefferquote)
-            impressum_url = self._find_in_footer(soup, base_url)
-            if impressum_url:
-                self._cache_impressum(cache_key, impressum_url)
-                return impressum_url
-            
-            # Strategie 2: Alle Links durchsuchen
-            impressum_url = self._find_in_all_links(soup, base_url)
+            # Strategie 1+2: Footer-Links, dann alle Links der Homepage
+            impressum_url = self._find_in_homepage(doc, base_url)
             if impressum_url:
                 self._cache_impressum(cache_key, impressum_url)
                 return impressum_url
@@ -479,6 +614,10 @@ class ImpressumScraperUltimate:
                 self._cache_impressum(cache_key, impressum_url)
                 return impressum_url
             
+            # Domain während der Prüfungen ausgefallen: restliche Strategien sparen
+            if self.health.is_dead(base_url):
+                return None
+            
             # Strategie 4: Sitemap durchsuchen
             impressum_url = self._find_in_sitemap(base_url)
             if impressum_url:
@@ -487,7 +626,7 @@ class ImpressumScraperUltimate:
             
             # Strategie 5: DeepSeek API
             if self.api_enabled:
-                impressum_url = self._api_find_impressum(html, base_url)
+                impressum_url = self._api_find_impressum(doc, base_url)
                 if impressum_url:
                     self._cache_impressum(cache_key, impressum_url)
                     return impressum_url
@@ -495,65 +634,68 @@ class ImpressumScraperUltimate:
         except Exception as e:
             logger.error(f"Fehler beim Finden der Impressum-URL: {e}")
         
+        # Tote Domains regelt DomainHealth (eigene TTL), kein Negativ-Eintrag
+        if self.health.is_dead(base_url):
+            return None
+        
         # Nichts gefunden
         self._cache_impressum(cache_key, "")
         return None
 
     def _cache_impressum(self, key: str, value: str):
-        """Cached Impressum-URL"""
-        self.cache[key] = value
-        self._save_cache()
+        """Cached Impressum-URL ("" = nicht gefunden)"""
+        self.cache.set(key, value)
 
-    def _find_in_footer(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
-        """Sucht Impressum-Link im Footer (höchste Trefferquote)"""
-        logger.info("🔍 Suche im Footer...")
+    def forget_failure(self, website: str):
+        """Verwirft Negativ-Cache, Domain-Sperre und die im Lauf geladenen Seiten, damit ein erneuter Versuch wirklich lädt"""
+        base_url = self.normalize_url(website)
+        if not base_url:
+            return
+        key = f"impressum:{base_url}"
+        if self.cache.get(key) == "":
+            self.cache.delete(key)
+        self.health.revive(base_url)
+        self.fetcher.forget_host(base_url)
+
+    def _find_in_homepage(self, html: Union[str, HtmlDocument], base_url: str) -> Optional[str]:
+        """Sucht Impressum-Link im HTML der Homepage (Footer, dann alle Links)"""
+        doc = self.document(html, base_url)
         
-        # Finde Footer-Elemente
-        footer_elements = []
-        for selector in self.FOOTER_SELECTORS:
-            try:
-                if selector.startswith(('#', '.', '[')):
-                    elements = soup.select(selector)
-                else:
-                    elements = soup.find_all(selector)
-                footer_elements.extend(elements)
-            except Exception:
-                continue
+        # Strategie 1: Footer-Links (höchste Trefferquote)
+        impressum_url = self._find_in_footer(doc, base_url)
+        if impressum_url:
+            return impressum_url
         
-        # Falls kein Footer gefunden, nimm die letzten 30% der Seite
-        if not footer_elements:
-            all_links = soup.find_all('a', href=True)
-            if len(all_links) > 10:
-                footer_elements = all_links[int(len(all_links) * 0.7):]
+        # Strategie 2: Alle Links durchsuchen
+        return self._find_in_all_links(doc, base_url)
+
+    def _find_in_footer(self, doc: HtmlDocument, base_url: str) -> Optional[str]:
+        """Sucht Impressum-Link im Footer (höchste Trefferquote)"""
+        logger.info("🔍 Suche im Footer...")
         
-        # Durchsuche Footer-Links
-        for element in footer_elements:
-            links = element.find_all('a', href=True) if hasattr(element, 'find_all') else [element]
+        # Footer-Links (ohne Footer: die letzten 30% der Seite)
+        for href, text in doc.footer_links:
+            text = text.lower()
             
-            for link in links:
-                href = link.get('href', '')
-                text = link.get_text(strip=True).lower()
-                
-                # Prüfe auf Impressum-Keywords
-                for keyword in self.IMPRESSUM_KEYWORDS:
-                    if keyword in text or keyword in href.lower():
-                        impressum_url = self._resolve_url(href, base_url)
-                        if impressum_url:
-                            logger.info(f"✅ Impressum im Footer gefunden: {impressum_url}")
-                            return impressum_url
+            # Prüfe auf Impressum-Keywords
+            for keyword in self.IMPRESSUM_KEYWORDS:
+                if keyword in text or keyword in href.lower():
+                    impressum_url = self._resolve_url(href, base_url)
+                    if impressum_url:
+                        logger.info(f"✅ Impressum im Footer gefunden: {impressum_url}")
+                        return impressum_url
         
         return None
 
-    def _find_in_all_links(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
+    def _find_in_all_links(self, doc: HtmlDocument, base_url: str) -> Optional[str]:
         """Durchsucht alle Links auf der Seite"""
         logger.info("🔍 Durchsuche alle Links...")
         
-        all_links = soup.find_all('a', href=True)
+        all_links = doc.links
         
         # Erste Runde: Exakte Matches
-        for link in all_links:
-            href = link.get('href', '')
-            text = link.get_text(strip=True).lower()
+        for href, text in all_links:
+            text = text.lower()
             
             # Exakte Keyword-Matches
             for keyword in ['impressum', 'imprint', 'legal notice', 'legal-notice']:
@@ -564,9 +706,8 @@ class ImpressumScraperUltimate:
                         return impressum_url
         
         # Zweite Runde: Partielle Matches
-        for link in all_links:
-            href = link.get('href', '')
-            text = link.get_text(strip=True).lower()
+        for href, text in all_links:
+            text = text.lower()
             
             for keyword in self.IMPRESSUM_KEYWORDS[:20]:  # Top-20 Keywords
                 if keyword in text or keyword in href.lower():
@@ -584,79 +725,101 @@ class ImpressumScraperUltimate:
         return None
 
     def _try_common_paths(self, base_url: str) -> Optional[str]:
-        """Testet häufige Impressum-URLs"""
+        """
+        Testet häufige Impressum-URLs
+        
+        Alle Pfade werden parallel geprüft (gemeinsamer Prüf-Pool aller
+        Worker). Gewinner ist der erste Treffer in der Reihenfolge von
+        COMMON_IMPRESSUM_PATHS; sobald er feststeht, werden wartende
+        Prüfungen verworfen und laufende Downloads abgebrochen.
+        """
         logger.info("🔍 Teste bekannte URL-Pfade...")
         
-        common_paths = [
-            '/impressum',
-            '/impressum/',
-            '/imprint',
-            '/imprint/',
-            '/legal',
-            '/legal/',
-            '/legal-notice',
-            '/legal-notice/',
-            '/rechtliches',
-            '/rechtliches/',
-            '/about/impressum',
-            '/about/legal',
-            '/de/impressum',
-            '/de/imprint',
-            '/ueber-uns/impressum',
-            '/about-us/legal',
-            '/kontakt/impressum',
-            '/contact/legal',
-        ]
+        test_urls = [urljoin(base_url, path) for path in self.COMMON_IMPRESSUM_PATHS]
+        stop = threading.Event()
+        executor = self._get_probe_executor()
+        futures = [executor.submit(bind_run(self._probe_impressum_url), url, stop) for url in test_urls]
         
-        for path in common_paths:
-            test_url = urljoin(base_url, path)
-            try:
-                response = self.session.head(test_url, timeout=5, allow_redirects=True)
-                if response.status_code == 200:
-                    # Verifiziere: Seite enthält tatsächlich Impressum-Content
-                    content_response = self.session.get(test_url, timeout=10)
-                    if content_response.status_code == 200:
-                        text = content_response.text.lower()
-                        if any(kw in text for kw in ['impressum', 'imprint', 'geschäftsführer', 'inhaber', 'verantwortlich']):
-                            logger.info(f"✅ Impressum via bekanntem Pfad: {test_url}")
-                            return test_url
-            except Exception:
-                continue
+        try:
+            # In Prioritäts-Reihenfolge auswerten: wartet nur auf höher priorisierte Pfade
+            for test_url, future in zip(test_urls, futures):
+                if future.result():
+                    logger.info(f"✅ Impressum via bekanntem Pfad: {test_url}")
+                    return test_url
+        finally:
+            stop.set()
+            for future in futures:
+                future.cancel()
         
         return None
+    
+    def _get_probe_executor(self) -> ThreadPoolExecutor:
+        """Gemeinsamer Thread-Pool für Pfad-Prüfungen (einmal pro Scraper gestartet)"""
+        with self._probe_executor_lock:
+            if self._probe_executor is None:
+                self.session.ensure_pool_size(self.max_workers + self.path_probe_workers)
+                self._probe_executor = ThreadPoolExecutor(
+                    max_workers=self.path_probe_workers,
+                    thread_name_prefix='impressum-probe'
+                )
+            return self._probe_executor
+
+    def _probe_impressum_url(self, url: str, stop: threading.Event = None) -> bool:
+        """
+        Prüft eine Kandidaten-URL mit EINEM bedingten GET (ersetzt HEAD + GET)
+        """
+        if stop is not None and stop.is_set():
+            return False
+        
+        try:
+            # Treffer landen im Seiten-Cache - fetch_document lädt sie nicht erneut;
+            # stop bricht den Download ab, sobald ein anderer Pfad getroffen hat
+            page = self.fetcher.fetch(url, timeout=(5, 10), cancel=stop)
+            if page.status_code != 200 or (stop is not None and stop.is_set()):
+                return False
+            # Verifiziere: Seite enthält tatsächlich Impressum-Content
+            return self._looks_like_impressum(page.text)
+        except Exception:
+            return False
+
+    def _looks_like_impressum(self, html: str) -> bool:
+        """Prüft ob eine Seite tatsächlich Impressum-Content enthält"""
+        text = html.lower()
+        return any(kw in text for kw in self.IMPRESSUM_CONTENT_KEYWORDS)
 
     def _find_in_sitemap(self, base_url: str) -> Optional[str]:
         """Durchsucht Sitemap nach Impressum"""
         logger.info("🗺️ Durchsuche Sitemap...")
         
-        sitemap_urls = [
-            urljoin(base_url, '/sitemap.xml'),
-            urljoin(base_url, '/sitemap_index.xml'),
-            urljoin(base_url, '/sitemap'),
-            urljoin(base_url, '/sitemap.xml.gz'),
-        ]
-        
-        for sitemap_url in sitemap_urls:
+        for path in self.SITEMAP_PATHS:
+            sitemap_url = urljoin(base_url, path)
             try:
-                response = self.session.get(sitemap_url, timeout=10)
-                if response.status_code == 200:
-                    # Parse XML
-                    soup = BeautifulSoup(response.text, 'xml')
-                    
-                    for loc in soup.find_all('loc'):
-                        url = loc.text.strip()
-                        url_lower = url.lower()
-                        
-                        for keyword in ['impressum', 'imprint', 'legal-notice', 'legal']:
-                            if keyword in url_lower:
-                                logger.info(f"✅ Impressum in Sitemap: {url}")
-                                return url
+                page = self.fetcher.fetch(sitemap_url, timeout=10)
+                if page.status_code == 200:
+                    url = self._find_in_sitemap_xml(page.text)
+                    if url:
+                        return url
             except Exception:
                 continue
         
         return None
 
-    def _api_find_impressum(self, html: str, base_url: str) -> Optional[str]:
+    def _find_in_sitemap_xml(self, xml: str) -> Optional[str]:
+        """Sucht Impressum-URL in einer Sitemap (XML)"""
+        soup = BeautifulSoup(xml, 'xml')
+        
+        for loc in soup.find_all('loc'):
+            url = loc.text.strip()
+            url_lower = url.lower()
+            
+            for keyword in ['impressum', 'imprint', 'legal-notice', 'legal']:
+                if keyword in url_lower:
+                    logger.info(f"✅ Impressum in Sitemap: {url}")
+                    return url
+        
+        return None
+
+    def _api_find_impressum(self, html: Union[str, HtmlDocument], base_url: str) -> Optional[str]:
         """Verwendet DeepSeek API um Impressum-Link zu finden"""
         if not self.api_enabled:
             return None
@@ -665,12 +828,11 @@ class ImpressumScraperUltimate:
         
         try:
             # Extrahiere nur Links aus HTML (reduziert Token-Verbrauch)
-            soup = BeautifulSoup(html, 'html.parser')
+            doc = self.document(html, base_url)
             links_info = []
             
-            for link in soup.find_all('a', href=True)[:100]:  # Max 100 Links
-                href = link.get('href', '')
-                text = link.get_text(strip=True)[:50]
+            for href, text in doc.links[:100]:  # Max 100 Links
+                text = text[:50]
                 if href and text:
                     links_info.append(f"{text}: {href}")
             
@@ -684,30 +846,8 @@ class ImpressumScraperUltimate:
                 f"Links:\n{links_text}"
             )
             
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            data = {
-                'model': self.api_model,
-                'messages': [
-                    {'role': 'system', 'content': 'Du bist ein Web-Scraping-Experte. Antworte präzise und kurz.'},
-                    {'role': 'user', 'content': prompt}
-                ],
-                'max_tokens': 100,
-                'temperature': 0.1
-            }
-            
-            response = requests.post(
-                f"{self.api_base_url}/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            result = response.json()['choices'][0]['message']['content'].strip()
+            result = self._api_chat(prompt, max_tokens=100,
+                                    system_prompt='Du bist ein Web-Scraping-Experte. Antworte präzise und kurz.')
             
             if result.upper() == 'NICHT_GEFUNDEN' or not result:
                 return None
@@ -746,118 +886,110 @@ class ImpressumScraperUltimate:
     
     def scrape_html(self, url: str, use_selenium: bool = False) -> str:
         """Lädt HTML von URL mit optionalem Selenium-Fallback"""
+        doc = self.fetch_document(url, use_selenium)
+        return doc.html if doc else ""
+
+    def fetch_document(self, url: str, use_selenium: bool = False) -> Optional[HtmlDocument]:
+        """
+        Lädt eine Seite als HtmlDocument mit optionalem Selenium-Fallback
+        
+        Das Dokument der Inhaltsprüfung wird weitergegeben, sodass die
+        Extraktion denselben Parse-Baum nutzt.
+        """
         
         # Versuche normale Request
         if not use_selenium:
             try:
-                response = self.session.get(url, timeout=15)
-                response.raise_for_status()
-                html = response.text
+                page = self.fetcher.fetch(url, timeout=15)
+                page.raise_for_status()
+                doc = self.page_document(page)
                 
                 # Prüfe ob genug Content
-                if len(html) >= 1000 and self._has_meaningful_content(html):
-                    return html
+                if self._is_usable_html(doc):
+                    return doc
                     
             except Exception as e:
                 logger.debug(f"Normale Request fehlgeschlagen: {e}")
         
-        # Fallback: Selenium
-        if self.chrome_driver_path:
+        # Fallback: Selenium (nicht bei toten Domains)
+        if self.chrome_driver_path and not self.health.is_dead(url):
             logger.info("🌐 Verwende Selenium...")
-            return self._scrape_with_selenium(url)
+            html = self._scrape_with_selenium(url)
+            if html:
+                return self.document(html, url)
         
-        return ""
+        return None
 
-    def _has_meaningful_content(self, html: str) -> bool:
+    def page_document(self, page: FetchedPage) -> HtmlDocument:
+        """HtmlDocument einer geladenen Seite (einmal geparst, im Seiten-Cache gemerkt)"""
+        return page.document(self.html_parser, self.FOOTER_SELECTORS)
+
+    def document(self, html: Union[str, HtmlDocument], url: Optional[str] = None,
+                 truncated: bool = False) -> HtmlDocument:
+        """Erstellt ein HtmlDocument (oder gibt ein bestehendes zurück)"""
+        return HtmlDocument.of(html, url=url, footer_selectors=self.FOOTER_SELECTORS,
+                               parser=self.html_parser, truncated=truncated)
+
+    def _is_usable_html(self, html: Union[str, HtmlDocument]) -> bool:
+        """Prüft ob geladenes HTML ohne Selenium verwendet werden kann"""
+        return len(html) >= 1000 and self._has_meaningful_content(html)
+
+    def _has_meaningful_content(self, html: Union[str, HtmlDocument]) -> bool:
         """Prüft ob HTML sinnvollen Content hat (nicht nur JS-Loader)"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Entferne Scripts/Styles
-        for tag in soup(['script', 'style', 'noscript']):
-            tag.decompose()
-        
-        text = soup.get_text(strip=True)
-        
-        # Mindestens 200 Zeichen Text
-        return len(text) >= 200
+        # Mindestens 200 Zeichen Text (ohne Scripts/Styles)
+        return len(self.document(html).visible_text) >= 200
 
     def _scrape_with_selenium(self, url: str) -> str:
-        """Scraped mit Selenium für JS-heavy Seiten"""
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-infobars")
-        options.add_argument(f"user-agent={self.headers['User-Agent']}")
-        
-        service = Service(self.chrome_driver_path)
-        driver = None
-        
+        """Scraped mit Selenium für JS-heavy Seiten (Browser aus dem gemeinsamen Pool)"""
+        pool = get_browser_pool(self.chrome_driver_path)
+
         try:
-            driver = webdriver.Chrome(service=service, options=options)
-            driver.set_page_load_timeout(25)
-            driver.get(url)
-            
-            # Warte auf JS-Rendering
-            time.sleep(2.5)
-            
-            # Scroll um lazy-loaded Content zu triggern
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-            time.sleep(0.5)
-            
-            return driver.page_source
-            
+            # Fertig sobald Impressum-Inhalt oder Netzwerk-Ruhe erkannt - ein mailto-Link
+            # allein reicht nicht (steht oft im Header, bevor der Impressum-Block lädt)
+            return pool.render(url, keywords=self.SELENIUM_READY_KEYWORDS, wait_for_mailto=False,
+                               timeout=10, page_load_timeout=25)
+
         except SeleniumTimeout:
             logger.warning(f"Selenium-Timeout bei {url}")
         except WebDriverException as e:
             logger.error(f"Selenium-Fehler: {e}")
         except Exception as e:
             logger.error(f"Unerwarteter Selenium-Fehler: {e}")
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except Exception:
-                    pass
-        
+
         return ""
 
     # ===== TEXT EXTRAKTION =====
     
-    def extract_clean_text(self, html: str) -> str:
+    def extract_clean_text(self, html: Union[str, HtmlDocument]) -> str:
         """Extrahiert bereinigten Text aus HTML"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Entferne unerwünschte Elemente
-            for tag in soup(['script', 'style', 'meta', 'link', 'noscript', 'header', 'nav', 'aside', 'iframe']):
-                tag.decompose()
-            
-            # Entferne Kommentare
-            for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-                comment.extract()
-            
-            # Extrahiere Text
-            text = soup.get_text(separator='\n', strip=True)
-            
-            # Bereinige
-            lines = []
-            for line in text.split('\n'):
-                line = line.strip()
-                if line and len(line) > 1:
-                    lines.append(line)
-            
-            return '\n'.join(lines)
-            
+            return self.document(html).clean_text
         except Exception as e:
             logger.warning(f"Text-Extraktion fehlgeschlagen: {e}")
             return ""
 
+    def extract_impressum_text(self, html: Union[str, HtmlDocument]) -> Optional[str]:
+        """Impressum-Bereich des bereinigten Texts (None = nicht eingrenzbar)"""
+        try:
+            return self.document(html).impressum_text
+        except Exception as e:
+            logger.debug(f"Impressum-Bereich nicht bestimmbar: {e}")
+            return None
+
+    def _search_scopes(self, html: Union[str, HtmlDocument], text: str) -> Tuple[str, ...]:
+        """
+        Texte, in denen Extraktoren nacheinander suchen
+        
+        Zuerst nur der Impressum-Bereich (weniger Regex-Arbeit, keine Treffer
+        aus Cookie-Bannern/Boilerplate), die ganze Seite nur, wenn dort nichts
+        gefunden wird.
+        """
+        window = self.extract_impressum_text(html)
+        return (window, text) if window and len(window) < len(text) else (text,)
+
     # ===== STRUKTURIERTE DATEN EXTRAKTION =====
     
-    def extract_structured_data(self, html: str) -> Dict:
+    def extract_structured_data(self, html: Union[str, HtmlDocument]) -> Dict:
         """Extrahiert strukturierte Daten (JSON-LD, Microdata)"""
         result = {
             'organization': None,
@@ -866,46 +998,36 @@ class ImpressumScraperUltimate:
         }
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            doc = self.document(html)
             
             # JSON-LD extrahieren
-            for script in soup.find_all('script', type='application/ld+json'):
-                try:
-                    data = json.loads(script.string)
-                    
-                    # Kann Liste oder einzelnes Objekt sein
-                    items = data if isinstance(data, list) else [data]
+            for data in doc.json_ld:
+                # Kann Liste oder einzelnes Objekt sein
+                items = data if isinstance(data, list) else [data]
+                
+                for item in items:
+                    item_type = item.get('@type', '')
                     
-                    for item in items:
-                        item_type = item.get('@type', '')
-                        
-                        if item_type in ['Organization', 'LocalBusiness', 'Corporation']:
-                            result['organization'] = item
-                            
-                            # Suche nach Personen
-                            if 'founder' in item:
-                                result['person'] = item['founder']
-                            if 'employee' in item:
-                                for emp in (item['employee'] if isinstance(item['employee'], list) else [item['employee']]):
-                                    if emp.get('jobTitle', '').lower() in ['geschäftsführer', 'ceo', 'inhaber']:
-                                        result['person'] = emp
-                            if 'contactPoint' in item:
-                                result['contact_point'] = item['contactPoint']
+                    if item_type in ['Organization', 'LocalBusiness', 'Corporation']:
+                        result['organization'] = item
                         
-                        elif item_type == 'Person':
-                            result['person'] = item
-                            
-                except json.JSONDecodeError:
-                    continue
+                        # Suche nach Personen
+                        if 'founder' in item:
+                            result['person'] = item['founder']
+                        if 'employee' in item:
+                            for emp in (item['employee'] if isinstance(item['employee'], list) else [item['employee']]):
+                                if emp.get('jobTitle', '').lower() in ['geschäftsführer', 'ceo', 'inhaber']:
+                                    result['person'] = emp
+                        if 'contactPoint' in item:
+                            result['contact_point'] = item['contactPoint']
+                    
+                    elif item_type == 'Person':
+                        result['person'] = item
             
             # Microdata extrahieren (Schema.org)
-            for element in soup.find_all(itemtype=re.compile(r'schema\.org/(Person|Organization)', re.I)):
-                props = {}
-                for prop in element.find_all(itemprop=True):
-                    props[prop.get('itemprop')] = prop.get_text(strip=True)
-                
+            for itemtype, props in doc.microdata:
                 if 'name' in props:
-                    if 'Organization' in element.get('itemtype', ''):
+                    if 'Organization' in itemtype:
                         result['organization'] = props
                     else:
                         result['person'] = props
@@ -917,17 +1039,19 @@ class ImpressumScraperUltimate:
 
     # ===== NAME EXTRAKTION =====
     
-    def extract_name(self, html: str) -> Tuple[Optional[str], Optional[str], float, str]:
+    def extract_name(self, html: Union[str, HtmlDocument]) -> Tuple[Optional[str], Optional[str], float, str]:
         """
         Extrahiert Geschäftsführer-Namen aus HTML
         
         Returns:
             Tuple: (first_name, last_name, confidence, method)
         """
-        text = self.extract_clean_text(html)
+        doc = self.document(html)
+        text = self.extract_clean_text(doc)
+        scopes = self._search_scopes(doc, text)
         
         # Methode 1: Strukturierte Daten
-        structured = self.extract_structured_data(html)
+        structured = self.extract_structured_data(doc)
         if structured.get('person'):
             person = structured['person']
             name = person.get('name', '')
@@ -937,12 +1061,9 @@ class ImpressumScraperUltimate:
                     logger.info(f"✅ Name via JSON-LD: {first} {last}")
                     return first, last, 1.0, 'json-ld'
         
-        # Methode 2: Regex-Patterns (priorisiert)
-        for priority, pattern in self.name_patterns:
-            matches = pattern.findall(text)
-            for match in matches:
-                # Match kann String oder Tuple sein
-                name_str = match if isinstance(match, str) else match[0]
+        # Methode 2: Regex-Patterns (priorisiert, ein gemeinsamer Scan)
+        for scope in scopes:
+            for priority, name_str in self._name_candidates(scope):
                 first, last = self._split_name(name_str)
                 
                 if first and last and self._validate_name(first, last):
@@ -956,34 +1077,80 @@ class ImpressumScraperUltimate:
                 return first, last, conf, 'api'
         
         # Methode 4: Intelligente Heuristik
-        first, last = self._heuristic_extract_name(text)
-        if first and last:
-            logger.info(f"✅ Name via Heuristik: {first} {last}")
-            return first, last, 0.5, 'heuristic'
+        for scope in scopes:
+            first, last = self._heuristic_extract_name(scope)
+            if first and last:
+                logger.info(f"✅ Name via Heuristik: {first} {last}")
+                return first, last, 0.5, 'heuristic'
         
         return None, None, 0.0, 'none'
 
+    def _name_candidates(self, text: str) -> Iterator[Tuple[float, str]]:
+        """
+        Namens-Kandidaten aller Regex-Patterns in Prioritäts-Reihenfolge
+        
+        Ein Scan über den Text sucht nur die Anker-Schlüsselwörter; die
+        eigentlichen Patterns laufen ausschließlich an diesen Stellen.
+        Reihenfolge und Treffer wie findall pro Pattern (ohne Überlappung),
+        aber ohne 18 Durchläufe über den gesamten Text.
+        
+        Yields:
+            (priority, name_str)
+        """
+        hits: Dict[int, List[Tuple[int, int, str]]] = {}
+        top_last_end = -1
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            anchor_matches = self._name_anchor_scan.finditer(lowered)
+        else:
+            anchor_matches = self._name_anchor_scan_ci.finditer(text)
+        
+        for anchor_match in anchor_matches:
+            anchor_start, anchor_end = anchor_match.span()
+            for idx in self._anchor_rules[anchor_match.lastgroup]:
+                pattern = self.name_patterns[idx]
+                if pattern.anchor_at_end:
+                    # Name steht vor dem Anker: nur das Fenster um den Anker durchsuchen
+                    window_start = max(0, anchor_start - 120)
+                    while window_start > 0 and text[window_start - 1].isalpha():
+                        window_start -= 1
+                    match = None
+                    for candidate in pattern.regex.finditer(text, window_start, anchor_end + 16):
+                        if candidate.start() > anchor_start:
+                            break
+                        if candidate.end() > anchor_start:
+                            match = candidate
+                            break
+                else:
+                    match = pattern.regex.match(text, anchor_start)
+                if not match:
+                    continue
+                
+                if idx == 0:
+                    # Höchste Priorität: kein anderer Treffer kann davor liegen -
+                    # sofort liefern (extract_name bricht oft hier schon ab)
+                    if match.start() >= top_last_end:
+                        top_last_end = match.end()
+                        yield pattern.priority, match.group(1)
+                else:
+                    hits.setdefault(idx, []).append((match.start(), match.end(), match.group(1)))
+        
+        for idx in sorted(hits):
+            # Überlappende Treffer verwerfen (wie findall)
+            last_end = -1
+            for start, end, name_str in sorted(set(hits[idx])):
+                if start >= last_end:
+                    last_end = end
+                    yield self.name_patterns[idx].priority, name_str
+
     def _split_name(self, full_name: str) -> Tuple[Optional[str], Optional[str]]:
         """Teilt vollständigen Namen in Vor- und Nachname"""
         if not full_name:
             return None, None
         
-        # Bereinige
-        full_name = full_name.strip()
-        full_name = re.sub(r'\s+', ' ', full_name)
-        
-        # Entferne Titel
-        titles = ['dr.', 'dr', 'prof.', 'prof', 'dipl.', 'dipl', 'ing.', 'ing', 
-                  'mag.', 'mag', 'rer.', 'rer', 'nat.', 'nat', 'med.', 'med',
-                  'herr', 'frau', 'mr.', 'mr', 'mrs.', 'mrs', 'ms.', 'ms']
-        
-        parts = full_name.split()
-        cleaned_parts = []
-        
-        for part in parts:
-            part_lower = part.lower().rstrip('.,')
-            if part_lower not in titles:
-                cleaned_parts.append(part)
+        # Entferne Titel (split() bereinigt auch mehrfache Leerzeichen)
+        cleaned_parts = [part for part in full_name.split()
+                         if part.lower().rstrip('.,') not in self.NAME_TITLES]
         
         if len(cleaned_parts) >= 2:
             first_name = cleaned_parts[0]
@@ -1002,11 +1169,9 @@ class ImpressumScraperUltimate:
         first_lower = first_name.lower()
         last_lower = last_name.lower()
         
-        # Blacklist-Check
-        for word in [first_lower, last_lower]:
-            for black in self.NAME_BLACKLIST:
-                if black in word:
-                    return False
+        # Blacklist-Check (Teilstring)
+        if self.NAME_BLACKLIST_PATTERN.search(first_lower) or self.NAME_BLACKLIST_PATTERN.search(last_lower):
+            return False
         
         # Längen-Check
         if len(first_name) < 2 or len(last_name) < 2:
@@ -1029,21 +1194,73 @@ class ImpressumScraperUltimate:
         
         return True
 
+    # Regeln für Einzel- und Batch-Prompt der Namens-Extraktion
+    API_NAME_RULES = """REGELN:
+1. Suche nach: Geschäftsführer, Geschäftsführerin, Inhaber, Inhaberin, Vertreten durch, CEO, Managing Director
+2. Es muss eine ECHTE PERSON sein (kein Firmenname!)
+3. Ignoriere: Webmaster, Datenschutzbeauftragter, technische Kontakte
+4. Bei mehreren Geschäftsführern: Nimm den ERSTEN"""
+    API_NAME_SYSTEM_PROMPT = 'Du bist ein Experte für deutsches Impressum-Recht. Antworte präzise.'
+    
+    # Max. Zeichen pro Text in einer Batch (Impressum-Bereich statt ganzer Seite)
+    API_BATCH_ITEM_CHARS = 3000
+
     def _api_extract_name(self, text: str) -> Tuple[Optional[str], Optional[str], float]:
-        """Extrahiert Namen via DeepSeek API"""
+        """
+        Extrahiert Namen via DeepSeek API
+        
+        Innerhalb von api_batching() (scrape_multiple) wird die Anfrage mit
+        denen anderer Worker in einem Request gebündelt.
+        """
         logger.info("🤖 Verwende DeepSeek API für Name-Extraktion...")
         
         try:
-            # Sende relevanten Textausschnitt (max 12000 Zeichen)
-            text_short = text[:12000]
-            
-            prompt = f"""AUFGABE: Extrahiere den GESCHÄFTSFÜHRER oder INHABER aus diesem Impressum-Text.
+            batcher = self._name_batcher
+            answer = batcher.request(text) if batcher is not None else self._api_request_name(text)
+        except Exception as e:
+            logger.error(f"DeepSeek API Fehler: {e}")
+            return None, None, 0.0
+        
+        return self._parse_api_name(answer)
 
-REGELN:
-1. Suche nach: Geschäftsführer, Geschäftsführerin, Inhaber, Inhaberin, Vertreten durch, CEO, Managing Director
-2. Es muss eine ECHTE PERSON sein (kein Firmenname!)
-3. Ignoriere: Webmaster, Datenschutzbeauftragter, technische Kontakte
-4. Bei mehreren Geschäftsführern: Nimm den ERSTEN
+    def _parse_api_name(self, answer: str) -> Tuple[Optional[str], Optional[str], float]:
+        """Validiert die API-Antwort ("Vorname Nachname" / NICHT_GEFUNDEN)"""
+        answer = answer.replace('"', '').replace("'", '').strip()
+        
+        if answer.upper() == 'NICHT_GEFUNDEN' or not answer:
+            return None, None, 0.0
+        
+        first, last = self._split_name(answer)
+        
+        if first and last and self._validate_name(first, last):
+            logger.info(f"✅ Name via API: {first} {last}")
+            return first, last, 0.9
+        
+        return None, None, 0.0
+
+    def _api_chat(self, prompt: str, max_tokens: int, system_prompt: str = API_NAME_SYSTEM_PROMPT) -> str:
+        """Ein Chat-Completion-Request über den gemeinsamen LLM-Client, liefert den Antworttext"""
+        data = {
+            'model': self.api_model,
+            'messages': [
+                {'role': 'system', 'content': system_prompt},
+                {'role': 'user', 'content': prompt}
+            ],
+            'max_tokens': max_tokens,
+            'temperature': 0.1
+        }
+        
+        result = get_llm_client().chat_completion(self.api_base_url, self.api_key, data, timeout=30)
+        return result['choices'][0]['message']['content'].strip()
+
+    def _api_request_name(self, text: str) -> str:
+        """Einzel-Request: Name aus einem Text ("Vorname Nachname" oder NICHT_GEFUNDEN)"""
+        # Sende relevanten Textausschnitt (max 12000 Zeichen)
+        text_short = text[:12000]
+        
+        prompt = f"""AUFGABE: Extrahiere den GESCHÄFTSFÜHRER oder INHABER aus diesem Impressum-Text.
+
+{self.API_NAME_RULES}
 
 FORMAT: Antworte EXAKT so: "Vorname Nachname"
 Falls nicht gefunden: Antworte "NICHT_GEFUNDEN"
@@ -1054,46 +1271,73 @@ TEXT:
 ---
 
 Antwort:"""
+        
+        return self._api_chat(prompt, max_tokens=50)
 
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            data = {
-                'model': self.api_model,
-                'messages': [
-                    {'role': 'system', 'content': 'Du bist ein Experte für deutsches Impressum-Recht. Antworte präzise.'},
-                    {'role': 'user', 'content': prompt}
-                ],
-                'max_tokens': 50,
-                'temperature': 0.1
-            }
-            
-            response = requests.post(
-                f"{self.api_base_url}/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            result = response.json()['choices'][0]['message']['content'].strip()
-            result = result.replace('"', '').replace("'", '').strip()
-            
-            if result.upper() == 'NICHT_GEFUNDEN' or not result:
-                return None, None, 0.0
-            
-            first, last = self._split_name(result)
-            
-            if first and last and self._validate_name(first, last):
-                logger.info(f"✅ Name via API: {first} {last}")
-                return first, last, 0.9
-                
-        except Exception as e:
-            logger.error(f"DeepSeek API Fehler: {e}")
+    def _api_request_names(self, texts: List[str]) -> List[Any]:
+        """
+        Batch-Request: Namen aus mehreren Texten, Antwort als JSON-Liste
         
-        return None, None, 0.0
+        Pro Text geht nur der Impressum-Bereich (max. API_BATCH_ITEM_CHARS)
+        in den Prompt. Nicht lesbare Einträge sind INVALID_ANSWER, eine
+        nicht lesbare Antwort wirft ValueError (der Batcher fragt dann
+        einzeln nach).
+        """
+        sections = []
+        for number, text in enumerate(texts, 1):
+            window = locate_impressum_window(text)
+            excerpt = text[window[0]:window[1]] if window else text
+            sections.append(f"TEXT {number}:\n---\n{excerpt[:self.API_BATCH_ITEM_CHARS]}\n---")
+        
+        sections_text = '\n\n'.join(sections)
+        prompt = f"""AUFGABE: Extrahiere aus JEDEM der {len(texts)} Impressum-Texte den GESCHÄFTSFÜHRER oder INHABER.
+
+{self.API_NAME_RULES}
+
+FORMAT: Antworte NUR mit einer JSON-Liste mit genau {len(texts)} Einträgen in der Reihenfolge der Texte,
+z.B. ["Vorname Nachname", null]. Falls in einem Text kein Name gefunden wird: null
+
+{sections_text}
+
+Antwort:"""
+        
+        content = self._api_chat(prompt, max_tokens=20 + 25 * len(texts))
+        
+        # JSON-Liste herauslösen (Antwort evtl. in ```json ... ``` oder mit Text drumherum)
+        start, end = content.find('['), content.rfind(']')
+        if start < 0 or end < start:
+            raise ValueError(f"keine JSON-Liste in der Antwort: {content[:80]!r}")
+        answers = json.loads(content[start:end + 1])
+        if not isinstance(answers, list):
+            raise ValueError("Antwort ist keine Liste")
+        
+        return ['NICHT_GEFUNDEN' if answer is None else answer if isinstance(answer, str) else INVALID_ANSWER
+                for answer in answers]
+
+    @contextmanager
+    def api_batching(self):
+        """
+        Bündelt API-Namensanfragen paralleler Worker (N Seiten → ein Request)
+        
+        Nur sinnvoll, wenn mehrere Threads gleichzeitig extrahieren - ein
+        einzelner Aufrufer würde nur api_batch_wait warten.
+        """
+        if not self.api_enabled or self.api_batch_size <= 1 or self._name_batcher is not None:
+            yield
+            return
+        
+        batcher = LLMBatcher(self._api_request_names, self._api_request_name,
+                             max_batch=self.api_batch_size, max_wait=self.api_batch_wait)
+        self._name_batcher = batcher
+        try:
+            yield
+        finally:
+            self._name_batcher = None
+            batcher.close()
+            if batcher.stats.items:
+                logger.info(f"🤖 API-Batching: {batcher.stats.items} Anfragen in {batcher.stats.batches} Batches "
+                            f"(Ø {batcher.stats.avg_batch_size:.1f}) + {batcher.stats.single_calls} einzeln, "
+                            f"{batcher.stats.fallbacks} Einzel-Fallbacks")
 
     def _heuristic_extract_name(self, text: str) -> Tuple[Optional[str], Optional[str]]:
         """Intelligente Heuristik für Name-Extraktion als letzter Fallback"""
@@ -1153,37 +1397,44 @@ Antwort:"""
 
     # ===== E-MAIL EXTRAKTION =====
     
-    def extract_emails(self, html: str) -> List[str]:
+    def extract_emails(self, html: Union[str, HtmlDocument]) -> List[str]:
         """Extrahiert E-Mail-Adressen aus HTML"""
-        emails = set()
+        doc = self.document(html)
+        
+        # Zuerst nur im Impressum-Bereich
+        window = self.extract_impressum_text(doc)
+        if window:
+            emails = self._find_emails(window)
+            if emails:
+                return list(emails)
+        
+        # Ganze Seite: HTML mit dekodierten HTML-Entities
+        emails = self._find_emails(doc.unescaped_html)
+        
+        # mailto: Links
+        for email in doc.mailto_addresses:
+            if self._validate_email(email):
+                emails.add(email)
         
-        # Dekodiere HTML-Entities
-        decoded_html = html_module.unescape(html)
+        return list(emails)
+
+    def _find_emails(self, text: str) -> set:
+        """E-Mail-Adressen (auch obfuskiert) in einem Text"""
+        emails = set()
         
         # Standard-Regex
-        found = self.email_pattern.findall(decoded_html)
-        for email in found:
+        for email in self.email_pattern.findall(text):
             email = email.lower().strip()
             if self._validate_email(email):
                 emails.add(email)
         
-        # mailto: Links
-        soup = BeautifulSoup(decoded_html, 'html.parser')
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            if 'mailto:' in href.lower():
-                email = href.lower().replace('mailto:', '').split('?')[0].strip()
-                if self._validate_email(email):
-                    emails.add(email)
-        
         # Obfuskierte E-Mails (at), [at], etc.
-        obfuscated_pattern = r'([a-zA-Z0-9._%+-]+)\s*[\[\(]?\s*(?:at|@|AT)\s*[\]\)]?\s*([a-zA-Z0-9.-]+)\s*[\[\(]?\s*(?:dot|\.)\s*[\]\)]?\s*([a-zA-Z]{2,})'
-        for match in re.finditer(obfuscated_pattern, decoded_html, re.IGNORECASE):
+        for match in self.obfuscated_email_pattern.finditer(text):
             email = f"{match.group(1)}@{match.group(2)}.{match.group(3)}".lower()
             if self._validate_email(email):
                 emails.add(email)
         
-        return list(emails)
+        return emails
 
     def _validate_email(self, email: str) -> bool:
         """Validiert E-Mail-Adresse"""
@@ -1248,27 +1499,24 @@ Antwort:"""
 
     # ===== TELEFON EXTRAKTION =====
     
-    def extract_phones(self, html: str) -> List[str]:
+    def extract_phones(self, html: Union[str, HtmlDocument]) -> List[str]:
         """Extrahiert Telefonnummern aus HTML"""
-        phones = set()
-        
         text = self.extract_clean_text(html)
         
-        # Telefon-Patterns
-        patterns = [
-            r'(?:Tel\.?|Telefon|Phone|Fon)[:\s]+([+\d\s\-/\(\)]{8,})',
-            r'(?:\+49|0049|0)\s*[\d\s/\-\(\)]{8,}',
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                phone = match.group(0) if match.groups() == () else match.group(1)
-                phone = re.sub(r'[^\d+]', '', phone)
-                
-                if len(phone) >= 8:
-                    phones.add(phone)
+        # Zuerst im Impressum-Bereich, sonst ganze Seite
+        for scope in self._search_scopes(html, text):
+            phones = set()
+            for pattern in self.phone_patterns:
+                for match in pattern.finditer(scope):
+                    phone = match.group(0) if match.groups() == () else match.group(1)
+                    phone = re.sub(r'[^\d+]', '', phone)
+                    
+                    if len(phone) >= 8:
+                        phones.add(phone)
+            if phones:
+                return list(phones)
         
-        return list(phones)
+        return []
 
     # ===== HAUPTMETHODE =====
     
@@ -1284,90 +1532,139 @@ Antwort:"""
         """
         result = ContactResult()
         
-        try:
-            # Normalisiere URL
-            base_url = self.normalize_url(website)
-            if not base_url:
-                logger.error(f"❌ Ungültige URL: {website}")
-                return result
-            
-            logger.info(f"🔍 Scrape: {base_url}")
-            
-            # Schritt 1: Finde Impressum-URL
-            impressum_url = self.find_impressum_url(base_url)
-            
-            if not impressum_url:
-                logger.warning(f"⚠️ Kein Impressum gefunden: {base_url}")
-                return result
-            
-            result.impressum_url = impressum_url
-            logger.info(f"📄 Impressum: {impressum_url}")
-            
-            # Schritt 2: Lade HTML
-            html = self.scrape_html(impressum_url)
-            
-            if not html:
-                # Retry mit Selenium
-                logger.info("🔄 Retry mit Selenium...")
-                html = self.scrape_html(impressum_url, use_selenium=True)
-            
-            if not html:
-                logger.warning(f"⚠️ Kein HTML geladen: {impressum_url}")
-                return result
-            
-            # Schritt 3: Extrahiere Namen
-            first, last, confidence, method = self.extract_name(html)
-            
-            if first and last:
-                result.first_name = first
-                result.last_name = last
-                result.full_name = f"{first} {last}"
-                result.found_name = True
-                result.confidence = confidence
-                result.extraction_method = method
-                logger.info(f"✅ Name: {first} {last} (Methode: {method}, Konfidenz: {confidence:.2f})")
-            
-            # Schritt 4: Extrahiere E-Mails
-            emails = self.extract_emails(html)
-            
-            if emails:
-                result.email = self.select_best_email(emails)
-                result.found_email = True
-                logger.info(f"✅ E-Mail: {result.email}")
-            
-            # Schritt 5: Extrahiere Telefon (optional)
-            phones = self.extract_phones(html)
-            if phones:
-                result.phone = phones[0]
-                logger.info(f"✅ Telefon: {result.phone}")
-            
-            # Rate Limiting
-            time.sleep(0.5)
-            
-        except Exception as e:
-            logger.error(f"❌ Scraping-Fehler: {e}")
+        # Eigener Seiten-Cache, außer scrape() läuft innerhalb von scrape_multiple
+        with self.fetcher.run():
+            try:
+                # Schritt 1: Finde Impressum-URL
+                impressum_url = self._find_impressum_for(website, result)
+                
+                # Schritt 2-5: Laden, Name, E-Mail, Telefon
+                if impressum_url:
+                    self._scrape_impressum(impressum_url, result)
+                
+            except Exception as e:
+                logger.error(f"❌ Scraping-Fehler: {e}")
         
         return result
 
-    def scrape_multiple(self, websites: List[str], progress_callback=None) -> List[ContactResult]:
+    def _find_impressum_for(self, website: str, result: ContactResult) -> Optional[str]:
+        """Normalisiert die URL und sucht die Impressum-URL (in result.impressum_url)"""
+        base_url = self.normalize_url(website)
+        if not base_url:
+            logger.error(f"❌ Ungültige URL: {website}")
+            return None
+        
+        logger.info(f"🔍 Scrape: {base_url}")
+        
+        impressum_url = self.find_impressum_url(base_url)
+        
+        if not impressum_url:
+            logger.warning(f"⚠️ Kein Impressum gefunden: {base_url}")
+            return None
+        
+        result.impressum_url = impressum_url
+        logger.info(f"📄 Impressum: {impressum_url}")
+        return impressum_url
+
+    def _scrape_impressum(self, impressum_url: str, result: ContactResult) -> ContactResult:
+        """Lädt das Impressum (mit Selenium-Fallback) und extrahiert die Kontaktdaten"""
+        # Lade HTML (einmal geparst für alle Extraktoren)
+        doc = self.fetch_document(impressum_url)
+        
+        if not doc and not self.health.is_dead(impressum_url):
+            # Retry mit Selenium (nicht bei toten Domains)
+            logger.info("🔄 Retry mit Selenium...")
+            doc = self.fetch_document(impressum_url, use_selenium=True)
+        
+        if not doc:
+            logger.warning(f"⚠️ Kein HTML geladen: {impressum_url}")
+            return result
+        
+        # Name, E-Mail, Telefon
+        return self.extract_contact_data(doc, result)
+
+    def extract_contact_data(self, html: Union[str, HtmlDocument], result: ContactResult) -> ContactResult:
+        """
+        Extrahiert Name, E-Mail und Telefon aus Impressum-HTML in result
+        
+        Wird von scrape() und vom Async-Backend gemeinsam genutzt.
+        Das HTML wird dabei nur einmal geparst.
+        """
+        doc = self.document(html)
+        result.html_truncated = doc.truncated
+        
+        # Schritt 3: Extrahiere Namen
+        first, last, confidence, method = self.extract_name(doc)
+        
+        if first and last:
+            result.first_name = first
+            result.last_name = last
+            result.full_name = f"{first} {last}"
+            result.found_name = True
+            result.confidence = confidence
+            result.extraction_method = method
+            logger.info(f"✅ Name: {first} {last} (Methode: {method}, Konfidenz: {confidence:.2f})")
+        
+        # Schritt 4: Extrahiere E-Mails
+        emails = self.extract_emails(doc)
+        
+        if emails:
+            result.email = self.select_best_email(emails)
+            result.found_email = True
+            logger.info(f"✅ E-Mail: {result.email}")
+        
+        # Schritt 5: Extrahiere Telefon (optional)
+        phones = self.extract_phones(doc)
+        if phones:
+            result.phone = phones[0]
+            logger.info(f"✅ Telefon: {result.phone}")
+        
+        return result
+
+    def scrape_multiple(self, websites: List[str], progress_callback=None,
+                        max_workers: Optional[int] = None,
+                        backend: Optional[str] = None) -> List[ContactResult]:
         """
-        Scraped mehrere Websites
+        Scraped mehrere Websites (parallel, falls max_workers > 1)
         
         Args:
             websites: Liste von Website-URLs
             progress_callback: Optional - Funktion(current, total, website)
+            max_workers: Optional - Anzahl paralleler Worker (Standard: self.max_workers)
+            backend: Optional - 'threads' oder 'async' (Standard: self.backend)
+            
+        Mit self.extraction_processes > 0 (nur 'threads') laufen Parsen und
+        Extraktion in einem Prozess-Pool, die Threads laden nur noch.
+        Parallel werden API-Namensanfragen gebündelt (api_batch_size).
             
         Returns:
-            Liste von ContactResult
+            Liste von ContactResult (gleiche Reihenfolge wie websites)
         """
-        results = []
-        
-        for idx, website in enumerate(websites):
-            if progress_callback:
-                progress_callback(idx + 1, len(websites), website)
-            
-            result = self.scrape(website)
-            results.append(result)
+        total = len(websites)
+        if not total:
+            return []
+        
+        workers = min(max_workers or self.max_workers, total)
+        
+        # Eigener Seiten-Cache für diesen Lauf (andere Läufe am selben Fetcher bleiben unberührt)
+        with self.fetcher.run():
+            if (backend or self.backend) == 'async':
+                with self.api_batching():
+                    results = self._scrape_async(websites, progress_callback)
+            elif self.extraction_processes > 0:
+                with self.api_batching():
+                    results = self._scrape_pipelined(websites, max(1, workers), progress_callback)
+            elif workers <= 1:
+                results = []
+                for idx, website in enumerate(websites):
+                    if progress_callback:
+                        progress_callback(idx + 1, total, website)
+                    
+                    result = self.scrape(website)
+                    results.append(result)
+            else:
+                with self.api_batching():
+                    results = self._scrape_concurrent(websites, workers, progress_callback)
         
         # Statistiken
         names_found = sum(1 for r in results if r.found_name)
@@ -1376,9 +1673,286 @@ Antwort:"""
         logger.info(f"\n📊 STATISTIK:")
         logger.info(f"   Namen gefunden: {names_found}/{len(results)} ({100*names_found/len(results):.1f}%)")
         logger.info(f"   E-Mails gefunden: {emails_found}/{len(results)} ({100*emails_found/len(results):.1f}%)")
+        logger.info(f"   HTTP-Cache Trefferquote: {100*self.session.cache_hit_rate:.1f}%")
+        logger.info(f"   Seiten-Cache Trefferquote: {100*self.fetcher.hit_rate:.1f}%")
+        logger.info(f"   Wartezeit durch Host-Limits: {self.scheduler.total_wait():.1f}s")
+        
+        return results
+
+    def _scrape_async(self, websites: List[str], progress_callback=None) -> List[ContactResult]:
+        """Scraped Websites über das asyncio/aiohttp-Backend (eigener Event-Loop)"""
+        import asyncio
+        from impressum_scraper_async import AsyncImpressumScraper
+        
+        logger.info(f"⚡ Async-Scraping: {len(websites)} Websites")
+        async_scraper = AsyncImpressumScraper(self)
+        return asyncio.run(async_scraper.scrape_many(websites, progress_callback))
+
+    def _scrape_concurrent(self, websites: List[str], workers: int,
+                           progress_callback=None) -> List[ContactResult]:
+        """
+        Scraped Websites mit einem Thread-Pool
+        
+        Es werden höchstens 2x workers Leads gleichzeitig eingeplant, damit
+        auch bei 5.000+ Leads nicht alle Futures auf einmal entstehen.
+        progress_callback wird im aufrufenden Thread aufgerufen, sobald ein
+        Lead fertig ist (current = Anzahl fertiger Leads).
+        """
+        total = len(websites)
+        results: List[Optional[ContactResult]] = [None] * total
+        queue = iter(enumerate(websites))
+        max_in_flight = workers * 2
+        completed = 0
+        
+        logger.info(f"⚡ Parallel-Scraping: {total} Websites mit {workers} Workern")
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='impressum') as executor:
+            in_flight = {}
+            
+            def submit_next() -> bool:
+                item = next(queue, None)
+                if item is None:
+                    return False
+                idx, website = item
+                in_flight[executor.submit(bind_run(self.scrape), website)] = (idx, website)
+                return True
+            
+            while len(in_flight) < max_in_flight and submit_next():
+                pass
+            
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    idx, website = in_flight.pop(future)
+                    try:
+                        results[idx] = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Scraping-Fehler bei {website}: {e}")
+                        results[idx] = ContactResult()
+                    
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, total, website)
+                    
+                    submit_next()
         
         return results
 
+    # ===== PIPELINE: LADEN IN THREADS, EXTRAKTION IN PROZESSEN =====
+
+    def _get_extraction_pool(self) -> ProcessPoolExecutor:
+        """Prozess-Pool für die Extraktion (bleibt für weitere Läufe bestehen)"""
+        with self._extraction_pool_lock:
+            if self._extraction_pool is not None and self._extraction_pool_size != self.extraction_processes:
+                self._extraction_pool.shutdown(wait=False, cancel_futures=True)
+                self._extraction_pool = None
+            
+            if self._extraction_pool is None:
+                # spawn: kein fork() eines Prozesses mit laufenden Threads/SQLite-Verbindungen
+                self._extraction_pool = ProcessPoolExecutor(
+                    max_workers=self.extraction_processes,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_extraction_worker,
+                    initargs=(self.html_parser,)
+                )
+                self._extraction_pool_size = self.extraction_processes
+            return self._extraction_pool
+
+    def warm_up_extraction_pool(self):
+        """Startet die Extraktions-Prozesse vorab (spawn + Import dauern ~1s)"""
+        pool = self._get_extraction_pool()
+        for future in [pool.submit(_extraction_worker_ready) for _ in range(self.extraction_processes)]:
+            future.result()
+
+    def shutdown_extraction_pool(self):
+        """Beendet die Extraktions-Prozesse"""
+        with self._extraction_pool_lock:
+            if self._extraction_pool is not None:
+                self._extraction_pool.shutdown(wait=True, cancel_futures=True)
+                self._extraction_pool = None
+
+    def _fetch_stage(self, website: str) -> Tuple[ContactResult, Optional[FetchedPage]]:
+        """
+        I/O-Stufe: Impressum-URL finden und Impressum laden (ohne Parsen)
+
+        Fehler werden wie in scrape() abgefangen: das Teilergebnis (z.B. die
+        schon gefundene impressum_url) bleibt erhalten und geht ohne Seite
+        zurück, damit _scrape_pipelined den Selenium-Fallback nimmt.
+        """
+        result = ContactResult()
+        try:
+            impressum_url = self._find_impressum_for(website, result)
+            if not impressum_url:
+                return result, None
+
+            page = self.fetcher.fetch(impressum_url, timeout=15)
+            return result, page if page.ok else None
+        except Exception as e:
+            logger.error(f"❌ Scraping-Fehler: {e}")
+            return result, None
+
+    def _apply_extraction(self, result: ContactResult, payload: Dict[str, Any],
+                          api_name: Optional[Tuple[Optional[str], Optional[str], float]] = None) -> ContactResult:
+        """
+        Übernimmt das Ergebnis eines Extraktions-Prozesses in result
+        
+        api_name: bereits vorliegende API-Antwort (gebündelt), sonst wird
+        die API hier aufgerufen, falls der Prozess Text mitgeschickt hat
+        """
+        impressum_url = result.impressum_url
+        for key, value in payload['result'].items():
+            setattr(result, key, value)
+        result.impressum_url = impressum_url
+        
+        # API-Fallback (Netzwerk) im Thread: nur wenn Regex/JSON-LD nichts fanden,
+        # Reihenfolge wie extract_name - API vor Heuristik
+        text = payload.get('text')
+        if text:
+            first, last, confidence = api_name or self._api_extract_name(text)
+            if first and last:
+                result.first_name, result.last_name = first, last
+                result.full_name = f"{first} {last}"
+                result.found_name = True
+                result.confidence = confidence
+                result.extraction_method = 'api'
+        return result
+
+    def _scrape_pipelined(self, websites: List[str], workers: int,
+                          progress_callback=None) -> List[ContactResult]:
+        """
+        Scraped Websites als Pipeline: Threads laden, Prozesse extrahieren
+        
+        Die Threads (I/O) geben das rohe HTML als String an den Prozess-Pool;
+        zurück kommt nur ein Dict mit den Feldern des ContactResult. Parsen
+        und Regex-Extraktion laufen so auf allen Kernen statt unter dem GIL.
+        Seiten, die dort als unbrauchbar gelten (JS-Loader), und Ladefehler
+        gehen den normalen Weg mit Selenium-Fallback im Thread.
+        """
+        total = len(websites)
+        results: List[Optional[ContactResult]] = [None] * total
+        queue = iter(enumerate(websites))
+        max_in_flight = workers * 2
+        completed = 0
+        process_pool = self._get_extraction_pool()
+        api_payloads: Dict[int, Dict[str, Any]] = {}   # idx → Payload, das auf die API wartet
+        
+        logger.info(f"⚡ Pipeline-Scraping: {total} Websites mit {workers} Threads "
+                    f"und {self.extraction_processes} Extraktions-Prozessen")
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='impressum') as executor:
+            in_flight = {}   # Future → (idx, website, Stufe, ContactResult)
+            
+            def submit_next() -> bool:
+                item = next(queue, None)
+                if item is None:
+                    return False
+                idx, website = item
+                in_flight[executor.submit(bind_run(self._fetch_stage), website)] = (idx, website, 'fetch', None)
+                return True
+            
+            while len(in_flight) < max_in_flight and submit_next():
+                pass
+            
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    idx, website, stage, result = in_flight.pop(future)
+                    try:
+                        if stage == 'fetch':
+                            result, page = future.result()
+                            if page is not None:
+                                payload_future = process_pool.submit(
+                                    _extract_in_worker, page.text, page.final_url, page.truncated, self.api_enabled
+                                )
+                                in_flight[payload_future] = (idx, website, 'extract', result)
+                                continue
+                            if result.impressum_url:
+                                # Ladefehler: normaler Weg inkl. Selenium
+                                in_flight[executor.submit(bind_run(self._scrape_impressum), result.impressum_url, result)] = \
+                                    (idx, website, 'finish', result)
+                                continue
+                        elif stage == 'extract':
+                            payload = future.result()
+                            if payload is None:
+                                # Unbrauchbares HTML (JS-Loader): normaler Weg inkl. Selenium
+                                in_flight[executor.submit(bind_run(self._scrape_impressum), result.impressum_url, result)] = \
+                                    (idx, website, 'finish', result)
+                                continue
+                            if payload.get('text'):
+                                batcher = self._name_batcher
+                                if batcher is not None:
+                                    # Gebündelt, ohne einen Thread zu blockieren
+                                    api_payloads[idx] = payload
+                                    in_flight[batcher.submit(payload['text'])] = (idx, website, 'api', result)
+                                else:
+                                    in_flight[executor.submit(self._apply_extraction, result, payload)] = \
+                                        (idx, website, 'finish', result)
+                                continue
+                            result = self._apply_extraction(result, payload)
+                        elif stage == 'api':
+                            try:
+                                api_name = self._parse_api_name(future.result())
+                            except Exception as e:
+                                logger.error(f"DeepSeek API Fehler: {e}")
+                                api_name = (None, None, 0.0)
+                            result = self._apply_extraction(result, api_payloads.pop(idx), api_name)
+                        else:
+                            result = future.result()
+                        results[idx] = result
+                    except Exception as e:
+                        logger.error(f"❌ Scraping-Fehler bei {website}: {e}")
+                        results[idx] = result or ContactResult()
+                    
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, total, website)
+                    
+                    submit_next()
+        
+        return results
+
+
+# ===== EXTRAKTIONS-PROZESSE =====
+
+# Scraper des Worker-Prozesses (von _init_extraction_worker erstellt)
+_worker_scraper: Optional[ImpressumScraperUltimate] = None
+
+
+def _init_extraction_worker(html_parser: str):
+    """Initialisiert einen Extraktions-Prozess (einmal pro Prozess)"""
+    global _worker_scraper
+    _worker_scraper = ImpressumScraperUltimate.extraction_only(html_parser)
+
+
+def _extraction_worker_ready() -> bool:
+    return _worker_scraper is not None
+
+
+def _extract_in_worker(html: str, url: str, truncated: bool, want_text: bool) -> Optional[Dict[str, Any]]:
+    """
+    Parst HTML und extrahiert die Kontaktdaten (läuft im Prozess-Pool)
+    
+    Args:
+        want_text: Bereinigten Text mitliefern, falls der Name nur per API zu finden ist
+    
+    Returns:
+        {'result': Felder des ContactResult, 'text': Text für die API oder None};
+        None bei unbrauchbarem HTML (wie fetch_document)
+    """
+    scraper = _worker_scraper
+    doc = scraper.document(html, url, truncated=truncated)
+    if not scraper._is_usable_html(doc):
+        return None
+    
+    result = scraper.extract_contact_data(doc, ContactResult())
+    needs_api = want_text and result.extraction_method in (None, 'heuristic')
+    return {
+        'result': asdict(result),
+        'text': doc.clean_text if needs_api else None,
+    }
+
 
 # ===== TEST =====
 if __name__ == "__main__":
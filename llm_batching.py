@@ -0,0 +1,175 @@
+"""
+LLM Batching - mehrere Anfragen paralleler Threads in einem API-Call
+
+Statt pro Seite einen Chat-Completion-Request (je 1-3s Roundtrip) zu
+senden, sammelt der Batcher offene Anfragen und schickt sie gebündelt:
+N Texte → ein Prompt → eine JSON-Liste mit N Antworten.
+
+Features:
+- Flush bei voller Batch (max_batch) oder nach max_wait Sekunden
+- Aufrufer blockieren nur auf ihr eigenes Ergebnis (Future)
+- Fallback pro Eintrag: unlesbare Batch-Antwort oder ungültige Einträge
+  werden einzeln nachgefragt
+- Mehrere Batches gleichzeitig unterwegs (max_in_flight)
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Markiert einen Eintrag der Batch-Antwort, der nicht verwertbar ist
+INVALID_ANSWER = object()
+
+
+@dataclass
+class BatchStats:
+    """Metriken des Batchers"""
+    items: int = 0
+    batches: int = 0
+    single_calls: int = 0
+    fallbacks: int = 0             # einzeln nachgefragte Einträge
+
+    @property
+    def avg_batch_size(self) -> float:
+        return (self.items - self.single_calls) / self.batches if self.batches else 0.0
+
+
+class LLMBatcher:
+    """
+    Bündelt Anfragen aus mehreren Threads
+
+    Verwendung:
+        batcher = LLMBatcher(send_batch, send_single, max_batch=8, max_wait=0.5)
+        answer = batcher.request(text)       # blockiert bis zur Antwort
+        future = batcher.submit(text)        # oder: nicht blockierend
+        batcher.close()
+
+    send_batch(texts) liefert eine Liste gleicher Länge (Einträge dürfen
+    INVALID_ANSWER sein) oder wirft eine Exception, wenn die Antwort nicht
+    lesbar ist. send_single(text) ist der bisherige Einzel-Request.
+    """
+
+    def __init__(self, send_batch: Callable[[List[str]], Sequence],
+                 send_single: Callable[[str], object],
+                 max_batch: int = 8, max_wait: float = 0.5, max_in_flight: int = 4):
+        """
+        Args:
+            send_batch: Sendet mehrere Texte in einem Request
+            send_single: Sendet einen Text (Batch mit einem Eintrag, Fallback)
+            max_batch: Flush, sobald so viele Anfragen warten
+            max_wait: Flush spätestens so viele Sekunden nach der ältesten Anfrage
+            max_in_flight: Max. gleichzeitig laufende Requests
+        """
+        self.send_batch = send_batch
+        self.send_single = send_single
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait)
+        self.stats = BatchStats()
+
+        self._pending: List[Tuple[str, Future]] = []
+        self._oldest = 0.0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_in_flight), thread_name_prefix='llm-batch')
+        self._thread = threading.Thread(target=self._run, name='llm-batcher', daemon=True)
+        self._thread.start()
+
+    # ===== ANFRAGEN =====
+
+    def submit(self, text: str) -> Future:
+        """Reiht einen Text ein; das Future liefert die Antwort"""
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("LLMBatcher ist geschlossen")
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.append((text, future))
+            self.stats.items += 1
+            self._cond.notify()
+        return future
+
+    def request(self, text: str, timeout: Optional[float] = None):
+        """Reiht einen Text ein und wartet auf die Antwort"""
+        return self.submit(text).result(timeout=timeout)
+
+    def close(self):
+        """Sendet offene Anfragen und beendet den Batcher"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'LLMBatcher':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ===== FLUSH =====
+
+    def _run(self):
+        """Sammel-Thread: gibt volle oder abgelaufene Batches an den Executor"""
+        while True:
+            with self._cond:
+                while True:
+                    if self._pending:
+                        remaining = self._oldest + self.max_wait - time.monotonic()
+                        if len(self._pending) >= self.max_batch or remaining <= 0 or self._closed:
+                            break
+                        self._cond.wait(remaining)
+                    elif self._closed:
+                        return
+                    else:
+                        self._cond.wait()
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                if self._pending:
+                    self._oldest = time.monotonic()
+            self._executor.submit(self._flush, batch)
+
+    def _flush(self, batch: List[Tuple[str, Future]]):
+        """Sendet eine Batch und verteilt die Antworten auf die Futures"""
+        texts = [text for text, _ in batch]
+
+        if len(batch) == 1:
+            with self._cond:
+                self.stats.single_calls += 1
+            self._resolve_single(*batch[0])
+            return
+
+        with self._cond:
+            self.stats.batches += 1
+        try:
+            answers = list(self.send_batch(texts))
+            if len(answers) != len(batch):
+                raise ValueError(f"{len(answers)} statt {len(batch)} Antworten")
+        except Exception as e:
+            logger.warning(f"⚠️ Batch-Antwort unbrauchbar ({len(batch)} Einträge einzeln): {e}")
+            answers = [INVALID_ANSWER] * len(batch)
+
+        retry = []
+        for (text, future), answer in zip(batch, answers):
+            if answer is INVALID_ANSWER:
+                retry.append((text, future))
+            else:
+                future.set_result(answer)
+
+        # Fallback pro Eintrag: einzeln nachfragen (gültige Antworten sind schon zugestellt)
+        with self._cond:
+            self.stats.fallbacks += len(retry)
+        for text, future in retry:
+            self._resolve_single(text, future)
+
+    def _resolve_single(self, text: str, future: Future):
+        try:
+            future.set_result(self.send_single(text))
+        except Exception as e:
+            future.set_exception(e)
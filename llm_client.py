@@ -0,0 +1,211 @@
+"""
+LLM Client - Gemeinsamer HTTP-Client für Chat-Completion-Requests
+
+Bisher öffnete jeder API-Aufruf (Komplimente, KI-Spalten, Impressum-Namen)
+über requests.post eine neue TCP+TLS-Verbindung zum Anbieter. Der Client
+hält die Verbindungen offen und wird von allen Aufrufern geteilt.
+
+Features:
+- Connection Pooling mit Keep-Alive (prozessweit, get_llm_client)
+- Optional HTTP/2 über httpx (eine Multiplex-Verbindung statt vieler)
+- Begrenzte Verbindungsanzahl (weitere Requests warten auf eine freie)
+- Thread-sicher; async über achat_completion (im Thread-Pool)
+- Fehler immer als requests-Exceptions, unabhängig vom Backend
+- RetryPolicy: welche Fehler sich wiederholen lassen und wie lange davor
+  gewartet wird (exponentielles Backoff mit Jitter, Retry-After)
+
+HTTP/2 benötigt: pip install "httpx[http2]"
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# httpx optional (HTTP/2)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (HTTP/2-Unterstützung für httpx)
+    HTTP2_AVAILABLE = HTTPX_AVAILABLE
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class LLMHTTPError(requests.exceptions.HTTPError):
+    """HTTP-Fehlerstatus der LLM-API (mit Status und Headern, z.B. Retry-After)"""
+
+    def __init__(self, status_code: int, headers: CaseInsensitiveDict, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.headers = headers
+
+
+# Vorübergehende Fehler: Drosselung (429), Überlast und Gateway-Fehler
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+def retry_after_seconds(headers) -> Optional[float]:
+    """Liest den Retry-After-Header (Sekunden oder HTTP-Datum), None wenn nicht vorhanden/ungültig"""
+    value = (headers or {}).get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Wiederholungen für vorübergehende API-Fehler
+
+    Wartezeit: Retry-After des Anbieters, sonst exponentielles Backoff mit
+    vollem Jitter (zufällig zwischen 0 und base_delay * 2^Versuch) - so
+    laufen parallele Requests nach einer Drosselung nicht wieder gleichzeitig an.
+    """
+    max_retries: int = 4
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        if isinstance(error, LLMHTTPError):
+            return error.status_code in RETRYABLE_STATUS
+        return isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError))
+
+    def delay(self, attempt: int, error: Optional[Exception] = None) -> float:
+        """Wartezeit vor Wiederholung Nr. attempt (0-basiert)"""
+        retry_after = retry_after_seconds(getattr(error, 'headers', None))
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class LLMClient:
+    """
+    Gepoolter HTTP-Client für OpenAI-kompatible Chat-Completion-APIs
+
+    Verwendung:
+        client = get_llm_client()
+        result = client.chat_completion(base_url, api_key, {'model': ..., 'messages': [...]}, timeout=45)
+        text = result['choices'][0]['message']['content']
+    """
+
+    def __init__(self, max_connections: int = 32, http2: Optional[bool] = None,
+                 keepalive_expiry: float = 60.0):
+        """
+        Args:
+            max_connections: Max. gleichzeitige Verbindungen (pro Host beim requests-Backend)
+            http2: HTTP/2 verwenden (None = wenn httpx[http2] installiert ist)
+            keepalive_expiry: Leerlaufzeit, nach der Verbindungen geschlossen werden (nur httpx)
+        """
+        self.max_connections = max(1, max_connections)
+        self.http2 = HTTP2_AVAILABLE if http2 is None else bool(http2) and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            logger.info("httpx[http2] nicht installiert - LLM-Requests über HTTP/1.1 (requests)")
+
+        if self.http2:
+            self.backend = 'httpx'
+            self._client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections,
+                                    keepalive_expiry=keepalive_expiry),
+            )
+        else:
+            self.backend = 'requests'
+            self._session = requests.Session()
+            # pool_block: nie mehr als max_connections Verbindungen pro Host
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_connections, pool_block=True)
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+
+    # ===== REQUESTS =====
+
+    def chat_completion(self, base_url: str, api_key: str, payload: Dict[str, Any],
+                        timeout: float = 45) -> Dict[str, Any]:
+        """
+        Sendet einen Chat-Completion-Request
+
+        Returns:
+            Antwort-JSON der API
+
+        Raises:
+            requests.exceptions.Timeout: Zeitüberschreitung
+            LLMHTTPError: HTTP-Status >= 400
+            requests.exceptions.RequestException: sonstige Verbindungsfehler
+            ValueError: Antwort ist kein JSON
+        """
+        url = f"{base_url}/chat/completions"
+        headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        }
+
+        if self.backend == 'httpx':
+            try:
+                response = self._client.post(url, headers=headers, json=payload, timeout=timeout)
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(str(e)) from e
+            except httpx.HTTPError as e:
+                raise requests.exceptions.ConnectionError(str(e)) from e
+        else:
+            response = self._session.post(url, headers=headers, json=payload, timeout=timeout)
+
+        if response.status_code >= 400:
+            raise LLMHTTPError(
+                response.status_code, CaseInsensitiveDict(response.headers),
+                f"{response.status_code} Fehler für {url}: {response.text[:200]}"
+            )
+        return response.json()
+
+    async def achat_completion(self, base_url: str, api_key: str, payload: Dict[str, Any],
+                               timeout: float = 45) -> Dict[str, Any]:
+        """chat_completion für asyncio (blockiert den Event-Loop nicht, nutzt denselben Pool)"""
+        return await asyncio.to_thread(self.chat_completion, base_url, api_key, payload, timeout)
+
+    def close(self):
+        """Schließt alle Verbindungen"""
+        if self.backend == 'httpx':
+            self._client.close()
+        else:
+            self._session.close()
+
+
+# ===== GEMEINSAMER CLIENT =====
+
+_shared_client: Optional[LLMClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """
+    Gibt den prozessweit gemeinsamen LLM-Client zurück
+
+    Generator, KI-Spalten und Impressum-Scraper teilen sich die offenen
+    Verbindungen zum Anbieter.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = LLMClient()
+        return _shared_client
@@ -0,0 +1,244 @@
+"""
+LLM Rate Limiter - Budgets für Requests und Tokens pro Minute
+
+Die meisten LLM-Anbieter begrenzen Requests pro Minute (RPM) und Tokens pro
+Minute (TPM). Der Limiter verteilt parallele API-Aufrufe so, dass beide
+Budgets eingehalten werden, statt sie in 429-Fehler laufen zu lassen.
+
+Features:
+- Token-Buckets für RPM und TPM (Reservierungs-Prinzip wie im HostScheduler:
+  Budget wird sofort gebucht, gewartet wird außerhalb des Locks)
+- Adaptive Token-Schätzung: Prompt-Länge + max_tokens, korrigiert um das
+  gemessene Verhältnis tatsächlich verbrauchter Tokens (gleitender Mittelwert)
+- Nachbuchung: Differenz zwischen Schätzung und Verbrauch wird verrechnet
+- Ohne Budgets (None) kein Warten - nur Statistik
+- 429-Drosselung: alle Requests pausieren (Retry-After), die Anzahl
+  gleichzeitiger Requests halbiert sich und wächst mit jeder erfolgreichen
+  Runde wieder um 1 (AIMD)
+- Prozessweit geteilt pro Anbieter (get_llm_rate_limiter)
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Zeichen pro Token (grobe Schätzung für deutsche/englische Texte)
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class TokenBucket:
+    """Budget pro Minute, wird kontinuierlich aufgefüllt (Stand darf negativ werden)"""
+    per_minute: float
+    capacity: float
+    level: float
+    updated: float
+
+    @classmethod
+    def create(cls, per_minute: float, burst_seconds: float) -> 'TokenBucket':
+        capacity = max(1.0, per_minute * burst_seconds / 60)
+        return cls(per_minute=per_minute, capacity=capacity, level=capacity, updated=time.monotonic())
+
+    def refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.per_minute / 60)
+        self.updated = now
+
+    def take(self, amount: float, now: float) -> float:
+        """Bucht amount, liefert die Wartezeit bis der Stand wieder >= 0 ist"""
+        self.refill(now)
+        self.level -= amount
+        return max(0.0, -self.level * 60 / self.per_minute)
+
+
+@dataclass
+class Reservation:
+    """Gebuchtes Budget eines Requests (für record)"""
+    tokens: float
+    estimate_base: float
+    waited: float
+
+
+class LLMRateLimiter:
+    """
+    Hält RPM/TPM-Budgets für parallele API-Aufrufe ein
+
+    Verwendung:
+        reservation = limiter.acquire(prompt_chars, max_tokens)   # blockiert ggf.
+        try:
+            response = client.chat_completion(...)
+        except LLMHTTPError as e:
+            if e.status_code == 429:
+                limiter.throttled(retry_after)
+        finally:
+            limiter.record(reservation, tokens)   # 0 bei Fehler
+    """
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None,
+                 burst_seconds: float = 10.0, smoothing: float = 0.2):
+        """
+        Args:
+            rpm: Requests pro Minute (None = unbegrenzt)
+            tpm: Tokens pro Minute (None = unbegrenzt)
+            burst_seconds: Budget, das auf einmal verbraucht werden darf (in Sekunden Laufzeit)
+            smoothing: Gewicht neuer Messungen für die Token-Schätzung (0..1)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.smoothing = smoothing
+        self._requests = TokenBucket.create(rpm, burst_seconds) if rpm else None
+        self._tokens = TokenBucket.create(tpm, burst_seconds) if tpm else None
+
+        # Verbrauch / (Prompt-Tokens + max_tokens), startet konservativ mit 1.0
+        self.usage_ratio = 1.0
+
+        # Gleichzeitige Requests: None = unbegrenzt, bis der Anbieter drosselt (429)
+        self.concurrency_limit: Optional[int] = None
+        self._active = 0
+        self._successes = 0
+        self._paused_until = 0.0
+
+        self.requests = 0
+        self.tokens_used = 0
+        self.wait_total = 0.0
+        self.throttle_count = 0
+        self._lock = threading.Lock()
+        self._slot_free = threading.Condition(self._lock)
+
+    @property
+    def limited(self) -> bool:
+        return self._requests is not None or self._tokens is not None
+
+    def configure(self, rpm: Optional[float], tpm: Optional[float], burst_seconds: float = 10.0):
+        """Setzt neue Budgets (nur bei Änderung - laufende Buckets bleiben sonst erhalten)"""
+        with self._lock:
+            if rpm != self.rpm:
+                self.rpm = rpm
+                self._requests = TokenBucket.create(rpm, burst_seconds) if rpm else None
+            if tpm != self.tpm:
+                self.tpm = tpm
+                self._tokens = TokenBucket.create(tpm, burst_seconds) if tpm else None
+
+    # ===== RESERVIERUNG =====
+
+    def acquire(self, prompt_chars: int, max_tokens: int) -> Reservation:
+        """
+        Bucht Budget für einen Request und wartet, bis es verfügbar ist
+
+        Belegt außerdem einen Platz unter concurrency_limit - jeder acquire
+        braucht genau einen record.
+        """
+        base = prompt_chars / CHARS_PER_TOKEN + max_tokens
+        with self._lock:
+            # Pause nach 429 und Limit gleichzeitiger Requests (unter dem Lock warten)
+            paused = time.monotonic()
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    self._slot_free.wait(pause)
+                elif self.concurrency_limit is not None and self._active >= self.concurrency_limit:
+                    self._slot_free.wait()
+                else:
+                    break
+            self._active += 1
+
+            tokens = base * self.usage_ratio
+            now = time.monotonic()
+            self.wait_total += now - paused
+            delay = 0.0
+            if self._requests is not None:
+                delay = self._requests.take(1, now)
+            if self._tokens is not None:
+                delay = max(delay, self._tokens.take(tokens, now))
+            self.requests += 1
+            self.wait_total += delay
+
+        if delay > 0:
+            logger.debug(f"⏳ LLM-Budget: warte {delay:.2f}s")
+            time.sleep(delay)
+        return Reservation(tokens=tokens, estimate_base=base, waited=delay)
+
+    def record(self, reservation: Reservation, used_tokens: int):
+        """
+        Gibt den Platz frei und verrechnet den tatsächlichen Verbrauch
+
+        used_tokens = 0: unbekannt/Fehler, die gebuchte Schätzung bleibt.
+        """
+        with self._lock:
+            self._active -= 1
+            self._slot_free.notify()
+            if used_tokens <= 0:
+                return
+
+            # Additive Erhöhung: eine volle Runde ohne 429 → ein Request mehr
+            if self.concurrency_limit is not None:
+                self._successes += 1
+                if self._successes >= self.concurrency_limit:
+                    self._successes = 0
+                    self.concurrency_limit += 1
+                    self._slot_free.notify()
+
+            self.tokens_used += used_tokens
+            if self._tokens is not None:
+                bucket = self._tokens
+                bucket.level = min(bucket.capacity, bucket.level + reservation.tokens - used_tokens)
+            ratio = used_tokens / reservation.estimate_base
+            self.usage_ratio += self.smoothing * (ratio - self.usage_ratio)
+
+    def throttled(self, retry_after: float):
+        """
+        Der Anbieter hat gedrosselt (429): alle Requests pausieren retry_after
+        Sekunden, gleichzeitige Requests werden halbiert
+        """
+        with self._lock:
+            self.throttle_count += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            # Gezählt wird der gerade fehlgeschlagene Request mit (record folgt)
+            current = self._active if self.concurrency_limit is None else min(self.concurrency_limit, self._active)
+            limit = max(1, current // 2)
+            if self.concurrency_limit is None or limit < self.concurrency_limit:
+                logger.info(f"🐢 LLM-Anbieter drosselt (429): Pause {retry_after:.1f}s, "
+                            f"max. {limit} Requests gleichzeitig")
+            self.concurrency_limit = limit
+            self._successes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'tokens_used': self.tokens_used,
+                'wait_total': round(self.wait_total, 2),
+                'usage_ratio': round(self.usage_ratio, 3),
+                'throttled': self.throttle_count,
+                'concurrency_limit': self.concurrency_limit,
+            }
+
+
+# ===== GEMEINSAME LIMITER =====
+
+_shared_limiters: Dict[str, LLMRateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def get_llm_rate_limiter(provider: str, rpm: Optional[float] = None,
+                         tpm: Optional[float] = None) -> LLMRateLimiter:
+    """
+    Gibt den prozessweit gemeinsamen Limiter eines Anbieters zurück
+
+    Alle Generator-Instanzen (Komplimente, KI-Spalten) teilen sich Budgets,
+    Drosselung und Concurrency-Limit - das Limit des Anbieters gilt pro
+    Account, nicht pro Instanz.
+
+    Args:
+        provider: Schlüssel des Anbieters (z.B. base_url)
+        rpm / tpm: Budgets aus der Konfiguration (überschreiben frühere Werte)
+    """
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(provider)
+        if limiter is None:
+            limiter = _shared_limiters[provider] = LLMRateLimiter(rpm=rpm, tpm=tpm)
+        else:
+            limiter.configure(rpm, tpm)
+        return limiter
@@ -0,0 +1,336 @@
+"""
+LLM Router - Lastverteilung und Failover über mehrere Anbieter
+
+api_config.json listet mehrere Anbieter, genutzt wurde bisher nur
+active_api. Ist dieser langsam oder down, steht die ganze Bulk-Generierung.
+Der Router verteilt Requests auf alle aktivierten Anbieter mit API-Key.
+
+Features:
+- Gewichtete Auswahl ("weight" pro Anbieter), bevorzugt schnelle und
+  fehlerarme Anbieter (gleitende Mittelwerte von Latenz und Fehlerquote)
+- Failover: bei Fehler oder Überschreitung des Latenz-SLO ("latency_slo")
+  geht der Request an den nächsten Anbieter
+- Circuit Breaker pro Anbieter: nach failure_threshold Fehlern in Folge
+  wird er für cooldown Sekunden nur noch als letzte Reserve genutzt
+- Gemessene Latenz, Fehlerquote und Kosten ("cost_per_1k_tokens") werden
+  in llm_router.db gespeichert und beim nächsten Start als Ausgangswerte
+  übernommen. api_config.json (mit den API-Keys) wird nur gelesen.
+
+Aktivierung in api_config.json:
+    "routing": {"enabled": true, "latency_slo": 20, "failure_threshold": 3, "cooldown": 120}
+"""
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from llm_rate_limiter import LLMRateLimiter, get_llm_rate_limiter
+from scrape_cache import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProviderHealth:
+    """Laufzeit-Messwerte eines Anbieters"""
+    latency: Optional[float] = None    # Gleitender Mittelwert (Sekunden)
+    error_rate: float = 0.0            # Gleitender Mittelwert (0..1)
+    failures: int = 0                  # Fehler in Folge
+    unhealthy_until: float = 0.0       # time.monotonic()
+    requests: int = 0
+    errors: int = 0
+    slo_breaches: int = 0
+    tokens: int = 0
+    saved_requests: int = 0            # Davon schon in llm_router.db verbucht
+
+
+@dataclass
+class LLMProvider:
+    """Ein Anbieter aus api_config.json"""
+    name: str
+    base_url: str
+    model: str
+    api_key: str
+    weight: float = 1.0
+    latency_slo: float = 20.0
+    cost_per_1k_tokens: float = 0.0
+    rate_limiter: LLMRateLimiter = field(default_factory=LLMRateLimiter)
+    health: ProviderHealth = field(default_factory=ProviderHealth)
+
+    @property
+    def cost(self) -> float:
+        return self.health.tokens / 1000 * self.cost_per_1k_tokens
+
+
+class LLMRouterStore(SQLiteStore):
+    """Persistente Messwerte pro Anbieter (Schlüssel = Name in api_config.json)"""
+
+    def _create_table(self, conn: sqlite3.Connection):
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.table} (
+                key TEXT PRIMARY KEY,
+                latency_ms INTEGER,
+                error_rate REAL NOT NULL,
+                cost_per_request REAL NOT NULL,
+                requests INTEGER NOT NULL,
+                expires_at REAL,
+                updated_at REAL NOT NULL
+            )
+        """)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Messwerte aller Anbieter: {name: {'latency_ms', 'error_rate', 'cost_per_request', 'requests'}}"""
+        rows = self._connect().execute(
+            f"SELECT key, latency_ms, error_rate, cost_per_request, requests FROM {self.table}"
+        ).fetchall()
+        return {name: {'latency_ms': latency_ms, 'error_rate': error_rate,
+                       'cost_per_request': cost_per_request, 'requests': requests}
+                for name, latency_ms, error_rate, cost_per_request, requests in rows}
+
+    def record(self, name: str, latency_ms: Optional[int], error_rate: float,
+               cost_per_request: float, new_requests: int):
+        """Aktuelle Messwerte speichern, Requests werden aufaddiert (parallele Läufe)"""
+        self._connect().execute(
+            f"INSERT INTO {self.table} (key, latency_ms, error_rate, cost_per_request, requests, updated_at) "
+            f"VALUES (?, ?, ?, ?, ?, ?) "
+            f"ON CONFLICT(key) DO UPDATE SET latency_ms = excluded.latency_ms, error_rate = excluded.error_rate, "
+            f"cost_per_request = excluded.cost_per_request, requests = requests + excluded.requests, "
+            f"updated_at = excluded.updated_at",
+            (name, latency_ms, error_rate, cost_per_request, new_requests, time.time())
+        )
+        self._after_write()
+
+
+class LLMRouter:
+    """
+    Wählt pro Request die Reihenfolge der Anbieter
+
+    Verwendung:
+        for provider in router.candidates():
+            ...Request an provider.base_url mit provider.model...
+            router.record_success(provider, elapsed, tokens)  # bzw. record_failure
+        router.save()
+    """
+
+    def __init__(self, providers: List[LLMProvider], failure_threshold: int = 3,
+                 cooldown: float = 120.0, smoothing: float = 0.2, seed: Optional[int] = None,
+                 store: Optional[LLMRouterStore] = None):
+        """
+        Args:
+            providers: Nutzbare Anbieter (aktiviert, mit API-Key)
+            failure_threshold: Fehler in Folge, bis ein Anbieter als ungesund gilt
+            cooldown: Sekunden, die ein ungesunder Anbieter nur Reserve ist
+            smoothing: Gewicht neuer Messungen für Latenz und Fehlerquote (0..1)
+            seed: Zufallsstartwert der gewichteten Auswahl (für Tests/Benchmarks)
+            store: Persistente Messwerte (None = nur im Speicher)
+        """
+        self.providers = providers
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.store = store
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], state_path: Optional[str] = "llm_router.db") -> Optional['LLMRouter']:
+        """
+        Baut den Router aus api_config.json
+
+        Args:
+            config: Inhalt von api_config.json (wird nicht verändert)
+            state_path: SQLite-Datei für die Messwerte (None = nur im Speicher)
+
+        Returns:
+            None wenn Routing nicht aktiviert ist oder kein Anbieter nutzbar ist
+        """
+        routing = config.get('routing') or {}
+        if not routing.get('enabled'):
+            return None
+
+        store = None
+        measured_all: Dict[str, Dict[str, Any]] = {}
+        if state_path:
+            try:
+                store = LLMRouterStore(state_path, table='provider_stats', max_entries=1000)
+                measured_all = store.load()
+            except sqlite3.Error as e:
+                logger.warning(f"Routing-Messwerte nicht verfügbar ({state_path}): {e}")
+                store = None
+
+        default_slo = float(routing.get('latency_slo', 20.0))
+        providers = []
+        for name, settings in config.get('apis', {}).items():
+            if not settings.get('enabled') or not settings.get('base_url'):
+                continue
+            env_var = settings.get('api_key_env', '')
+            api_key = (os.environ.get(env_var, '') if env_var else '') or settings.get('api_key', '')
+            if not api_key:
+                continue
+
+            provider = LLMProvider(
+                name=name,
+                base_url=settings['base_url'],
+                model=settings.get('default_model', ''),
+                api_key=api_key,
+                weight=max(0.0, float(settings.get('weight', 1.0))),
+                latency_slo=float(settings.get('latency_slo', default_slo)),
+                cost_per_1k_tokens=float(settings.get('cost_per_1k_tokens', 0.0)),
+                rate_limiter=get_llm_rate_limiter(settings['base_url'], rpm=settings.get('rpm'),
+                                                  tpm=settings.get('tpm')),
+            )
+            # Messwerte früherer Läufe als Ausgangswerte
+            measured = measured_all.get(name) or {}
+            if measured.get('latency_ms'):
+                provider.health.latency = measured['latency_ms'] / 1000
+            provider.health.error_rate = float(measured.get('error_rate') or 0.0)
+            providers.append(provider)
+
+        if not providers:
+            logger.warning("⚠️ Routing aktiviert, aber kein Anbieter mit API-Key")
+            return None
+
+        return cls(providers,
+                   failure_threshold=int(routing.get('failure_threshold', 3)),
+                   cooldown=float(routing.get('cooldown', 120.0)),
+                   store=store)
+
+    # ===== AUSWAHL =====
+
+    def _score(self, provider: LLMProvider, default_latency: float) -> float:
+        """Gewicht × Geschwindigkeit × Erfolgsquote"""
+        latency = provider.health.latency if provider.health.latency is not None else default_latency
+        return provider.weight / max(latency, 0.05) * max(0.01, 1.0 - provider.health.error_rate)
+
+    def candidates(self) -> List[LLMProvider]:
+        """
+        Anbieter in Versuchsreihenfolge
+
+        Gesunde Anbieter gewichtet zufällig (Anteil proportional zum Score,
+        so verteilt sich Last auch auf langsamere), danach ungesunde als
+        letzte Reserve (der am längsten gesperrte zuletzt).
+        """
+        now = time.monotonic()
+        with self._lock:
+            measured = [p.health.latency for p in self.providers if p.health.latency is not None]
+            default_latency = sum(measured) / len(measured) if measured else 1.0
+
+            healthy, unhealthy = [], []
+            for provider in self.providers:
+                if provider.health.unhealthy_until > now:
+                    unhealthy.append(provider)
+                elif provider.weight > 0:
+                    # Gewichtete Ziehung ohne Zurücklegen (Efraimidis-Spirakis)
+                    key = self._random.random() ** (1.0 / self._score(provider, default_latency))
+                    healthy.append((key, provider))
+                else:
+                    unhealthy.append(provider)
+
+        healthy.sort(key=lambda item: item[0], reverse=True)
+        unhealthy.sort(key=lambda provider: provider.health.unhealthy_until)
+        return [provider for _, provider in healthy] + unhealthy
+
+    # ===== MESSWERTE =====
+
+    def record_success(self, provider: LLMProvider, elapsed: float, tokens: int) -> bool:
+        """
+        Erfolgreiche Antwort verbuchen
+
+        Returns:
+            True wenn das Latenz-SLO überschritten wurde (zählt wie ein Fehler
+            für den Circuit Breaker, die Antwort ist trotzdem gültig)
+        """
+        breached = elapsed > provider.latency_slo
+        with self._lock:
+            health = provider.health
+            health.requests += 1
+            health.tokens += tokens
+            health.latency = elapsed if health.latency is None else \
+                health.latency + self.smoothing * (elapsed - health.latency)
+            health.error_rate += self.smoothing * (0.0 - health.error_rate)
+            if breached:
+                health.slo_breaches += 1
+                self._count_failure(provider)
+            else:
+                health.failures = 0
+        return breached
+
+    def record_failure(self, provider: LLMProvider, elapsed: float, error: str, throttled: bool = False):
+        """
+        Fehlgeschlagenen Request verbuchen
+
+        throttled (429): der Anbieter ist nur ausgelastet - der gemeinsame
+        rate_limiter drosselt, der Circuit Breaker bleibt unberührt.
+        """
+        with self._lock:
+            health = provider.health
+            health.requests += 1
+            health.errors += 1
+            health.error_rate += self.smoothing * (1.0 - health.error_rate)
+            if elapsed > provider.latency_slo:
+                health.slo_breaches += 1
+            if not throttled:
+                self._count_failure(provider)
+        logger.debug(f"LLM-Anbieter {provider.name} fehlgeschlagen: {error}")
+
+    def _count_failure(self, provider: LLMProvider):
+        """Fehler in Folge zählen, ggf. Circuit öffnen (unter self._lock)"""
+        health = provider.health
+        health.failures += 1
+        if health.failures >= self.failure_threshold and health.unhealthy_until <= time.monotonic():
+            health.unhealthy_until = time.monotonic() + self.cooldown
+            logger.warning(f"🔌 LLM-Anbieter {provider.name} ungesund ({health.failures} Fehler/SLO-Verletzungen "
+                           f"in Folge) - {self.cooldown:.0f}s nur Reserve")
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Messwerte pro Anbieter"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                provider.name: {
+                    'requests': provider.health.requests,
+                    'errors': provider.health.errors,
+                    'slo_breaches': provider.health.slo_breaches,
+                    'latency_ms': round(provider.health.latency * 1000) if provider.health.latency else None,
+                    'error_rate': round(provider.health.error_rate, 3),
+                    'cost': round(provider.cost, 5),
+                    'healthy': provider.health.unhealthy_until <= now,
+                }
+                for provider in self.providers
+            }
+
+    def save(self):
+        """
+        Speichert die Messwerte in der Store-Datei (llm_router.db)
+
+        Latenz, Fehlerquote und Kosten pro Request ersetzen die alten Werte,
+        Requests werden seit dem letzten save() aufaddiert.
+        """
+        if self.store is None:
+            return
+
+        with self._save_lock:
+            with self._lock:
+                rows = []
+                for provider in self.providers:
+                    health = provider.health
+                    if not health.requests:
+                        continue
+                    rows.append((provider.name,
+                                 round(health.latency * 1000) if health.latency else None,
+                                 round(health.error_rate, 3),
+                                 round(provider.cost / health.requests, 6),
+                                 health.requests - health.saved_requests,
+                                 health))
+
+            try:
+                for name, latency_ms, error_rate, cost_per_request, new_requests, health in rows:
+                    self.store.record(name, latency_ms, error_rate, cost_per_request, new_requests)
+                    health.saved_requests += new_requests
+            except sqlite3.Error as e:
+                logger.warning(f"Routing-Messwerte nicht gespeichert: {e}")
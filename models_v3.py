@@ -241,6 +241,69 @@ class FilterPreset(Base):
         return f"<FilterPreset(name={self.name}, category={self.category})>"
 
 
+# ===========================
+# Scrape-Jobs (fortsetzbar)
+# ===========================
+
+class ScrapeJob(Base):
+    """
+    Persistenter Bulk-Scraping-Job
+
+    Der Fortschritt liegt pro Lead in ScrapeJobItem - nach einem Absturz
+    oder Schließen der GUI wird nur die offene Arbeit erneut erledigt.
+
+    Status: pending → running → done (paused = unterbrochen, cancelled = verworfen)
+    """
+    __tablename__ = 'scrape_jobs'
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(50), nullable=False, default="contact")   # "contact" = Namen + E-Mail
+    status = Column(String(20), nullable=False, default="pending", index=True)
+
+    # Meta
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    finished_at = Column(DateTime)
+
+    # Relationships
+    items = relationship("ScrapeJobItem", back_populates="job", cascade="all, delete-orphan")
+
+    def __repr__(self):
+        return f"<ScrapeJob(id={self.id}, kind={self.kind}, status={self.status})>"
+
+
+class ScrapeJobItem(Base):
+    """
+    Ein Lead innerhalb eines ScrapeJob
+
+    Status: pending → in_flight → done | failed
+    in_flight-Einträge eines abgebrochenen Laufs werden beim Fortsetzen
+    wieder auf pending gesetzt.
+    """
+    __tablename__ = 'scrape_job_items'
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(Integer, ForeignKey('scrape_jobs.id'), nullable=False, index=True)
+    company_id = Column(Integer, ForeignKey('companies_v3.id'), nullable=False, index=True)
+    website = Column(String(500), nullable=False)
+
+    status = Column(String(20), nullable=False, default="pending", index=True)
+    attempts = Column(Integer, default=0)
+    last_error = Column(Text)
+    result = Column(JSON)                                # ContactResult.to_dict()
+
+    # Meta
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    # Relationships
+    job = relationship("ScrapeJob", back_populates="items")
+    company = relationship("CompanyV3")
+
+    def __repr__(self):
+        return f"<ScrapeJobItem(job_id={self.job_id}, website={self.website}, status={self.status})>"
+
+
 # ===========================
 # Database Helper V3
 # ===========================
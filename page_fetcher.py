@@ -0,0 +1,479 @@
+"""
+Page Fetcher - Gemeinsames Laden und Parsen von Seiten für alle Scraper
+
+EmailScraper und ImpressumScraperUltimate laden für denselben Lead oft
+dieselben Seiten (Homepage, Kontakt, Impressum). Der Fetcher sorgt dafür,
+dass jede Seite pro Lauf höchstens einmal heruntergeladen wird (jeder
+Lauf hat einen eigenen Seiten-Cache, siehe PageFetcher.run):
+
+Features:
+- Eine gemeinsame ScraperSession (Connection Pool, Response-Cache,
+  HostScheduler, DomainHealth) für beide Scraper
+- Seiten-Cache im Speicher pro Lauf, Schlüssel = normalisierte URL (LRU + TTL),
+  nur erfolgreiche Seiten - Fehler werden beim nächsten Abruf neu versucht.
+  Parallele Läufe (GUI, Scrape-Jobs, E-Mail-Scraper) sehen nur ihre eigenen Seiten
+- Gleichzeitige Anfragen derselben URL im selben Lauf warten auf EINEN Download
+- Geparste HtmlDocuments werden mit der Seite gemerkt
+- Gestreamter Download: Abbruch nach max_bytes (page.truncated), Nicht-HTML
+  (PDF, Bilder, Downloads) wird vor dem Lesen des Bodys abgelehnt,
+  schnelle Zeichensatz-Erkennung ohne chardet
+"""
+import codecs
+import contextvars
+import functools
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+from scrape_cache import ResponseCache
+from http_session import ScraperSession
+from host_scheduler import get_host_scheduler
+from domain_health import get_domain_health
+from html_document import HtmlDocument, resolve_html_parser
+
+logger = logging.getLogger(__name__)
+
+# Browser-ähnliche Header für alle Scraper
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate',   # kein br: requests dekodiert Brotli nur mit Zusatzpaket
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# ===== DOWNLOAD-GRENZEN =====
+
+MAX_PAGE_BYTES = 2 * 1024 * 1024     # Standard-Obergrenze pro Seite (dekomprimiert)
+CHUNK_SIZE = 64 * 1024
+
+# Content-Types, deren Body gelesen wird ('' = kein Header → Inhalt prüfen)
+_TEXT_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/xml', 'application/xml', 'text/plain')
+_SNIFF_CONTENT_TYPES = ('', 'application/octet-stream', 'binary/octet-stream')
+
+# Signaturen binärer Dateien (falls der Server keinen/falschen Content-Type sendet)
+_BINARY_SIGNATURES = (b'%PDF', b'PK\x03\x04', b'\x89PNG', b'\xff\xd8\xff', b'GIF8', b'\x1f\x8b', b'Rar!', b'7z\xbc\xaf')
+
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([a-zA-Z0-9_.:\-]+)', re.I)
+
+
+class NonHtmlContentError(requests.exceptions.RequestException):
+    """Antwort ist kein HTML/XML (z.B. PDF, Bild) - Body wurde nicht gelesen"""
+
+
+class FetchCancelledError(requests.exceptions.RequestException):
+    """Abruf wurde über das cancel-Event abgebrochen (Ergebnis wird nicht gemerkt)"""
+
+
+def media_type(content_type: Optional[str]) -> str:
+    """'text/html; charset=utf-8' → 'text/html'"""
+    return (content_type or '').split(';', 1)[0].strip().lower()
+
+
+def is_text_content_type(content_type: Optional[str]) -> bool:
+    """True wenn der Body einer Antwort mit diesem Content-Type gelesen werden soll"""
+    kind = media_type(content_type)
+    return kind in _TEXT_CONTENT_TYPES or kind in _SNIFF_CONTENT_TYPES or kind.endswith('+xml')
+
+
+def looks_binary(body: bytes) -> bool:
+    """Erkennt binäre Inhalte an Datei-Signatur bzw. NUL-Bytes am Anfang"""
+    head = body[:1024]
+    return head.startswith(_BINARY_SIGNATURES) or b'\x00' in head
+
+
+def read_capped(chunks: Iterable[bytes], max_bytes: int,
+                cancel: Optional[threading.Event] = None) -> Tuple[bytes, bool]:
+    """
+    Liest Chunks bis max_bytes
+
+    Returns:
+        Tuple: (body, truncated) - truncated=True wenn danach abgebrochen wurde
+
+    Raises:
+        FetchCancelledError: cancel wurde während des Lesens gesetzt
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        if cancel is not None and cancel.is_set():
+            raise FetchCancelledError("Abruf abgebrochen")
+        buffer += chunk
+        if len(buffer) > max_bytes:
+            return bytes(buffer[:max_bytes]), True
+    return bytes(buffer), False
+
+
+def decode_body(body: bytes, content_type: Optional[str] = None, encoding: Optional[str] = None,
+                truncated: bool = False) -> Tuple[str, str]:
+    """
+    Dekodiert einen HTML-Body ohne statistische Zeichensatz-Erkennung
+
+    Reihenfolge: UTF-8-BOM → encoding → charset im Content-Type →
+    <meta charset> → UTF-8 → Windows-1252. Der erste Zeichensatz, mit dem der
+    Body fehlerfrei dekodiert, gewinnt. Bei abgeschnittenen Bodies wird ein
+    unvollständiges Zeichen am Ende ignoriert.
+
+    Returns:
+        Tuple: (text, verwendeter Zeichensatz)
+    """
+    candidates = ['utf-8-sig' if body.startswith(codecs.BOM_UTF8) else None, encoding]
+    if content_type and 'charset=' in content_type.lower():
+        candidates.append(content_type.lower().split('charset=', 1)[1].split(';')[0].strip(' "\''))
+    meta = _META_CHARSET.search(body, 0, 4096)
+    if meta:
+        candidates.append(meta.group(1).decode('ascii', 'ignore'))
+    candidates += ['utf-8', 'cp1252']
+
+    fallback = None
+    for name in candidates:
+        if not name:
+            continue
+        try:
+            name = codecs.lookup(name).name
+            decoder = codecs.getincrementaldecoder(name)('strict')
+            return decoder.decode(body, final=not truncated), name
+        except LookupError:
+            continue
+        except UnicodeDecodeError:
+            fallback = fallback or name
+            continue
+
+    # Kein Zeichensatz passt fehlerfrei: der zuerst angegebene mit Ersatzzeichen
+    name = fallback or 'utf-8'
+    return body.decode(name, errors='replace'), name
+
+
+@dataclass
+class FetchedPage:
+    """Ergebnis eines Seitenabrufs (im Seiten-Cache nur, wenn ok)"""
+    url: str
+    final_url: str
+    status_code: int = 0                # 0 = kein HTTP-Status (Verbindungsfehler)
+    text: str = ""
+    content_type: str = ""
+    from_cache: bool = False
+    truncated: bool = False             # Body nach max_bytes abgeschnitten
+    error: Optional[Exception] = None
+    fetched_at: float = field(default_factory=time.monotonic)
+    _documents: Dict[Tuple, HtmlDocument] = field(default_factory=dict, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status_code < 300
+
+    def raise_for_status(self):
+        """Wie requests.Response.raise_for_status (inkl. gemerkter Verbindungsfehler)"""
+        if self.error is not None:
+            raise self.error
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+    def document(self, parser: Optional[str] = None,
+                 footer_selectors: Optional[Sequence[str]] = None) -> HtmlDocument:
+        """
+        Die Seite als HtmlDocument (einmal geparst je Parser/Footer-Selektoren)
+
+        footer_selectors=None: beliebiges bereits geparstes Dokument dieses
+        Parsers (für Aufrufer, die keine Footer-Sichten nutzen)
+        """
+        parser = resolve_html_parser(parser)
+        if footer_selectors is None:
+            for (doc_parser, _), doc in list(self._documents.items()):
+                if doc_parser == parser:
+                    return doc
+            footer_selectors = ('footer',)
+
+        key = (parser, tuple(footer_selectors))
+        doc = self._documents.get(key)
+        if doc is None:
+            doc = HtmlDocument(self.text, url=self.final_url, footer_selectors=footer_selectors, parser=parser,
+                               truncated=self.truncated)
+            doc = self._documents.setdefault(key, doc)
+        return doc
+
+
+class PageCache:
+    """Seiten eines Laufs (LRU + TTL) und die gerade laufenden Downloads"""
+
+    def __init__(self, max_pages: int, ttl: float):
+        self.max_pages = max_pages
+        self.ttl = ttl
+        self.pages: 'OrderedDict[str, FetchedPage]' = OrderedDict()
+        self.inflight: Dict[str, threading.Event] = {}
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[FetchedPage]:
+        """Gemerkte Seite oder None (unter self.lock)"""
+        page = self.pages.get(key)
+        if page is None:
+            return None
+        if time.monotonic() - page.fetched_at > self.ttl:
+            del self.pages[key]
+            return None
+        self.pages.move_to_end(key)
+        return page
+
+    def put(self, key: str, page: FetchedPage):
+        """Seite merken (unter self.lock)"""
+        self.pages[key] = page
+        self.pages.move_to_end(key)
+        while len(self.pages) > self.max_pages:
+            self.pages.popitem(last=False)
+
+
+def bind_run(fn: Callable) -> Callable:
+    """
+    Bindet fn an den aktuellen Lauf (Seiten-Cache) des aufrufenden Threads
+
+    Für executor.submit aus einem Lauf heraus - Worker-Threads übernehmen
+    den Lauf sonst nicht:
+        executor.submit(bind_run(self.scrape), website)
+    """
+    return functools.partial(contextvars.copy_context().run, fn)
+
+
+class PageFetcher:
+    """
+    Lädt Seiten höchstens einmal pro Lauf
+
+    Verwendung:
+        fetcher = get_page_fetcher()
+        with fetcher.run():
+            page = fetcher.fetch(url, timeout=15)
+            if page.ok:
+                doc = page.document(parser, footer_selectors)
+
+    Session, HTTP-Cache und DomainHealth teilen sich alle Läufe, den
+    Seiten-Cache hat jeder Lauf für sich. Außerhalb eines Laufs wird nichts
+    gemerkt.
+    """
+
+    def __init__(self, session: ScraperSession, max_pages: int = 256, ttl: float = 600.0,
+                 max_bytes: int = MAX_PAGE_BYTES):
+        """
+        Args:
+            session: Session für alle Downloads
+            max_pages: Max. Seiten im Seiten-Cache eines Laufs (LRU)
+            ttl: Gültigkeit eines Cache-Eintrags (Sekunden)
+            max_bytes: Max. gelesene Bytes pro Seite (Rest wird verworfen)
+        """
+        self.session = session
+        self.max_pages = max_pages
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = {'hits': 0, 'fetches': 0}
+
+        self._run_cache: contextvars.ContextVar[Optional[PageCache]] = \
+            contextvars.ContextVar(f'page_cache_{id(self)}', default=None)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Cache-Schlüssel: Schema/Host klein, ohne Standard-Port und Fragment, leerer Pfad = /"""
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or '').lower()
+        if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+            host = f"{host}:{parts.port}"
+        return urlunsplit((scheme, host, parts.path or '/', parts.query, ''))
+
+    # ===== LAUF =====
+
+    @contextmanager
+    def run(self) -> Iterator[PageCache]:
+        """
+        Eigener Seiten-Cache für einen Lauf (scrape_multiple, Scrape-Job, ...)
+
+        Verschachtelte Läufe (z.B. scrape() innerhalb von scrape_multiple)
+        nutzen den äußeren. Worker-Threads sehen den Lauf, wenn ihre Aufgabe
+        mit bind_run übergeben wird. Am Ende wird der Cache verworfen.
+        """
+        cache = self._run_cache.get()
+        if cache is not None:
+            yield cache
+            return
+
+        cache = PageCache(self.max_pages, self.ttl)
+        token = self._run_cache.set(cache)
+        try:
+            yield cache
+        finally:
+            self._run_cache.reset(token)
+
+    # ===== ABRUF =====
+
+    def fetch(self, url: str, timeout=15, allow_redirects: bool = True,
+              cancel: Optional[threading.Event] = None) -> FetchedPage:
+        """
+        Lädt eine Seite (oder liefert sie aus dem Seiten-Cache)
+
+        Fehler werfen keine Exception, sondern stehen in page.error bzw.
+        page.status_code - page.raise_for_status() verhält sich wie bei requests.
+
+        cancel: Optional - gesetzt = vor dem Request bzw. zwischen zwei
+        Chunks abbrechen (page.error = FetchCancelledError, z.B. für
+        Pfad-Prüfungen, sobald ein anderer Pfad getroffen hat)
+        """
+        cache = self._run_cache.get()
+        if cache is None:
+            # Außerhalb eines Laufs: nichts merken
+            page = self._download(url, timeout, allow_redirects, cancel)
+            if not isinstance(page.error, FetchCancelledError):
+                self._count('fetches')
+            return page
+
+        key = self.normalize_url(url)
+
+        while True:
+            with cache.lock:
+                page = cache.get(key)
+                if page is None:
+                    waiting = cache.inflight.get(key)
+                    if waiting is None:
+                        done = cache.inflight[key] = threading.Event()
+                        break
+            if page is not None:
+                self._count('hits')
+                return page
+
+            # Ein anderer Thread lädt die Seite gerade
+            waiting.wait()
+
+        try:
+            page = self._download(url, timeout, allow_redirects, cancel)
+            if isinstance(page.error, FetchCancelledError):
+                return page
+            self._count('fetches')
+            if not page.ok:
+                # Fehlerseiten/Verbindungsfehler nicht merken: ein erneuter Versuch lädt neu
+                return page
+            with cache.lock:
+                cache.put(key, page)
+                if page.final_url:
+                    final_key = self.normalize_url(page.final_url)
+                    if final_key != key:
+                        cache.put(final_key, page)
+            return page
+        finally:
+            with cache.lock:
+                cache.inflight.pop(key, None)
+            done.set()
+
+    def document(self, url: str, timeout=15, parser: Optional[str] = None,
+                 footer_selectors: Optional[Sequence[str]] = None) -> Optional[HtmlDocument]:
+        """Lädt eine Seite als HtmlDocument (None bei Fehler / Status != 2xx)"""
+        page = self.fetch(url, timeout=timeout)
+        return page.document(parser, footer_selectors) if page.ok else None
+
+    def _download(self, url: str, timeout, allow_redirects: bool,
+                  cancel: Optional[threading.Event] = None) -> FetchedPage:
+        if cancel is not None and cancel.is_set():
+            return FetchedPage(url=url, final_url=url, error=FetchCancelledError("Abruf abgebrochen"))
+        try:
+            response = self.session.get(url, timeout=timeout, allow_redirects=allow_redirects, stream=True)
+        except requests.exceptions.RequestException as e:
+            return FetchedPage(url=url, final_url=url, error=e)
+
+        with response:
+            page = FetchedPage(
+                url=url,
+                final_url=response.url or url,
+                status_code=response.status_code,
+                content_type=response.headers.get('Content-Type', ''),
+                from_cache=getattr(response, 'from_cache', False),
+            )
+            if response.status_code >= 400:
+                return page
+
+            # Content-Type prüfen, bevor der Body gelesen wird
+            if not is_text_content_type(page.content_type):
+                page.error = NonHtmlContentError(f"Kein HTML ({media_type(page.content_type)}): {url}")
+                return page
+
+            try:
+                body, page.truncated = read_capped(response.iter_content(CHUNK_SIZE), self.max_bytes, cancel)
+            except requests.exceptions.RequestException as e:
+                page.error = e
+                return page
+
+            if looks_binary(body):
+                page.error = NonHtmlContentError(f"Binärer Inhalt: {url}")
+                return page
+            if page.truncated:
+                logger.warning(f"✂️ Seite nach {self.max_bytes // 1024} KB abgeschnitten: {url}")
+
+            # Aus dem Cache: gespeicherter Zeichensatz, sonst Header/Meta/UTF-8
+            page.text, encoding = decode_body(body, page.content_type,
+                                              response.encoding if page.from_cache else None, page.truncated)
+
+            # Gestreamte Antworten speichert die Session nicht selbst
+            if response.status_code == 200 and not page.from_cache and not page.truncated:
+                self.session.store_response(url, response, body=body, encoding=encoding)
+            return page
+
+    # ===== CACHE =====
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def forget_host(self, url: str):
+        """Verwirft die im aktuellen Lauf gemerkten Seiten eines Hosts (z.B. vor einem erneuten Versuch)"""
+        cache = self._run_cache.get()
+        if cache is None:
+            return
+        host = urlsplit(self.normalize_url(url)).netloc
+        with cache.lock:
+            for key in [key for key in cache.pages if urlsplit(key).netloc == host]:
+                del cache.pages[key]
+
+    @property
+    def hit_rate(self) -> float:
+        """Anteil der Abrufe, die aus dem Seiten-Cache bedient wurden (0.0 - 1.0)"""
+        with self._lock:
+            total = self.stats['hits'] + self.stats['fetches']
+            return self.stats['hits'] / total if total else 0.0
+
+
+# ===== GEMEINSAMER FETCHER =====
+
+_shared_fetchers: Dict[Tuple[str, str], PageFetcher] = {}
+_shared_fetchers_lock = threading.Lock()
+
+
+def get_page_fetcher(http_cache_path: str = "http_cache.db", health_path: str = "domain_health.db",
+                     pool_size: int = 10) -> PageFetcher:
+    """
+    Gibt den prozessweit gemeinsamen Fetcher für (http_cache_path, health_path) zurück
+
+    Scraper mit denselben Cache-Pfaden teilen sich Session, Verbindungen und
+    DomainHealth (Seiten-Cache: pro Lauf, siehe PageFetcher.run). Der
+    Verbindungs-Pool wächst auf den größten angeforderten Wert.
+    """
+    key = (http_cache_path, health_path)
+    with _shared_fetchers_lock:
+        fetcher = _shared_fetchers.get(key)
+        if fetcher is None:
+            session = ScraperSession(
+                response_cache=ResponseCache(http_cache_path),
+                headers=DEFAULT_HEADERS,
+                pool_size=pool_size,
+                scheduler=get_host_scheduler(),
+                health=get_domain_health(health_path)
+            )
+            fetcher = PageFetcher(session)
+            _shared_fetchers[key] = fetcher
+        else:
+            fetcher.session.ensure_pool_size(pool_size)
+        return fetcher
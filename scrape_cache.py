@@ -0,0 +1,470 @@
+"""
+Scrape Cache - Persistente SQLite-Caches für Scraping-Ergebnisse
+Ersetzt die frühere impressum_cache_v2.json
+
+Features:
+- O(1) Upsert pro Eintrag statt Neuschreiben der ganzen Datei
+- WAL-Modus: GUI, Streamlit und CLI können dieselbe Datei parallel nutzen
+- TTL für Treffer, separate (kürzere) TTL für Negativ-Einträge ("" = nicht gefunden)
+- Größenbegrenzung: älteste Einträge werden verdrängt
+- Thread-sicher (eine Verbindung pro Thread)
+
+Klassen:
+- ScrapeCache: Key-Value-Cache (z.B. Impressum-URLs)
+- ResponseCache: HTTP-Antworten (komprimiert) mit ETag/Last-Modified
+- LLMResponseCache: LLM-Antworten, Schlüssel = Hash des kompletten Requests
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Marker für "nicht vorhanden" (None ist ein gültiger gespeicherter Wert)
+_MISSING = object()
+
+
+class SQLiteStore:
+    """
+    Basis für SQLite-Caches: Verbindung pro Thread, WAL, Verdrängung
+
+    Unterklassen definieren das Schema in _create_table(); Pflichtspalten
+    für die Verdrängung sind expires_at und updated_at.
+    """
+
+    def __init__(self, db_path: str, table: str, max_entries: int):
+        if not table.isidentifier():
+            raise ValueError(f"Ungültiger Tabellenname: {table}")
+
+        self.db_path = db_path
+        self.table = table
+        self.max_entries = max_entries
+
+        # Verdrängung nur alle N Schreibzugriffe prüfen (amortisiert O(1))
+        self._evict_every = max(1, min(1000, max_entries // 10 or 1))
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+        self._local = threading.local()
+        self._init_db()
+
+    # ===== VERBINDUNG =====
+
+    def _connect(self) -> sqlite3.Connection:
+        """Gibt die Verbindung des aktuellen Threads zurück"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        """Erstellt Tabelle und Index"""
+        conn = self._connect()
+        self._create_table(conn)
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table}_updated ON {self.table}(updated_at)")
+
+    def _create_table(self, conn: sqlite3.Connection):
+        raise NotImplementedError
+
+    def close(self):
+        """Schließt die Verbindung des aktuellen Threads"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def delete(self, key: str):
+        """Entfernt einen Eintrag"""
+        self._connect().execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def clear(self):
+        """Leert den Cache"""
+        self._connect().execute(f"DELETE FROM {self.table}")
+
+    def __len__(self) -> int:
+        return self._connect().execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    # ===== WARTUNG =====
+
+    def _after_write(self):
+        """Zählt Schreibzugriffe und löst periodisch die Verdrängung aus"""
+        with self._writes_lock:
+            self._writes += 1
+            evict = self._writes % self._evict_every == 0
+        if evict:
+            self.evict()
+
+    def evict(self):
+        """Entfernt abgelaufene Einträge und verdrängt die ältesten über max_entries"""
+        try:
+            conn = self._connect()
+            conn.execute(f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),))
+
+            count = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+            surplus = count - self.max_entries
+            if surplus > 0:
+                conn.execute(
+                    f"DELETE FROM {self.table} WHERE key IN "
+                    f"(SELECT key FROM {self.table} ORDER BY updated_at ASC LIMIT ?)",
+                    (surplus,)
+                )
+                logger.info(f"🧹 Cache: {surplus} alte Einträge verdrängt")
+        except sqlite3.Error as e:
+            logger.warning(f"Cache-Bereinigung fehlgeschlagen: {e}")
+
+
+class ScrapeCache(SQLiteStore):
+    """
+    Key-Value-Cache auf SQLite-Basis
+
+    Verwendung:
+        cache = ScrapeCache("impressum_cache.db", table="impressum")
+        cache.set("impressum:https://example.com", "https://example.com/impressum")
+        url = cache.get("impressum:https://example.com")
+    """
+
+    def __init__(self, db_path: str = "impressum_cache.db", table: str = "impressum",
+                 ttl: float = 30 * 24 * 3600, negative_ttl: float = 24 * 3600,
+                 max_entries: int = 100000):
+        """
+        Args:
+            db_path: Pfad zur SQLite-Datei
+            table: Tabellenname (mehrere Caches können eine Datei teilen)
+            ttl: Lebensdauer von Treffern in Sekunden (None = unbegrenzt)
+            negative_ttl: Lebensdauer von Negativ-Einträgen ("", None) in Sekunden
+            max_entries: Max. Anzahl Einträge, danach werden die ältesten verdrängt
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        super().__init__(db_path, table, max_entries)
+
+    def _create_table(self, conn: sqlite3.Connection):
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "  key TEXT PRIMARY KEY,"
+            "  value TEXT,"
+            "  negative INTEGER NOT NULL DEFAULT 0,"
+            "  expires_at REAL,"
+            "  updated_at REAL NOT NULL"
+            ")"
+        )
+
+    # ===== LESEN / SCHREIBEN =====
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Gibt gecachten Wert zurück (default falls nicht vorhanden oder abgelaufen)"""
+        try:
+            row = self._connect().execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache lesen fehlgeschlagen: {e}")
+            return default
+
+        if row is None:
+            return default
+
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return default
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = _MISSING):
+        """
+        Speichert Wert (Upsert)
+
+        Args:
+            key: Schlüssel
+            value: JSON-serialisierbarer Wert ("" / None = Negativ-Eintrag)
+            ttl: Optional - eigene Lebensdauer in Sekunden (None = unbegrenzt)
+        """
+        negative = value is None or value == ""
+        if ttl is _MISSING:
+            ttl = self.negative_ttl if negative else self.ttl
+
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+
+        try:
+            self._connect().execute(
+                f"INSERT INTO {self.table} (key, value, negative, expires_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, negative = excluded.negative, "
+                "expires_at = excluded.expires_at, updated_at = excluded.updated_at",
+                (key, json.dumps(value, ensure_ascii=False), int(negative), expires_at, now)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Cache speichern fehlgeschlagen: {e}")
+            return
+
+        self._after_write()
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def import_json(self, json_file: str) -> int:
+        """
+        Übernimmt Einträge aus einer alten JSON-Cache-Datei
+
+        Returns:
+            Anzahl übernommener Einträge
+        """
+        if not os.path.exists(json_file):
+            return 0
+
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"Alter Cache konnte nicht gelesen werden: {e}")
+            return 0
+
+        conn = self._connect()
+        now = time.time()
+        rows = []
+        for key, value in data.items():
+            negative = value is None or value == ""
+            ttl = self.negative_ttl if negative else self.ttl
+            rows.append((key, json.dumps(value, ensure_ascii=False), int(negative),
+                         now + ttl if ttl is not None else None, now))
+
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {self.table} (key, value, negative, expires_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            conn.execute("ROLLBACK")
+            logger.warning(f"Alter Cache konnte nicht übernommen werden: {e}")
+            return 0
+
+        logger.info(f"📦 {len(rows)} Einträge aus {json_file} übernommen")
+        return len(rows)
+
+
+@dataclass
+class CachedResponse:
+    """Gecachte HTTP-Antwort"""
+    url: str
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_type: Optional[str] = None
+    encoding: Optional[str] = None
+
+
+class ResponseCache(SQLiteStore):
+    """
+    Cache für HTTP-Antworten (Body zlib-komprimiert)
+
+    Gespeichert werden nur Antworten mit ETag oder Last-Modified, damit
+    sie beim nächsten Abruf per If-None-Match / If-Modified-Since
+    revalidiert werden können (304 statt kompletter Download).
+    """
+
+    def __init__(self, db_path: str = "http_cache.db", table: str = "responses",
+                 max_age: float = 90 * 24 * 3600, max_entries: int = 20000):
+        """
+        Args:
+            db_path: Pfad zur SQLite-Datei
+            table: Tabellenname
+            max_age: Einträge ohne Abruf werden nach max_age Sekunden entfernt
+            max_entries: Max. Anzahl Einträge, danach werden die ältesten verdrängt
+        """
+        self.max_age = max_age
+        super().__init__(db_path, table, max_entries)
+
+    def _create_table(self, conn: sqlite3.Connection):
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "  key TEXT PRIMARY KEY,"
+            "  etag TEXT,"
+            "  last_modified TEXT,"
+            "  content_type TEXT,"
+            "  encoding TEXT,"
+            "  body BLOB,"
+            "  expires_at REAL,"
+            "  updated_at REAL NOT NULL"
+            ")"
+        )
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Gibt gecachte Antwort zurück (None falls nicht vorhanden)"""
+        try:
+            row = self._connect().execute(
+                f"SELECT etag, last_modified, content_type, encoding, body, expires_at "
+                f"FROM {self.table} WHERE key = ?", (url,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP-Cache lesen fehlgeschlagen: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        etag, last_modified, content_type, encoding, body, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+
+        try:
+            body = zlib.decompress(body)
+        except zlib.error:
+            return None
+
+        return CachedResponse(url, body, etag, last_modified, content_type, encoding)
+
+    def store(self, url: str, body: bytes, etag: str = None, last_modified: str = None,
+              content_type: str = None, encoding: str = None):
+        """Speichert Antwort komprimiert (Upsert)"""
+        now = time.time()
+        try:
+            self._connect().execute(
+                f"INSERT INTO {self.table} "
+                "(key, etag, last_modified, content_type, encoding, body, expires_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET etag = excluded.etag, last_modified = excluded.last_modified, "
+                "content_type = excluded.content_type, encoding = excluded.encoding, body = excluded.body, "
+                "expires_at = excluded.expires_at, updated_at = excluded.updated_at",
+                (url, etag, last_modified, content_type, encoding,
+                 sqlite3.Binary(zlib.compress(body, 6)), now + self.max_age, now)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"HTTP-Cache speichern fehlgeschlagen: {e}")
+            return
+
+        self._after_write()
+
+    def touch(self, url: str):
+        """Verlängert einen Eintrag nach erfolgreicher Revalidierung (304)"""
+        now = time.time()
+        try:
+            self._connect().execute(
+                f"UPDATE {self.table} SET expires_at = ?, updated_at = ? WHERE key = ?",
+                (now + self.max_age, now, url)
+            )
+        except sqlite3.Error as e:
+            logger.debug(f"HTTP-Cache aktualisieren fehlgeschlagen: {e}")
+
+
+class LLMResponseCache(SQLiteStore):
+    """
+    Content-addressed Cache für LLM-Antworten
+
+    Schlüssel ist der Hash aus Modell, System-Prompt, User-Prompt (nach
+    Platzhalter-Ersetzung), temperature und max_tokens: byte-gleiche
+    Requests (Duplikate, erneute KI-Spalte, unveränderter Prompt) kosten
+    keinen API-Aufruf. Treffer frischen updated_at auf, verdrängt werden
+    also die am längsten nicht genutzten Einträge.
+
+    Verwendung:
+        key = cache.make_key(model, system_prompt, user_prompt, 0.7, 500)
+        cached = cache.get(key)                  # (text, tokens) oder None
+        cache.store(key, text, tokens, model)
+    """
+
+    def __init__(self, db_path: str = "llm_cache.db", table: str = "llm_responses",
+                 ttl: Optional[float] = 30 * 24 * 3600, max_entries: int = 50000):
+        """
+        Args:
+            db_path: Pfad zur SQLite-Datei
+            table: Tabellenname
+            ttl: Lebensdauer eines Eintrags in Sekunden (None = unbegrenzt)
+            max_entries: Max. Anzahl Einträge, danach werden die ältesten verdrängt
+        """
+        self.ttl = ttl
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'tokens_saved': 0}
+        self._stats_lock = threading.Lock()
+        super().__init__(db_path, table, max_entries)
+
+    def _create_table(self, conn: sqlite3.Connection):
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "  key TEXT PRIMARY KEY,"
+            "  text TEXT NOT NULL,"
+            "  tokens INTEGER NOT NULL DEFAULT 0,"
+            "  model TEXT,"
+            "  expires_at REAL,"
+            "  updated_at REAL NOT NULL"
+            ")"
+        )
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str,
+                 temperature: float, max_tokens: int) -> str:
+        """SHA-256 über alle Parameter, die die Antwort bestimmen"""
+        payload = json.dumps([model, system_prompt, user_prompt, float(temperature), int(max_tokens)],
+                             ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @property
+    def hit_rate(self) -> float:
+        """Anteil der Anfragen, die aus dem Cache beantwortet wurden (0.0 - 1.0)"""
+        with self._stats_lock:
+            total = self.stats['hits'] + self.stats['misses']
+            return self.stats['hits'] / total if total else 0.0
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def get(self, key: str) -> Optional[Tuple[str, int]]:
+        """Gibt (text, tokens) zurück (None falls nicht vorhanden oder abgelaufen)"""
+        entry = self.get_first([key])
+        return entry[:2] if entry is not None else None
+
+    def get_first(self, keys: Sequence[str]) -> Optional[Tuple[str, int, Optional[str]]]:
+        """Erster gültiger Eintrag unter keys als (text, tokens, model) - zählt als eine Anfrage"""
+        now = time.time()
+        row = None
+        try:
+            conn = self._connect()
+            for key in keys:
+                row = conn.execute(
+                    f"SELECT text, tokens, expires_at, model FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and (row[2] is None or row[2] >= now):
+                    conn.execute(f"UPDATE {self.table} SET updated_at = ? WHERE key = ?", (now, key))
+                    break
+        except sqlite3.Error as e:
+            logger.warning(f"LLM-Cache lesen fehlgeschlagen: {e}")
+            return None
+
+        if row is None or (row[2] is not None and row[2] < now):
+            self._count('misses')
+            return None
+
+        self._count('hits')
+        self._count('tokens_saved', row[1])
+        return row[0], row[1], row[3]
+
+    def store(self, key: str, text: str, tokens: int = 0, model: str = None):
+        """Speichert eine Antwort (Upsert)"""
+        now = time.time()
+        try:
+            self._connect().execute(
+                f"INSERT INTO {self.table} (key, text, tokens, model, expires_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET text = excluded.text, tokens = excluded.tokens, "
+                "model = excluded.model, expires_at = excluded.expires_at, updated_at = excluded.updated_at",
+                (key, text, int(tokens or 0), model, now + self.ttl if self.ttl is not None else None, now)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"LLM-Cache speichern fehlgeschlagen: {e}")
+            return
+
+        self._count('stored')
+        self._after_write()
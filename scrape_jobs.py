@@ -0,0 +1,358 @@
+"""
+Scrape Jobs - Fortsetzbares Bulk-Scraping mit Checkpoints
+
+Bisher lag der Fortschritt eines Bulk-Scrapings nur im Speicher: Absturz
+oder Schließen der GUI = alles von vorn. Hier wird jeder Lead als
+ScrapeJobItem in der Datenbank geführt (pending / in_flight / done / failed
++ Anzahl Versuche) und nach jedem Block committed.
+
+Features:
+- Fortsetzen: erledigte Leads werden übersprungen, abgebrochene
+  (in_flight) erneut eingeplant
+- Nur Fehlgeschlagene erneut versuchen (bis max_attempts)
+- Headless ohne GUI (CLI, siehe unten)
+
+Aufruf:
+    python scrape_jobs.py new [--limit 500]     # Job für alle Leads ohne Kontaktdaten
+    python scrape_jobs.py resume [JOB_ID]       # letzten/angegebenen Job fortsetzen
+    python scrape_jobs.py retry JOB_ID          # nur fehlgeschlagene Leads erneut
+    python scrape_jobs.py list
+"""
+import argparse
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import func, or_
+
+from models_v3 import Base, DatabaseV3, CompanyV3, ScrapeJob, ScrapeJobItem, utc_now
+from impressum_scraper_ultimate import ImpressumScraperUltimate, ContactResult
+
+logger = logging.getLogger(__name__)
+
+# Job-Status
+JOB_PENDING = 'pending'
+JOB_RUNNING = 'running'
+JOB_PAUSED = 'paused'
+JOB_DONE = 'done'
+JOB_CANCELLED = 'cancelled'
+
+# Lead-Status
+ITEM_PENDING = 'pending'
+ITEM_IN_FLIGHT = 'in_flight'
+ITEM_DONE = 'done'
+ITEM_FAILED = 'failed'
+
+
+class ScrapeJobRunner:
+    """
+    Führt Kontaktdaten-Jobs aus und hält den Fortschritt in der Datenbank
+
+    Verwendung:
+        runner = ScrapeJobRunner(db, scraper)
+        job = runner.create_job(companies)
+        runner.run(job.id, progress_callback=...)
+        # später / nach Absturz:
+        runner.run(job.id)                       # macht nur offene Leads
+        runner.run(job.id, retry_failed=True)    # + fehlgeschlagene erneut
+    """
+
+    def __init__(self, db: DatabaseV3, scraper: Optional[ImpressumScraperUltimate] = None,
+                 batch_size: Optional[int] = None, max_attempts: int = 3):
+        """
+        Args:
+            db: Datenbank (der Runner nutzt eine eigene Session)
+            scraper: Impressum-Scraper (Standard: neuer ImpressumScraperUltimate)
+            batch_size: Leads pro Block/Checkpoint (Standard: 2x Worker des Scrapers)
+            max_attempts: Max. Versuche pro Lead bei retry_failed
+        """
+        self.db = db
+        self.scraper = scraper or ImpressumScraperUltimate()
+        self.batch_size = batch_size or max(1, self.scraper.max_workers * 2)
+        self.max_attempts = max(1, max_attempts)
+
+        # Job-Tabellen auch in bestehenden Datenbanken anlegen
+        Base.metadata.create_all(db.engine, tables=[ScrapeJob.__table__, ScrapeJobItem.__table__])
+        self.session = db.get_session()
+
+    def close(self):
+        self.session.close()
+
+    # ===== JOBS ANLEGEN / ABFRAGEN =====
+
+    @staticmethod
+    def needs_contact_data(company: CompanyV3) -> bool:
+        """True wenn Name oder E-Mail fehlen und eine Website vorhanden ist"""
+        return bool(company.website) and not (company.first_name and company.last_name and company.email)
+
+    def create_job(self, companies: Iterable[CompanyV3], kind: str = 'contact') -> ScrapeJob:
+        """
+        Legt einen Job für alle Leads an, denen Kontaktdaten fehlen
+
+        Vollständige Leads und Leads ohne Website werden nicht aufgenommen.
+        """
+        job = ScrapeJob(kind=kind, status=JOB_PENDING)
+        seen = set()
+        for company in companies:
+            if company.id in seen or not self.needs_contact_data(company):
+                continue
+            seen.add(company.id)
+            job.items.append(ScrapeJobItem(company_id=company.id, website=company.website,
+                                           status=ITEM_PENDING, attempts=0))
+
+        self.session.add(job)
+        self.session.commit()
+        logger.info(f"📋 Scrape-Job #{job.id} angelegt: {len(job.items)} Leads")
+        return job
+
+    def create_job_for_ids(self, company_ids: Iterable[int], kind: str = 'contact') -> ScrapeJob:
+        """Wie create_job, Leads per ID (lädt sie in der Runner-Session)"""
+        ids = list(company_ids)
+        companies = self.session.query(CompanyV3).filter(CompanyV3.id.in_(ids)).all() if ids else []
+        return self.create_job(companies, kind)
+
+    def get_job(self, job_id: int) -> Optional[ScrapeJob]:
+        return self.session.get(ScrapeJob, job_id)
+
+    def unfinished_jobs(self, kind: Optional[str] = None) -> List[ScrapeJob]:
+        """Jobs mit offenen Leads (neueste zuerst), optional nur einer Art (kind)"""
+        query = self.session.query(ScrapeJob).filter(ScrapeJob.status.in_([JOB_PENDING, JOB_RUNNING, JOB_PAUSED]))
+        if kind is not None:
+            query = query.filter(ScrapeJob.kind == kind)
+        return query.order_by(ScrapeJob.id.desc()).all()
+
+    def discard(self, job_id: int):
+        """Verwirft einen offenen Job (wird nicht mehr zum Fortsetzen angeboten)"""
+        job = self.get_job(job_id)
+        if job is not None and job.status != JOB_DONE:
+            job.status = JOB_CANCELLED
+            job.finished_at = utc_now()
+            self.session.commit()
+
+    def progress(self, job_id: int) -> Dict[str, int]:
+        """Anzahl Leads pro Status: {'pending': .., 'in_flight': .., 'done': .., 'failed': .., 'total': ..}"""
+        counts = {ITEM_PENDING: 0, ITEM_IN_FLIGHT: 0, ITEM_DONE: 0, ITEM_FAILED: 0}
+        rows = (self.session.query(ScrapeJobItem.status, func.count(ScrapeJobItem.id))
+                .filter(ScrapeJobItem.job_id == job_id)
+                .group_by(ScrapeJobItem.status)
+                .all())
+        counts.update(dict(rows))
+        counts['total'] = sum(count for _, count in rows)
+        return counts
+
+    def retryable_count(self, job_id: int) -> int:
+        """Fehlgeschlagene Leads, die retry_failed noch einmal versucht (unter max_attempts)"""
+        return (self.session.query(func.count(ScrapeJobItem.id))
+                .filter(ScrapeJobItem.job_id == job_id,
+                        ScrapeJobItem.status == ITEM_FAILED,
+                        ScrapeJobItem.attempts < self.max_attempts)
+                .scalar())
+
+    # ===== AUSFÜHREN =====
+
+    def run(self, job_id: int, progress_callback: Optional[Callable] = None,
+            should_stop: Optional[Callable[[], bool]] = None,
+            retry_failed: bool = False) -> Dict[str, int]:
+        """
+        Führt alle offenen Leads eines Jobs aus (fortsetzbar)
+
+        Args:
+            job_id: ID des Jobs
+            progress_callback: Optional - Funktion(current, total, item, outcome),
+                outcome = 'success' (neue Daten), 'empty' (nichts gefunden) oder 'failed'
+            should_stop: Optional - wird vor jedem Block geprüft; True = Job pausieren
+            retry_failed: Fehlgeschlagene Leads (unter max_attempts) erneut versuchen
+
+        Returns:
+            progress(job_id) nach dem Lauf + 'names_found'/'emails_found' dieses Laufs
+        """
+        job = self.get_job(job_id)
+        if job is None:
+            raise ValueError(f"Scrape-Job #{job_id} existiert nicht")
+
+        # Eigener Seiten-Cache für den ganzen Job: erneute Versuche laden die Seiten neu
+        with self.scraper.fetcher.run():
+            return self._run(job, progress_callback, should_stop, retry_failed)
+
+    def _run(self, job: ScrapeJob, progress_callback: Optional[Callable],
+             should_stop: Optional[Callable[[], bool]], retry_failed: bool) -> Dict[str, int]:
+        """Führt die offenen Leads von job aus (siehe run)"""
+        self._requeue(job, retry_failed)
+
+        open_items = (self.session.query(ScrapeJobItem)
+                      .filter(ScrapeJobItem.job_id == job.id, ScrapeJobItem.status == ITEM_PENDING)
+                      .order_by(ScrapeJobItem.id)
+                      .all())
+        total = len(open_items)
+        logger.info(f"▶️ Scrape-Job #{job.id}: {total} offene Leads")
+
+        job.status = JOB_RUNNING
+        self.session.commit()
+
+        current = 0
+        found = {'names_found': 0, 'emails_found': 0}
+        for start in range(0, total, self.batch_size):
+            if should_stop and should_stop():
+                job.status = JOB_PAUSED
+                self.session.commit()
+                logger.info(f"⏸️ Scrape-Job #{job.id} pausiert ({total - current} Leads offen)")
+                return {**self.progress(job.id), **found}
+
+            batch = open_items[start:start + self.batch_size]
+            for item, outcome in self._run_batch(batch, found):
+                current += 1
+                if progress_callback:
+                    progress_callback(current, total, item, outcome)
+
+        counts = self.progress(job.id)
+        if not counts[ITEM_PENDING] and not counts[ITEM_IN_FLIGHT]:
+            job.status = JOB_DONE
+            job.finished_at = utc_now()
+        self.session.commit()
+
+        logger.info(f"✅ Scrape-Job #{job.id}: {counts[ITEM_DONE]} erledigt, {counts[ITEM_FAILED]} fehlgeschlagen")
+        return {**counts, **found}
+
+    def _requeue(self, job: ScrapeJob, retry_failed: bool):
+        """Abgebrochene (und ggf. fehlgeschlagene) Leads wieder einplanen"""
+        statuses = [ITEM_IN_FLIGHT]
+        if retry_failed:
+            statuses.append(ITEM_FAILED)
+            retryable = (self.session.query(ScrapeJobItem.website)
+                         .filter(ScrapeJobItem.job_id == job.id,
+                                 ScrapeJobItem.status == ITEM_FAILED,
+                                 ScrapeJobItem.attempts < self.max_attempts))
+            for (website,) in retryable:
+                self.scraper.forget_failure(website)
+
+        requeued = (self.session.query(ScrapeJobItem)
+                    .filter(ScrapeJobItem.job_id == job.id,
+                            ScrapeJobItem.status.in_(statuses),
+                            or_(ScrapeJobItem.status == ITEM_IN_FLIGHT,
+                                ScrapeJobItem.attempts < self.max_attempts))
+                    .update({ScrapeJobItem.status: ITEM_PENDING}, synchronize_session=False))
+        self.session.commit()
+        if requeued:
+            logger.info(f"🔁 Scrape-Job #{job.id}: {requeued} Leads erneut eingeplant")
+
+    def _run_batch(self, items: List[ScrapeJobItem], found: Dict[str, int]):
+        """Scraped einen Block parallel und speichert das Ergebnis pro Lead (Checkpoint)"""
+        for item in items:
+            item.status = ITEM_IN_FLIGHT
+            item.attempts = (item.attempts or 0) + 1
+            item.started_at = utc_now()
+        self.session.commit()
+
+        try:
+            results = self.scraper.scrape_multiple([item.website for item in items])
+            error = None
+        except Exception as e:
+            logger.error(f"❌ Block fehlgeschlagen: {e}")
+            results, error = [None] * len(items), str(e)
+
+        outcomes = []
+        for item, result in zip(items, results):
+            outcomes.append((item, self._apply_result(item, result, found, error)))
+        self.session.commit()
+        return outcomes
+
+    def _apply_result(self, item: ScrapeJobItem, result: Optional[ContactResult],
+                      found: Dict[str, int], error: Optional[str] = None) -> str:
+        """Übernimmt fehlende Kontaktdaten in den Lead und setzt den Lead-Status"""
+        item.finished_at = utc_now()
+
+        if result is None or not result.impressum_url:
+            # Kein Impressum erreichbar (Netzwerk, tote Domain, ...) - erneut versuchbar
+            item.status = ITEM_FAILED
+            item.last_error = error or "Kein Impressum gefunden"
+            item.result = result.to_dict() if result else None
+            return 'failed'
+
+        company = item.company
+        found_something = False
+
+        if result.found_name and not (company.first_name and company.last_name):
+            company.first_name = result.first_name
+            company.last_name = result.last_name
+            found['names_found'] += 1
+            found_something = True
+
+        if result.found_email and not company.email:
+            company.email = result.email
+            found['emails_found'] += 1
+            found_something = True
+
+        item.status = ITEM_DONE
+        item.last_error = None
+        item.result = result.to_dict()
+        return 'success' if found_something else 'empty'
+
+
+# ===== CLI =====
+
+def main():
+    parser = argparse.ArgumentParser(description='Fortsetzbares Bulk-Scraping von Kontaktdaten (headless)')
+    parser.add_argument('--db', default='lead_enrichment_v3.db', help='Pfad zur Lead-Datenbank')
+    parser.add_argument('--workers', type=int, default=8, help='Parallele Worker im Impressum-Scraper')
+    parser.add_argument('--processes', type=int, default=0,
+                        help='Prozesse für Parsen/Extraktion (0 = in den Worker-Threads)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    new = sub.add_parser('new', help='Job für alle Leads ohne Kontaktdaten anlegen und starten')
+    new.add_argument('--limit', type=int, default=None, help='Max. Leads im Job')
+
+    resume = sub.add_parser('resume', help='Job fortsetzen (Standard: neuester offener Job)')
+    resume.add_argument('job_id', type=int, nargs='?')
+
+    retry = sub.add_parser('retry', help='Nur fehlgeschlagene Leads erneut versuchen')
+    retry.add_argument('job_id', type=int)
+
+    sub.add_parser('list', help='Offene Jobs anzeigen')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    db = DatabaseV3(args.db)
+    scraper = ImpressumScraperUltimate(max_workers=args.workers)
+    scraper.extraction_processes = max(0, args.processes)
+    runner = ScrapeJobRunner(db, scraper)
+
+    def print_progress(current, total, item, outcome):
+        print(f"[{current}/{total}] {item.website}: {outcome}")
+
+    try:
+        if args.command == 'list':
+            for job in runner.unfinished_jobs():
+                print(f"#{job.id} {job.kind} {job.status} {job.created_at:%Y-%m-%d %H:%M} {runner.progress(job.id)}")
+            return 0
+
+        if args.command == 'new':
+            query = runner.session.query(CompanyV3).filter(
+                CompanyV3.website.isnot(None),
+                or_(CompanyV3.first_name.is_(None), CompanyV3.last_name.is_(None), CompanyV3.email.is_(None))
+            ).order_by(CompanyV3.id)
+            if args.limit:
+                query = query.limit(args.limit)
+            job_id = runner.create_job(query.all()).id
+        elif args.command == 'resume' and args.job_id is None:
+            jobs = runner.unfinished_jobs()
+            if not jobs:
+                print("Keine offenen Jobs")
+                return 0
+            job_id = jobs[0].id
+        else:
+            job_id = args.job_id
+
+        counts = runner.run(job_id, progress_callback=print_progress, retry_failed=args.command == 'retry')
+        print(f"Job #{job_id}: {counts}")
+        return 0
+    except KeyboardInterrupt:
+        # in_flight-Leads werden beim nächsten "resume" erneut eingeplant
+        print("\nAbgebrochen - fortsetzen mit: python scrape_jobs.py resume")
+        return 1
+    finally:
+        scraper.shutdown_extraction_pool()
+        runner.close()
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())